@@ -0,0 +1,416 @@
+import random
+import numpy as np
+from player import Position, Personality
+from match import Match, ATTRIBUTES, ATTR, STATS, read_match_attributes
+from development import develop_matchweek
+
+# Fixed orderings used to index the lineup arrays
+POSITIONS = list(Position)
+PERSONALITIES = list(Personality)
+ACTIONS = ["shoot", "pass", "dribble", "long_ball"]
+SHOOT, PASS, DRIBBLE, LONG_BALL = range(len(ACTIONS))
+
+STAT = {stat: i for i, stat in enumerate(STATS)}
+
+# Rule tables indexed by position/personality code, built from Match's tables
+DISTANCES = np.array([Match.position_distances[p] for p in POSITIONS])
+ACTION_BASE = np.array([[Match.action_probabilities[p][a] for a in ACTIONS] for p in POSITIONS])
+PERSONALITY_MODIFIERS = np.array([[Match.personality_action_modifiers[p].get(a, 1.0) for a in ACTIONS]
+                                  for p in PERSONALITIES])
+PASS_PREFERENCES = np.array([[Match.pass_preferences[p][r] for r in POSITIONS] for p in POSITIONS])
+HIGH_PRESSURE_MODIFIERS = np.array([0.7, 1.5, 0.6, 1.3])
+
+LINEUP_SIZE = 11
+
+
+def _position_mask(codes, positions):
+    """Returns a boolean mask of lineup slots holding one of the given positions"""
+    return np.isin(codes, [POSITIONS.index(p) for p in positions])
+
+
+def _pick_uniform(mask, u):
+    """Picks a uniformly random True slot per row of mask using uniforms u"""
+    counts = mask.sum(axis=1)
+    k = np.minimum((u * counts).astype(np.int64), counts - 1)
+    return np.argmax(np.cumsum(mask, axis=1) > k[:, None], axis=1)
+
+
+def _pick_weighted(weights, u):
+    """Picks a slot per row of weights with probability proportional to its weight"""
+    cumulative = np.cumsum(weights, axis=1)
+    target = u * cumulative[:, -1]
+    return np.argmax(cumulative > target[:, None], axis=1)
+
+
+class BatchMatch:
+    """
+    Simulates many matches in lock-step, one minute at a time, using NumPy arrays. Each
+    minute costs a fixed overhead whatever the batch size, so this beats simulating the
+    matches one by one only from a few dozen distinct fixtures at once (see
+    bench/match_throughput.py); the predictor's sample blocks are the typical use.
+    """
+
+    def __init__(self, fixtures, action_frequency=1, seed=None, lineups=None, rng=None):
+        self.fixtures = list(fixtures)
+        self.action_frequency = action_frequency
+        self.rng = np.random.default_rng(seed)
+        self.size = len(self.fixtures)
+
+        # Python random stream for lineup selection and player development
+        self.player_rng = rng or random
+
+        # Starting elevens for each fixture (home, away)
+        if lineups is None:
+            lineups = [(home.get_starting_eleven(rng=self.player_rng), away.get_starting_eleven(rng=self.player_rng))
+                       for home, away in self.fixtures]
+        self.lineups = [(list(home), list(away)) for home, away in lineups]
+
+        self._build_lineup_arrays()
+        self._build_rule_tables()
+        self._expand_blocks()
+        self.reset()
+
+    def reset(self, seed=None):
+        """Clears the match state for a fresh simulation, reseeding the engine's stream if given"""
+        if seed is not None:
+            self.rng = np.random.default_rng(seed)
+
+        self.scores = np.zeros((self.size, 2), dtype=np.int64)
+        self.possession = np.zeros(self.size, dtype=np.int64)
+        self.carrier = np.zeros(self.size, dtype=np.int64)
+        self.open = np.zeros((self.size, 2, LINEUP_SIZE))
+        self.on_run = np.zeros((self.size, 2, LINEUP_SIZE))
+        self.ratings = np.full((self.size, 2, LINEUP_SIZE), 6.0)
+        self.stats = np.zeros((self.size, 2, LINEUP_SIZE, len(STATS)), dtype=np.int64)
+
+        # Most recent successful passer and the one before it, for assists
+        self.last_passer = np.full((self.size, 2), -1, dtype=np.int64)
+        self.previous_passer = np.full((self.size, 2), -1, dtype=np.int64)
+
+        self.minute = 0
+        self.finished = False
+
+    def _build_lineup_arrays(self):
+        """Gathers lineup attributes, positions and personalities into arrays"""
+        # Each distinct pair of lineups is read once, so repeating a fixture costs no extra lookups
+        blocks = {}
+        block_of_row = []
+        for sides in self.lineups:
+            key = tuple(tuple(id(player) for player in players) for players in sides)
+            if key not in blocks:
+                blocks[key] = (len(blocks), sides)
+            block_of_row.append(blocks[key][0])
+
+        shape = (len(blocks), 2, LINEUP_SIZE)
+        present = np.zeros(shape, dtype=bool)
+        position_codes = np.zeros(shape, dtype=np.int64)
+        personality_codes = np.zeros(shape, dtype=np.int64)
+        attributes = np.zeros(shape + (len(ATTRIBUTES),))
+
+        for b, sides in blocks.values():
+            for side, players in enumerate(sides):
+                for slot, player in enumerate(players[:LINEUP_SIZE]):
+                    present[b, side, slot] = True
+                    position_codes[b, side, slot] = POSITIONS.index(player.position)
+                    personality_codes[b, side, slot] = PERSONALITIES.index(player.personality)
+                    row = list(read_match_attributes(player.attribute_values.tolist()))
+
+                    # Overlay the boost for high potential youth players
+                    deltas = Match.youth_boost_deltas(player)
+                    if deltas is not None:
+                        row = [value + delta for value, delta in zip(row, deltas)]
+
+                    attributes[b, side, slot] = row
+
+        # Rule tables are built per block, then spread to the rows by _expand_blocks
+        self.block_of_row = np.array(block_of_row, dtype=np.int64)
+        self.present = present
+        self.position_codes = position_codes
+        self.personality_codes = personality_codes
+        self.attributes = attributes
+
+    def _build_rule_tables(self):
+        """Precomputes the parts of the match rules that are fixed for the whole match"""
+        a = self.attributes
+        codes = self.position_codes
+        present = self.present
+        attr = lambda name: a[..., ATTR[name]]
+
+        self.distance = DISTANCES[codes]
+
+        # Action decision tables for normal and high pressure
+        skills = np.stack([
+            (attr("finishing") * 0.6 + attr("attacking_iq") * 0.4) / 100.0,
+            (attr("passing") * 0.5 + attr("playmaking") * 0.5) / 100.0,
+            (attr("dribbling") * 0.5 + attr("dribbling_skills") * 0.5) / 100.0,
+            (attr("long_balls") * 0.6 + attr("accuracy") * 0.4) / 100.0
+        ], axis=-1)
+        probs = ACTION_BASE[codes] * (0.5 + skills) * PERSONALITY_MODIFIERS[self.personality_codes]
+        probs = np.stack([probs, probs * HIGH_PRESSURE_MODIFIERS], axis=-2)
+        shoot_distance = np.where(self.distance < 0.2, 2.0, np.where(self.distance > 0.7, 0.3, 1.0))
+        probs[..., SHOOT] *= shoot_distance[..., None]
+        cumulative = np.cumsum(probs, axis=-1)
+        self.decision_cumulative = cumulative / cumulative[..., -1:]
+
+        # Defensive pressure and outcome chances
+        pressure = (attr("tackling") * 0.3 + attr("defensive_iq") * 0.4 + attr("speed") * 0.3) / 100.0
+        pressure = np.where(_position_mask(codes, [Position.CB, Position.WB]), pressure * 1.2, pressure)
+        self.pressure = np.minimum(1.0, pressure)
+        self.score_chance = ((attr("finishing") * 0.5 + attr("accuracy") * 0.3 +
+                              attr("attacking_iq") * 0.2) / 100.0) * (1 - self.distance)
+        self.dribble_chance = (attr("dribbling") * 0.4 + attr("dribbling_skills") * 0.4 +
+                               attr("speed") * 0.2) / 100.0
+        self.tackle_chance = (attr("tackling") * 0.4 + attr("defensive_iq") * 0.3 +
+                              attr("strength") * 0.3) / 100.0
+        self.long_ball_base = (attr("long_balls") * 0.5 + attr("accuracy") * 0.3) / 100.0
+        self.aerial = attr("jumping") * 0.2 / 100.0
+        self.speed = attr("speed")
+
+        # Candidate masks for pressing defenders, restarts and long ball targets
+        def with_fallback(mask):
+            mask = mask & present
+            return np.where(mask.any(axis=-1, keepdims=True), mask, present)
+        self.press_mask = with_fallback(_position_mask(codes, [Position.CB, Position.WB, Position.CDM]))
+        self.midfield_mask = with_fallback(_position_mask(codes, [Position.CM, Position.CDM, Position.CAM]))
+        self.forward_mask = _position_mask(codes, [Position.ST, Position.LW, Position.RW]) & present
+        self.run_mask = _position_mask(codes, [Position.ST, Position.LW, Position.RW, Position.CAM]) & present
+        self.run_passer = _position_mask(codes, [Position.CAM, Position.CM, Position.LW, Position.RW])
+
+        # Static pass weights and base success chances (passer slot x receiver slot)
+        passer_distance = self.distance[..., :, None]
+        receiver_distance = self.distance[..., None, :]
+        long_pass = np.abs(passer_distance - receiver_distance) > 0.4
+        weight = PASS_PREFERENCES[codes[..., :, None], codes[..., None, :]]
+        long_ability = (attr("long_balls") + attr("accuracy")) / 200.0
+        weight = np.where(long_pass, weight * long_ability[..., :, None], weight)
+        progressive = ~_position_mask(codes, [Position.ST, Position.LW, Position.RW])[..., :, None]
+        weight = np.where(progressive & (receiver_distance < passer_distance), weight * 1.3, weight)
+        receivers = present[..., None, :] & ~np.eye(LINEUP_SIZE, dtype=bool)
+        self.pass_weight = weight
+        self.pass_receivers = receivers
+
+        short_chance = (attr("passing") * 0.4 + attr("accuracy") * 0.3 + attr("playmaking") * 0.3) / 100.0
+        long_chance = self.long_ball_base[..., :, None] + self.aerial[..., None, :]
+        self.pass_base = np.where(long_pass, long_chance, short_chance[..., :, None])
+
+    def _expand_blocks(self):
+        """Turns the per-block lineup arrays and rule tables into one entry per fixture"""
+        for name in ("present", "position_codes", "personality_codes", "attributes", "distance",
+                     "decision_cumulative", "pressure", "score_chance", "dribble_chance", "tackle_chance",
+                     "long_ball_base", "aerial", "speed", "press_mask", "midfield_mask", "forward_mask",
+                     "run_mask", "run_passer", "pass_weight", "pass_receivers", "pass_base"):
+            setattr(self, name, getattr(self, name)[self.block_of_row])
+
+    def simulate(self):
+        """Simulates all matches to full time"""
+        rows = np.arange(self.size)
+        self.possession = self.rng.integers(0, 2, self.size)
+        self.carrier = self._pick(self.midfield_mask, rows, self.possession)
+
+        while self.minute < 90:
+            self.minute += 1
+            if self.minute % self.action_frequency == 0:
+                self._simulate_actions()
+            # States are redrawn every minute, so only the draw before an action is ever read
+            if (self.minute + 1) % self.action_frequency == 0:
+                self._update_player_states()
+
+        self._finalize_ratings()
+        self.finished = True
+        return self
+
+    def _pick(self, mask, rows, sides):
+        """Picks a uniformly random player from each (row, side) candidate mask"""
+        return _pick_uniform(mask[rows, sides], self.rng.random(len(rows)))
+
+    def _rate(self, rows, sides, slots, impact):
+        """Applies a match rating impact, clamped to the 1-10 scale"""
+        self.ratings[rows, sides, slots] = np.clip(self.ratings[rows, sides, slots] + impact, 1.0, 10.0)
+
+    def _switch_possession(self, rows):
+        """Switches possession and restarts play from a random midfielder"""
+        self.possession[rows] = 1 - self.possession[rows]
+        self.carrier[rows] = self._pick(self.midfield_mask, rows, self.possession[rows])
+
+    def _simulate_actions(self):
+        """Simulates one action in every match"""
+        rows = np.arange(self.size)
+        attack = self.possession
+        defence = 1 - attack
+        carrier = self.carrier
+
+        defender = self._pick(self.press_mask, rows, defence)
+        high_pressure = (self.pressure[rows, defence, defender] > 0.7).astype(np.int64)
+
+        cumulative = self.decision_cumulative[rows, attack, carrier, high_pressure]
+        action = np.minimum((cumulative <= self.rng.random(self.size)[:, None]).sum(axis=1), LONG_BALL)
+
+        shots = rows[action == SHOOT]
+        passes = rows[action == PASS]
+        dribbles = rows[action == DRIBBLE]
+        long_balls = rows[action == LONG_BALL]
+
+        # Compute each group against the pre-action state before applying changes
+        self._attempt_shots(shots)
+        self._attempt_passes(passes)
+        self._attempt_dribbles(dribbles, defender[dribbles])
+        self._attempt_long_balls(long_balls)
+
+    def _attempt_shots(self, rows):
+        """Resolves shots on goal"""
+        if not len(rows):
+            return
+        side = self.possession[rows]
+        shooter = self.carrier[rows]
+        self.stats[rows, side, shooter, STAT["shots"]] += 1
+
+        goal = self.rng.random(len(rows)) < self.score_chance[rows, side, shooter]
+        on_target = ~goal & (self.rng.random(len(rows)) < 0.5)
+        off_target = ~goal & ~on_target
+
+        g_rows, g_side, g_shooter = rows[goal], side[goal], shooter[goal]
+        self.scores[g_rows, g_side] += 1
+        self.stats[g_rows, g_side, g_shooter, STAT["goals"]] += 1
+        self.stats[g_rows, g_side, g_shooter, STAT["shots_on_target"]] += 1
+        self._rate(g_rows, g_side, g_shooter, 1.0)
+
+        # Assist goes to the most recent passer other than the scorer
+        last = self.last_passer[g_rows, g_side]
+        assister = np.where(last != g_shooter, last, self.previous_passer[g_rows, g_side])
+        assisted = assister >= 0
+        a_rows, a_side, a_slot = g_rows[assisted], g_side[assisted], assister[assisted]
+        self.stats[a_rows, a_side, a_slot, STAT["assists"]] += 1
+        self._rate(a_rows, a_side, a_slot, 0.8)
+
+        self.stats[rows[on_target], side[on_target], shooter[on_target], STAT["shots_on_target"]] += 1
+        self._rate(rows[on_target], side[on_target], shooter[on_target], 0.3)
+        self._rate(rows[off_target], side[off_target], shooter[off_target], -0.1)
+
+        self._switch_possession(rows)
+
+    def _attempt_passes(self, rows):
+        """Resolves passes to teammates"""
+        if not len(rows):
+            return
+        n = np.arange(len(rows))
+        side = self.possession[rows]
+        passer = self.carrier[rows]
+        openness = self.open[rows, side]
+        on_run = self.on_run[rows, side]
+
+        # Apply the per-minute openness and run terms to the static weights
+        weight = self.pass_weight[rows, side, passer] * (1.0 + openness)
+        running = self.run_passer[rows, side, passer][:, None] & (on_run > 0)
+        weight = np.where(running, weight * (1.5 + on_run), weight)
+        weight = np.where(self.pass_receivers[rows, side, passer], np.maximum(0.1, weight), 0.0)
+        receiver = _pick_weighted(weight, self.rng.random(len(rows)))
+
+        chance = self.pass_base[rows, side, passer, receiver]
+        receiver_run = on_run[n, receiver]
+        chance = np.where(receiver_run > 0,
+                          chance * (0.8 + (self.speed[rows, side, receiver] / 100.0) * 0.4), chance)
+        chance = np.minimum(0.95, chance * (0.7 + openness[n, receiver] * 0.3))
+
+        self.stats[rows, side, passer, STAT["passes_attempted"]] += 1
+        success = self.rng.random(len(rows)) < chance
+
+        s_rows, s_side, s_passer = rows[success], side[success], passer[success]
+        self.stats[s_rows, s_side, s_passer, STAT["passes_completed"]] += 1
+        self._rate(s_rows, s_side, s_passer, 0.1)
+        self.carrier[s_rows] = receiver[success]
+        new_passer = self.last_passer[s_rows, s_side] != s_passer
+        self.previous_passer[s_rows, s_side] = np.where(
+            new_passer, self.last_passer[s_rows, s_side], self.previous_passer[s_rows, s_side])
+        self.last_passer[s_rows, s_side] = s_passer
+
+        self._rate(rows[~success], side[~success], passer[~success], -0.1)
+        self._switch_possession(rows[~success])
+
+    def _attempt_dribbles(self, rows, defender):
+        """Resolves dribbles against the pressing defender"""
+        if not len(rows):
+            return
+        side = self.possession[rows]
+        attacker = self.carrier[rows]
+        success = self.dribble_chance[rows, side, attacker] > self.tackle_chance[rows, 1 - side, defender]
+
+        s_rows, s_side, s_attacker = rows[success], side[success], attacker[success]
+        self.open[s_rows, s_side, s_attacker] = np.minimum(1.0, self.open[s_rows, s_side, s_attacker] + 0.2)
+        self._rate(s_rows, 1 - s_side, defender[success], -0.2)
+
+        f_rows, f_side, f_defender = rows[~success], side[~success], defender[~success]
+        self.stats[f_rows, 1 - f_side, f_defender, STAT["tackles_won"]] += 1
+        self._rate(f_rows, 1 - f_side, f_defender, 0.3)
+        self._switch_possession(f_rows)
+
+    def _attempt_long_balls(self, rows):
+        """Resolves long balls to a forward"""
+        rows = rows[self.forward_mask[rows, self.possession[rows]].any(axis=1)]
+        if not len(rows):
+            return
+        side = self.possession[rows]
+        passer = self.carrier[rows]
+        receiver = self._pick(self.forward_mask, rows, side)
+        chance = self.long_ball_base[rows, side, passer] + self.aerial[rows, side, receiver]
+
+        self.stats[rows, side, passer, STAT["passes_attempted"]] += 1
+        success = self.rng.random(len(rows)) < chance
+        self.stats[rows[success], side[success], passer[success], STAT["passes_completed"]] += 1
+        self.carrier[rows[success]] = receiver[success]
+        self._switch_possession(rows[~success])
+
+    def _update_player_states(self):
+        """Updates player states (openness, runs) for every match"""
+        shape = (self.size, 2, LINEUP_SIZE)
+        self.open = self.rng.random(shape)
+        running = self.run_mask & (self.rng.random(shape) < 0.3)
+        self.on_run = np.where(running, self.rng.random(shape), 0.0)
+
+    def _finalize_ratings(self):
+        """Adds the clean sheet bonus for goalkeepers and defenders"""
+        conceded = self.scores[:, ::-1]
+        clean_sheet = (conceded == 0)[:, :, None] & _position_mask(
+            self.position_codes, [Position.GK, Position.CB, Position.WB]) & self.present
+        self.ratings = np.where(clean_sheet, np.minimum(10.0, self.ratings + 0.01), self.ratings)
+
+    def apply_results(self):
+        """Writes ratings, statistics and development back to the players and returns the results"""
+        results = []
+        performances = []
+        for b, (home_team, away_team) in enumerate(self.fixtures):
+            player_ratings = {}
+            for side, players in enumerate(self.lineups[b]):
+                for slot, player in enumerate(players[:LINEUP_SIZE]):
+                    for stat in player.stats:
+                        player.stats[stat] = 0
+                    for i, stat in enumerate(STATS):
+                        player.stats[stat] = int(self.stats[b, side, slot, i])
+                    player.current_match_rating = float(self.ratings[b, side, slot])
+                    player_ratings[player] = player.finalize_match_rating()
+                    player.stats["matches_played"] = 1
+                    player.stats["minutes_played"] = 90
+                    player.update_season_stats()
+                    player.update_career_stats()
+            performances.extend(player_ratings.items())
+
+            results.append({
+                'home_team': home_team,
+                'away_team': away_team,
+                'home_score': int(self.scores[b, 0]),
+                'away_score': int(self.scores[b, 1]),
+                'events': [],
+                'player_ratings': player_ratings
+            })
+
+        # Development runs for the whole matchweek on the player store, in one pass per repeated appearance
+        develop_matchweek(performances, rng=self.rng, player_rng=self.player_rng)
+        return results
+
+
+def simulate_fixtures(fixtures, action_frequency=1, seed=None, rng=None):
+    """Simulates many fixtures at once with the batch engine and returns their results"""
+    fixtures = list(fixtures)
+    if not fixtures:
+        return []
+    batch = BatchMatch(fixtures, action_frequency=action_frequency, seed=seed, rng=rng)
+    return batch.simulate().apply_results()
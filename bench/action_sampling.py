@@ -0,0 +1,68 @@
+"""Microbenchmark for the per-action player samplers in Match"""
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from team import Team
+from match import Match, HOME
+from player import Position
+
+
+def legacy_closest_defender(match):
+    """Defender selection as done before the prebuilt pools"""
+    defenders = [slot for slot, side in enumerate(match.sides) if side != match.possession]
+    priority_defenders = [s for s in defenders if match.positions[s] in [Position.CB, Position.WB, Position.CDM]]
+    if priority_defenders:
+        return random.choice(priority_defenders)
+    return random.choice(defenders)
+
+
+def legacy_random_midfielder(match, side):
+    """Restart player selection as done before the prebuilt pools"""
+    players = [slot for slot, player_side in enumerate(match.sides) if player_side == side]
+    midfielders = [s for s in players if match.positions[s] in [Position.CM, Position.CDM, Position.CAM]]
+    return random.choice(midfielders) if midfielders else random.choice(players)
+
+
+def legacy_receiver(match, passer):
+    """Receiver selection as done before the alias tables"""
+    receivers, static_weights, _, _, prefers_runs = match.pass_tables[passer]
+    weights = [match._calculate_pass_weight(receiver, weight, prefers_runs)
+               for receiver, weight in zip(receivers, static_weights)]
+    return random.choices(receivers, weights=weights, k=1)[0]
+
+
+def per_call_ns(statement, number):
+    """Returns the best per-call time of a statement in nanoseconds"""
+    return min(timeit.repeat(statement, number=number, repeat=5)) / number * 1e9
+
+
+if __name__ == "__main__":
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    match = Match(Team("Bench Home", 1), Team("Bench Away", 1), silent=True)
+    match.possession = HOME
+    match.ball = 5
+    match._update_player_states()
+    passer = 5
+    
+    cases = [
+        ("pressing defender", lambda: legacy_closest_defender(match), match._get_closest_defender),
+        ("restart midfielder", lambda: legacy_random_midfielder(match, HOME),
+         lambda: match._get_random_midfielder(HOME)),
+        ("pass receiver", lambda: legacy_receiver(match, passer), lambda: match._choose_receiver(passer)),
+    ]
+    
+    print(f"{'Sampler':<20}{'Before (ns)':>14}{'After (ns)':>14}{'Speedup':>10}")
+    for name, before, after in cases:
+        before_ns = per_call_ns(before, number)
+        after_ns = per_call_ns(after, number)
+        print(f"{name:<20}{before_ns:>14.0f}{after_ns:>14.0f}{before_ns / after_ns:>9.1f}x")
+    
+    # Cost of a full action including a state refresh, as in a real minute
+    def action():
+        match._update_player_states()
+        match._simulate_action()
+    print(f"\nFull action with state refresh: {per_call_ns(action, number // 10):.0f} ns")
@@ -0,0 +1,68 @@
+"""Checks that batch development matches per-player improve_from_match in distribution, and times both"""
+import os
+import pickle
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from development import develop_players
+from player import Player, Position, world_store
+
+
+def population(count, seed):
+    """Players of every position and a spread of ages, each with a match rating"""
+    rng = random.Random(seed)
+    positions = list(Position)
+    players = [Player(positions[i % len(positions)], age=rng.randint(17, 36), youth=i % 10 == 0, rng=rng)
+               for i in range(count)]
+    return [(player, rng.uniform(5.0, 9.5)) for player in players]
+
+
+def rating_deltas(performances, develop):
+    before = world_store.overall_ratings([player for player, _ in performances])
+    start = time.perf_counter()
+    develop(performances)
+    elapsed = time.perf_counter() - start
+    after = world_store.overall_ratings([player for player, _ in performances])
+    return after - before, elapsed
+
+
+def ks_statistic(a, b):
+    """Two-sample Kolmogorov-Smirnov statistic: the largest gap between the empirical CDFs"""
+    values = np.sort(np.concatenate([a, b]))
+    cdf_a = np.searchsorted(np.sort(a), values, side="right") / len(a)
+    cdf_b = np.searchsorted(np.sort(b), values, side="right") / len(b)
+    return np.abs(cdf_a - cdf_b).max()
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    player_rng = random.Random(3)
+
+    def loop(performances):
+        for player, rating in performances:
+            player.improve_from_match(rating, rng=player_rng)
+
+    generator = np.random.default_rng(3)
+    performances = population(count, 1)
+    # Unpickling gives identical players on fresh store rows
+    clones = pickle.loads(pickle.dumps(performances))
+    loop_deltas, loop_time = rating_deltas(performances, loop)
+    batch_deltas, batch_time = rating_deltas(
+        clones, lambda performances: develop_players(performances, rng=generator, player_rng=player_rng))
+
+    print(f"{count} players")
+    print(f"{'':<22}{'Per player':>12}{'Batch':>12}")
+    for name, stat in [("changed", lambda d: (d != 0).mean()), ("improved", lambda d: (d > 0).mean()),
+                       ("mean delta", np.mean), ("std delta", np.std)]:
+        print(f"{name:<22}{stat(loop_deltas):>12.4f}{stat(batch_deltas):>12.4f}")
+    print(f"{'time (ms)':<22}{loop_time * 1e3:>12.1f}{batch_time * 1e3:>12.1f}")
+    # 1.36 / sqrt(n / 2) is the 5% critical value for two samples of size n
+    critical = 1.36 * np.sqrt(2 / count)
+    statistic = ks_statistic(loop_deltas, batch_deltas)
+    print(f"KS statistic {statistic:.4f} (5% critical value {critical:.4f}): "
+          f"{'same distribution' if statistic < critical else 'DIFFERENT'}")
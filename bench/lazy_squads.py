@@ -0,0 +1,27 @@
+"""Shows world startup time scaling with the number of leagues whose squads are actually used"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game import Game
+
+
+def startup_ms(leagues_touched, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        game = Game(seed=1)
+        for league in list(game.leagues.values())[:leagues_touched]:
+            for team in league.teams:
+                team.players
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+if __name__ == "__main__":
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    print(f"{'Leagues touched':<18}{'Startup (ms)':>14}")
+    for leagues_touched in range(4):
+        print(f"{leagues_touched:<18}{startup_ms(leagues_touched, repeat):>14.1f}")
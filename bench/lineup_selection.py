@@ -0,0 +1,45 @@
+"""Measures lineup selection with the cached overall rating against recomputing it on every read"""
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from team import Team
+from player import Player, Position
+
+
+def legacy_overall_rating(player):
+    """Overall rating as computed before caching: the weight dict is rebuilt on every read"""
+    if player.position == Position.GK:
+        return sum(player.gk_attributes.values()) / len(player.gk_attributes)
+    weights = player._get_position_weights()
+    weighted_sum = sum(player.attributes[attr] * weight for attr, weight in weights.items())
+    return weighted_sum / sum(weights.values())
+
+
+def per_call_us(func, number):
+    return timeit.timeit(func, number=number) / number * 1e6
+
+
+if __name__ == "__main__":
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    team = Team("Bench Home", 1, rng=random.Random(1))
+    rng = random.Random(2)
+    cases = [
+        ("get_starting_eleven", lambda: team.get_starting_eleven(rng=rng)),
+        ("get_squad_rating", lambda: team.get_squad_rating()),
+        ("sort squad by rating", lambda: sorted(team.players, key=lambda p: p.overall_rating)),
+    ]
+
+    cached_property = Player.overall_rating
+    print(f"{'Operation':<24}{'Before (us)':>14}{'After (us)':>14}{'Speedup':>10}")
+    for name, func in cases:
+        Player.overall_rating = property(legacy_overall_rating)
+        try:
+            before_us = per_call_us(func, number)
+        finally:
+            Player.overall_rating = cached_property
+        after_us = per_call_us(func, number)
+        print(f"{name:<24}{before_us:>14.1f}{after_us:>14.1f}{before_us / after_us:>9.1f}x")
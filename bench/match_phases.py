@@ -0,0 +1,30 @@
+"""Shows where a headless match spends its time, phase by phase"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from team import Team
+from match import simulate_fixture
+from profiling import MatchProfiler
+
+
+def profile_matches(matches=200, action_frequency=1):
+    """Simulates fixtures between two fresh teams with one profiler across all of them"""
+    home_team = Team("Bench Home", 1)
+    away_team = Team("Bench Away", 1)
+    profiler = MatchProfiler()
+    for _ in range(matches):
+        result = simulate_fixture(home_team, away_team, action_frequency=action_frequency, profiler=profiler)
+        # Render the commentary too, so name formatting shows up as event_display
+        for event in result["events"]:
+            event.description
+    return profiler
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if arg != "--json"]
+    matches = int(args[0]) if args else 200
+    action_frequency = int(args[1]) if len(args) > 1 else 1
+    profiler = profile_matches(matches, action_frequency)
+    print(profiler.to_json() if "--json" in sys.argv else profiler.format_table())
@@ -0,0 +1,54 @@
+"""Measures headless match simulation throughput in matches per second, serially and in batches"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from team import Team
+from match import simulate_fixture
+from batch_match import BatchMatch
+
+# Fixtures per batch: one league week, a week across all three leagues, then larger sets
+BATCH_SIZES = (5, 13, 50, 200)
+
+
+def distinct_fixtures(matches):
+    """One fixture per pair of fresh teams, so no two fixtures share a lineup"""
+    teams = [Team(f"Bench {i}", 1, rng=random.Random(i)) for i in range(2 * matches)]
+    return [(teams[2 * i], teams[2 * i + 1]) for i in range(matches)]
+
+
+def measure_throughput(fixtures, action_frequency=1):
+    """Simulates the fixtures one by one and returns matches per second"""
+    rng = random.Random(1)
+    start = time.perf_counter()
+    for home_team, away_team in fixtures:
+        simulate_fixture(home_team, away_team, action_frequency=action_frequency, rng=rng)
+    elapsed = time.perf_counter() - start
+
+    return len(fixtures) / elapsed
+
+
+def measure_batch_throughput(fixtures, batch_size, action_frequency=1):
+    """Simulates the fixtures in lock-step batches of batch_size and returns matches per second"""
+    rng = random.Random(1)
+    start = time.perf_counter()
+    for i in range(0, len(fixtures), batch_size):
+        BatchMatch(fixtures[i:i + batch_size], action_frequency=action_frequency, seed=i,
+                   rng=rng).simulate().apply_results()
+    elapsed = time.perf_counter() - start
+
+    return len(fixtures) / elapsed
+
+
+if __name__ == "__main__":
+    matches = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    fixtures = distinct_fixtures(matches)
+    for frequency in (1, 5):
+        rate = measure_throughput(fixtures, action_frequency=frequency)
+        print(f"Action frequency {frequency}: {rate:.1f} matches/sec")
+        for batch_size in BATCH_SIZES:
+            batch_rate = measure_batch_throughput(fixtures, batch_size, action_frequency=frequency)
+            print(f"Action frequency {frequency} (batches of {batch_size}): {batch_rate:.1f} matches/sec")
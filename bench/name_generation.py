@@ -0,0 +1,50 @@
+"""Compares name generation and game startup with the names package against the preloaded NameProvider"""
+import os
+import random
+import sys
+import time
+import timeit
+
+import names
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game import Game
+from name_provider import NameProvider
+
+
+def legacy_generate(self, n, rng=None):
+    """Name generation as before: the names package rescans its files for every name"""
+    return [names.get_full_name(gender='male') for _ in range(n)]
+
+
+def startup_seconds():
+    """Builds a world and every club's squad, which are otherwise only generated when first used"""
+    start = time.perf_counter()
+    game = Game(seed=1)
+    for league in game.leagues.values():
+        for team in league.teams:
+            team.players
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    provider = NameProvider(rng=random.Random(1))
+    provider.generate(1)  # Load the tables before timing
+    legacy_us = timeit.timeit(lambda: names.get_full_name(gender='male'), number=number) / number * 1e6
+    single_us = timeit.timeit(provider.full_name, number=number) / number * 1e6
+    batch_us = timeit.timeit(lambda: provider.generate(number), number=1) / number * 1e6
+    print(f"{'Per name':<24}{'us':>10}")
+    print(f"{'names package':<24}{legacy_us:>10.1f}")
+    print(f"{'NameProvider.full_name':<24}{single_us:>10.1f}")
+    print(f"{'NameProvider.generate':<24}{batch_us:>10.1f}")
+
+    generate = NameProvider.generate
+    NameProvider.generate = legacy_generate
+    try:
+        before = startup_seconds()
+    finally:
+        NameProvider.generate = generate
+    after = startup_seconds()
+    print(f"Game startup with all squads: {before:.2f}s before, {after:.2f}s after ({before / after:.1f}x)")
@@ -0,0 +1,28 @@
+"""Measures the memory held per generated Player"""
+import os
+import random
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from player import Player, Position
+
+
+def bytes_per_player(count=200):
+    """Creates count players of every position and returns the traced bytes still held per player"""
+    rng = random.Random(1)
+    positions = list(Position)
+    Player(Position.CM, rng=rng)  # Load the name data before tracing starts
+    tracemalloc.start()
+    try:
+        players = [Player(positions[i % len(positions)], rng=rng) for i in range(count)]
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return size / len(players)
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    print(f"{bytes_per_player(count):.0f} bytes per player")
@@ -0,0 +1,46 @@
+"""Checks that predictions stay within their sample budget and 100 ms at every action frequency"""
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from team import Team
+from predictor import MatchPredictor, MATCH_MINUTES
+
+FREQUENCIES = (1, 2, 3, 5, 10)
+TARGET_MS = 100
+
+
+def prediction_ms(predictor, home_team, away_team, frequency, repeat=3):
+    """Fastest uncached prediction in milliseconds, and the samples it used"""
+    best = float("inf")
+    for _ in range(repeat):
+        predictor.cache.clear()
+        start = time.perf_counter()
+        prediction = predictor.predict(home_team, away_team, action_frequency=frequency)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, prediction["samples"]
+
+
+if __name__ == "__main__":
+    home_team = Team("Bench Home", 1, rng=random.Random(1))
+    away_team = Team("Bench Away", 1, rng=random.Random(2))
+    predictor = MatchPredictor()
+    predictor.predict(home_team, away_team)  # Warm up before timing
+    failures = []
+    print(f"{'Frequency':<11}{'Budget':>8}{'Samples':>9}{'Actions':>9}{'ms':>8}")
+    for frequency in FREQUENCIES:
+        budget = predictor.sample_budget(frequency)
+        ms, samples = prediction_ms(predictor, home_team, away_team, frequency)
+        actions = samples * math.ceil(MATCH_MINUTES / frequency)
+        print(f"{frequency:<11}{budget:>8}{samples:>9}{actions:>9}{ms:>8.1f}")
+        if samples > budget or actions > predictor.action_budget:
+            failures.append(f"action frequency {frequency}: {samples} samples over the budget of {budget}")
+        if ms > TARGET_MS:
+            failures.append(f"action frequency {frequency}: {ms:.0f} ms over the {TARGET_MS} ms target")
+    for failure in failures:
+        print(failure, file=sys.stderr)
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,59 @@
+"""Compares average rating lookups and storage per rating: three growing lists against RatingHistory"""
+import os
+import random
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rating_history import RatingHistory
+
+
+def legacy_averages(ratings):
+    """Averages as computed before: summing the lists on every call"""
+    last_5 = ratings[-5:]
+    return sum(ratings) / len(ratings), sum(ratings) / len(ratings), sum(last_5) / len(last_5)
+
+
+def history_averages(history):
+    return history.average("season"), history.average("career"), history.average("last5")
+
+
+def build_lists(ratings):
+    """Before: each rating a float object, referenced from the match, season and career lists"""
+    floats = [rating + 0.0 for rating in ratings]  # New float objects, as match ratings were
+    return floats, list(floats), list(floats)
+
+
+def build_history(ratings):
+    history = RatingHistory()
+    for rating in ratings:
+        history.add(float(rating))
+    return history
+
+
+def traced_bytes(build, ratings):
+    tracemalloc.start()
+    try:
+        kept = build(ratings)
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del kept
+    return size
+
+
+if __name__ == "__main__":
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    rng = random.Random(1)
+    print(f"{'Matches':<10}{'Lists (us)':>12}{'History (us)':>14}{'Lists (B/match)':>17}{'History (B/match)':>19}")
+    for matches in (10, 100, 1000, 5000):
+        ratings = [round(rng.uniform(4.0, 9.5), 1) for _ in range(matches)]
+        history = build_history(ratings)
+        legacy_us = timeit.timeit(lambda: legacy_averages(ratings), number=number) / number * 1e6
+        history_us = timeit.timeit(lambda: history_averages(history), number=number) / number * 1e6
+        legacy_bytes = traced_bytes(build_lists, ratings)
+        history_bytes = traced_bytes(build_history, ratings)
+        print(f"{matches:<10}{legacy_us:>12.2f}{history_us:>14.2f}"
+              f"{legacy_bytes / matches:>17.1f}{history_bytes / matches:>19.1f}")
@@ -0,0 +1,256 @@
+"""
+Benchmark suite with JSON baselines.
+
+    python bench/suite.py run [--output results.json]
+    python bench/suite.py save [baseline.json]
+    python bench/suite.py compare [baseline.json] [results.json] [--threshold 0.1]
+
+compare runs the suite (or reads results.json) and exits with status 1 if any
+metric is worse than the baseline by more than the threshold, or if a metric in the
+baseline is missing from a benchmark that ran. Metrics new since the baseline are
+listed; save a new baseline to start tracking them.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from player import Player, Position
+from team import Team
+from league import League
+from match import Match
+from game import Game
+from predictor import MatchPredictor
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "baseline.json")
+SEED = 2024
+
+
+def best_time(func, repeat):
+    """Runs func repeat times and returns the fastest wall time in seconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def rate(count, seconds, unit):
+    return {"value": count / seconds, "unit": unit, "higher_is_better": True}
+
+
+def duration(seconds):
+    return {"value": seconds * 1000, "unit": "ms", "higher_is_better": False}
+
+
+def bench_match(repeat, matches=50):
+    """Silent Match.simulate throughput at both action frequencies"""
+    home_team = Team("Bench Home", 1, rng=random.Random(SEED))
+    away_team = Team("Bench Away", 1, rng=random.Random(SEED + 1))
+    rng = random.Random(SEED)
+    metrics = {}
+    for frequency in (1, 5):
+        def play():
+            for _ in range(matches):
+                Match(home_team, away_team, commentary_delay=0, action_frequency=frequency,
+                      silent=True, rng=rng).simulate()
+        metrics[f"match_simulate_af{frequency}"] = rate(matches, best_time(play, repeat), "matches/s")
+    return metrics
+
+
+def bench_league_season(repeat, teams=10):
+    """A full season of simulate_week for a league, fixtures included"""
+    squads = [Team(f"Bench {i}", 1, rng=random.Random(SEED + i)) for i in range(teams)]
+
+    def season():
+        league = League("Bench League", 1, seed=SEED)
+        for team in squads:
+            league.add_team(team)
+        league.generate_season_fixtures()
+        for week in range(1, (teams - 1) * 2 + 1):
+            league.simulate_week(week)
+    return {f"league_season_{teams}_teams": duration(best_time(season, repeat))}
+
+
+def bench_squads(repeat, teams=10, players=250):
+    """Team.generate_squad and bare Player construction rates"""
+    rng = random.Random(SEED)
+
+    def squads():
+        for i in range(teams):
+            Team(f"Bench {i}", 1, rng=rng)
+
+    def construct():
+        for _ in range(players):
+            Player(Position.CM, rng=rng)
+    return {
+        "team_generate_squad": rate(teams, best_time(squads, repeat), "teams/s"),
+        "player_construction": rate(players, best_time(construct, repeat), "players/s")
+    }
+
+
+def bench_game_init(repeat):
+    """Building the world, and building it then generating the squads of the league the user picks"""
+    def init_one_league():
+        game = Game(seed=SEED)
+        for team in game.leagues["English League"].teams:
+            team.players
+    return {"game_init": duration(best_time(lambda: Game(seed=SEED), repeat)),
+            "game_init_one_league": duration(best_time(init_one_league, repeat))}
+
+
+def bench_fixtures(repeat, team_counts=(10, 20, 40)):
+    """League.generate_season_fixtures as the league grows"""
+    teams = [Team(f"Bench {i}", 1, rng=random.Random(SEED + i)) for i in range(max(team_counts))]
+    metrics = {}
+    for count in team_counts:
+        league = League("Bench League", 1, seed=SEED)
+        for team in teams[:count]:
+            league.add_team(team)
+        metrics[f"fixtures_{count}_teams"] = duration(best_time(league.generate_season_fixtures, repeat))
+    return metrics
+
+
+def bench_predict(repeat):
+    """An uncached MatchPredictor.predict at both action frequencies"""
+    home_team = Team("Bench Home", 1, rng=random.Random(SEED))
+    away_team = Team("Bench Away", 1, rng=random.Random(SEED + 1))
+    predictor = MatchPredictor(seed=SEED)
+    metrics = {}
+    for frequency in (1, 5):
+        def predict():
+            predictor.cache.clear()
+            predictor.predict(home_team, away_team, action_frequency=frequency)
+        metrics[f"predict_af{frequency}"] = duration(best_time(predict, repeat))
+    return metrics
+
+
+BENCHMARKS = {
+    "match": bench_match,
+    "league_season": bench_league_season,
+    "squads": bench_squads,
+    "game_init": bench_game_init,
+    "fixtures": bench_fixtures,
+    "predict": bench_predict,
+}
+
+
+def run_suite(repeat=3, only=None):
+    """Runs the benchmarks and returns the results document"""
+    metrics = {}
+    benchmarks = []
+    for name, bench in BENCHMARKS.items():
+        if only and name not in only:
+            continue
+        print(f"Running {name}...", file=sys.stderr)
+        for metric, result in bench(repeat).items():
+            metrics[metric] = dict(result, benchmark=name)
+        benchmarks.append(name)
+    return {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.platform(),
+        "repeat": repeat,
+        "benchmarks": benchmarks,
+        "metrics": metrics
+    }
+
+
+def compare(baseline, current, threshold):
+    """
+    Returns table lines, the names of metrics that regressed beyond the threshold and the
+    names of baseline metrics missing from the current results. Baseline metrics of
+    benchmarks that weren't run (see --only) are left out rather than counted missing.
+    """
+    lines = [f"{'Metric':<28}{'Baseline':>14}{'Current':>14}{'Change':>10}"]
+    regressions = []
+    missing = []
+    ran = current.get("benchmarks")
+    for name, base in baseline["metrics"].items():
+        if name not in current["metrics"]:
+            if ran is None or base.get("benchmark") in ran:
+                missing.append(name)
+                lines.append(f"{name:<28}{base['value']:>14.2f}{'-':>14}{'':>10} {base['unit']}  MISSING")
+            continue
+        value = current["metrics"][name]["value"]
+        change = (value - base["value"]) / base["value"]
+        # A positive change is always an improvement, whichever way the metric points
+        improvement = change if base["higher_is_better"] else -change
+        flag = ""
+        if improvement < -threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        lines.append(f"{name:<28}{base['value']:>14.2f}{value:>14.2f}{improvement:>+10.1%} {base['unit']}{flag}")
+    for name, result in current["metrics"].items():
+        if name not in baseline["metrics"]:
+            lines.append(f"{name:<28}{'-':>14}{result['value']:>14.2f}{'':>10} {result['unit']}  NEW")
+    return lines, regressions, missing
+
+
+def load(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def save(results, path):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2)
+        f.write("\n")
+
+
+def main(argv=None):
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--repeat", type=int, default=3, help="runs per benchmark, the best is kept")
+    common.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="benchmarks to run")
+
+    parser = argparse.ArgumentParser(description="Soccer Manager benchmark suite")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", parents=[common], help="run the suite and print or write the results")
+    run_parser.add_argument("--output", help="write the results to this JSON file")
+
+    save_parser = commands.add_parser("save", parents=[common], help="run the suite and store it as the baseline")
+    save_parser.add_argument("baseline", nargs="?", default=DEFAULT_BASELINE)
+
+    compare_parser = commands.add_parser("compare", parents=[common], help="compare results against the baseline")
+    compare_parser.add_argument("baseline", nargs="?", default=DEFAULT_BASELINE)
+    compare_parser.add_argument("results", nargs="?", help="results file; runs the suite if omitted")
+    compare_parser.add_argument("--threshold", type=float, default=0.1,
+                                help="allowed slowdown as a fraction (default 0.1)")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        results = run_suite(args.repeat, args.only)
+        if args.output:
+            save(results, args.output)
+        else:
+            print(json.dumps(results, indent=2))
+    elif args.command == "save":
+        save(run_suite(args.repeat, args.only), args.baseline)
+        print(f"Baseline written to {args.baseline}")
+    else:
+        baseline = load(args.baseline)
+        current = load(args.results) if args.results else run_suite(args.repeat, args.only)
+        lines, regressions, missing = compare(baseline, current, args.threshold)
+        print("\n".join(lines))
+        if missing:
+            print(f"\n{len(missing)} baseline metric(s) missing: {', '.join(missing)}")
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}: {', '.join(regressions)}")
+        if missing or regressions:
+            return 1
+        print(f"\nNo regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,42 @@
+"""Compares world-wide player operations as Python loops and as PlayerStore column math"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game import Game
+from player import world_store
+
+
+def per_call_us(func, number):
+    return timeit.timeit(func, number=number) / number * 1e6
+
+
+if __name__ == "__main__":
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    game = Game(seed=1)
+    players = [player for league in game.leagues.values() for team in league.teams for player in team.players]
+
+    def loop_ratings():
+        return [player._calculate_overall_rating() for player in players]
+
+    def loop_aging():
+        for player in players:
+            player.age += 1
+
+    def loop_veterans():
+        return [player for player in players if player.age >= 32]
+
+    cases = [
+        ("overall ratings", loop_ratings, lambda: world_store.overall_ratings(players)),
+        ("age by a year", loop_aging, lambda: world_store.age_players(players)),
+        ("veterans scan", loop_veterans, lambda: world_store.older_than(players, 32)),
+    ]
+
+    print(f"{len(players)} players")
+    print(f"{'Operation':<20}{'Loop (us)':>12}{'Store (us)':>12}{'Speedup':>10}")
+    for name, loop, store in cases:
+        loop_us = per_call_us(loop, number)
+        store_us = per_call_us(store, number)
+        print(f"{name:<20}{loop_us:>12.1f}{store_us:>12.1f}{loop_us / store_us:>9.1f}x")
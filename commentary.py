@@ -0,0 +1,143 @@
+import asyncio
+import sys
+from colorama import Fore, Style
+
+class CommentaryRenderer:
+    """Formats match events as terminal commentary"""
+
+    def print_kickoff(self, match):
+        """Prints the kickoff banner and the playback controls"""
+        print(f"\n{Fore.CYAN}Match Starting: {match.home_color}{match.home_team.name}{Style.RESET_ALL} vs {match.away_color}{match.away_team.name}{Style.RESET_ALL}")
+        print("Press Enter at any time to skip to the end of the match...")
+        print("(p + Enter pauses or resumes, + or - then Enter changes the commentary speed)")
+
+    def print_event(self, event):
+        """Prints a single line of commentary"""
+        print(f"{Fore.YELLOW}[{event.minute}'] {Style.RESET_ALL}{event.description}")
+
+    def print_skip(self):
+        print(f"\n{Fore.YELLOW}Skipping to end of match...{Style.RESET_ALL}")
+
+    def print_paused(self, paused):
+        print(f"{Fore.YELLOW}{'Paused' if paused else 'Resumed'}{Style.RESET_ALL}")
+
+
+class PlaybackControls:
+    """Skip, pause and speed state shared by the keyboard and render tasks"""
+
+    min_speed = 0.25
+    max_speed = 8.0
+
+    def __init__(self):
+        self.skipped = asyncio.Event()
+        self.resumed = asyncio.Event()
+        self.resumed.set()
+        self.speed = 1.0
+
+    @property
+    def paused(self):
+        return not self.resumed.is_set()
+
+    def handle_command(self, line):
+        """Applies one line of keyboard input and returns what changed"""
+        command = line.strip().lower()
+        if line == '\n':
+            if self.skipped.is_set():
+                return None
+            self.skipped.set()
+            self.resumed.set()  # A paused match must not block the skip
+            return "skip"
+        if command == "p":
+            if self.paused:
+                self.resumed.set()
+            else:
+                self.resumed.clear()
+            return "pause"
+        if command == "+":
+            self.speed = min(self.max_speed, self.speed * 2)
+            return "speed"
+        if command == "-":
+            self.speed = max(self.min_speed, self.speed / 2)
+            return "speed"
+        return None
+
+
+class LiveMatchRunner:
+    """Plays a match live with separate simulation, keyboard and commentary tasks"""
+
+    def __init__(self, match, delay=2, stream=sys.stdin, renderer=None):
+        self.match = match
+        self.delay = delay  # Seconds between lines of commentary at normal speed
+        self.stream = stream
+        self.renderer = renderer or CommentaryRenderer()
+
+    def run(self):
+        """Runs the live match to the final whistle from synchronous code"""
+        asyncio.run(self.play())
+
+    async def play(self):
+        """Runs the live match inside an existing event loop"""
+        self.controls = PlaybackControls()
+        events = asyncio.Queue()
+        self.renderer.print_kickoff(self.match)
+
+        keyboard = asyncio.create_task(self._keyboard())
+        try:
+            await asyncio.gather(self._simulate(events), self._render(events))
+        finally:
+            keyboard.cancel()
+
+        self.match._print_final_score()
+
+    async def _simulate(self, events):
+        """Runs the engine at full speed, handing each event to the render task"""
+        for event in self.match.iter_events():
+            events.put_nowait(event)
+            await asyncio.sleep(0)  # Let the keyboard and render tasks run
+        events.put_nowait(None)
+
+    async def _render(self, events):
+        """Prints commentary at the chosen pace until the match ends or is skipped"""
+        controls = self.controls
+        while True:
+            event = await events.get()
+            if event is None:
+                return
+            if controls.skipped.is_set():
+                continue
+            await controls.resumed.wait()
+            if controls.skipped.is_set():
+                continue
+
+            self.renderer.print_event(event)
+
+            # Sleep until the next line is due, waking at once on a skip
+            try:
+                await asyncio.wait_for(controls.skipped.wait(), self.delay / controls.speed)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _keyboard(self):
+        """Applies keyboard commands as soon as each line is typed"""
+        loop = asyncio.get_running_loop()
+        lines = asyncio.Queue()
+
+        # The loop wakes the reader only when a line is ready, so nothing is polled
+        try:
+            loop.add_reader(self.stream, lambda: lines.put_nowait(self.stream.readline()))
+        except (NotImplementedError, OSError, ValueError):
+            return  # Input can't be watched here (e.g. a redirected file), so play without controls
+
+        try:
+            while True:
+                line = await lines.get()
+                if not line:
+                    return  # End of input
+
+                change = self.controls.handle_command(line)
+                if change == "skip":
+                    self.renderer.print_skip()
+                elif change == "pause":
+                    self.renderer.print_paused(self.controls.paused)
+        finally:
+            loop.remove_reader(self.stream)
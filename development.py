@@ -0,0 +1,159 @@
+import random
+import numpy as np
+from player import (Attr, Position, FIELD_ATTRIBUTES, GK_ATTRIBUTES, MATCH_TRAINING_FOCUS,
+                    PHYSICAL_ATTRIBUTES, MENTAL_ATTRIBUTES, POSITIONS, PERSONALITIES)
+
+FIELD = np.array([Attr[attr.upper()] for attr in FIELD_ATTRIBUTES])
+GOALKEEPING = np.array([Attr[attr.upper()] for attr in GK_ATTRIBUTES])
+GK_CODE = POSITIONS.index(Position.GK)
+
+# Training focus choices per position code, padded to the longest list
+FOCUS_COUNTS = np.array([len(MATCH_TRAINING_FOCUS[position]) for position in POSITIONS])
+FOCUS_TABLE = np.zeros((len(POSITIONS), FOCUS_COUNTS.max()), dtype=np.int64)
+for code, position in enumerate(POSITIONS):
+    FOCUS_TABLE[code, :FOCUS_COUNTS[code]] = [Attr[attr.upper()] for attr in MATCH_TRAINING_FOCUS[position]]
+
+# Personality development traits per personality code
+DEVELOPMENT_SPEED = np.array([p.development_traits["development_speed"] for p in PERSONALITIES])
+CONSISTENCY = np.array([p.development_traits["consistency"] for p in PERSONALITIES])
+PREFERRED = np.zeros((len(PERSONALITIES), len(Attr)), dtype=bool)
+for code, personality in enumerate(PERSONALITIES):
+    for attr in personality.development_traits["preferred_attributes"]:
+        PREFERRED[code, Attr[attr.upper()]] = True
+
+# Age decline multiplier per attribute: physical attributes decline faster, mental ones slower
+DECLINE_FACTOR = np.ones(len(Attr))
+DECLINE_FACTOR[[Attr[attr.upper()] for attr in PHYSICAL_ATTRIBUTES]] = 1.5
+DECLINE_FACTOR[[Attr[attr.upper()] for attr in MENTAL_ATTRIBUTES]] = 0.5
+
+
+def _consistent(improvement, consistency, rng):
+    """Applies the consistency roll: consistent players keep the full amount, others 70%"""
+    steady = rng.random(improvement.shape) < consistency
+    return np.maximum(0, np.where(steady, improvement, improvement * 0.7))
+
+
+def develop_players(performances, rng=None, player_rng=None, store=None):
+    """
+    Applies Player.improve_from_match to a whole matchweek at once. performances is a
+    list of (player, match_rating) pairs with each player at most once. The same age,
+    potential, personality and consistency rules are evaluated with array operations on
+    the players' store (store, if given, must be it), drawing from the NumPy Generator rng.
+    Scouting reports for youth players still come from player_rng. Returns the players
+    that developed.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    if not performances:
+        return []
+    players = [player for player, _ in performances]
+    store = store if store is not None else players[0].store
+    if any(player.store is not store for player in players):
+        raise ValueError("every player must have their row in the given store")
+    rows = store.rows(players)
+    if len(np.unique(rows)) != len(rows):
+        # The rows are written back at once, so a second copy would silently replace the first's roll
+        raise ValueError("each player may appear only once; use develop_matchweek for repeated players")
+    match_ratings = np.array([rating for _, rating in performances], dtype=float)
+
+    # Which players improve at all
+    chance = np.clip((match_ratings - 6.0) / 3.0, 0.05, 0.95)
+    chance = np.where(match_ratings >= 8.5, np.minimum(0.95, chance + 0.2), chance)
+    improving = rng.random(len(rows)) < chance
+    if not improving.any():
+        return []
+    players = [player for player, improves in zip(players, improving) if improves]
+    rows, match_ratings = rows[improving], match_ratings[improving]
+    n = len(rows)
+
+    age = store.age[rows]
+    potential = store.true_potential[rows].astype(float)
+    position = store.position[rows]
+    personality = store.personality[rows]
+    is_gk = position == GK_CODE
+    old_rating = store.overall_ratings(players)
+    rating_gap = np.maximum(0, potential - old_rating)
+    attributes = store.attributes[rows]
+    columns = np.arange(n)
+
+    focus = FOCUS_TABLE[position, (rng.random(n) * FOCUS_COUNTS[position]).astype(np.int64)]
+
+    # Improvement amount from the performance, age and distance to potential
+    amount = (match_ratings - 6.0) / 2.0
+    amount = np.where(age <= 23, amount * 1.5, np.where(age >= 30, amount * 0.5, amount))
+    amount = np.where(rating_gap > 0, amount * (1 + rating_gap / 20), amount)
+
+    # Age based ceiling, used when the performance gives no positive amount
+    max_improvement = np.select(
+        [age >= 30, age <= 19, age <= 21, age <= 23],
+        [np.full(n, 0.5), np.minimum(6, 4 + rating_gap // 8), np.minimum(5, 3 + rating_gap // 9),
+         np.minimum(4, 2 + rating_gap // 10)],
+        np.minimum(3, 1 + rating_gap // 12))
+    max_improvement = max_improvement * DEVELOPMENT_SPEED[personality]
+    max_improvement = np.where(amount > 0, amount, max_improvement)
+    consistency = CONSISTENCY[personality][:, None]
+
+    # Veterans decline: field attributes for everyone, goalkeeping ones for goalkeepers
+    veteran = age >= 30
+    decline_chance = np.select([age <= 32, age <= 34], [(age - 29) * 0.1, 0.3 + (age - 32) * 0.1],
+                               0.5 + (age - 34) * 0.1)
+    base_decline = np.select([age <= 32, age <= 34], [0.3, 0.5], 0.8)
+    for group, factor in ((FIELD, DECLINE_FACTOR[FIELD]), (GOALKEEPING, np.ones(len(GOALKEEPING)))):
+        eligible = veteran if group is FIELD else veteran & is_gk
+        declines = eligible[:, None] & (rng.random((n, len(group))) < decline_chance[:, None])
+        decline = base_decline[:, None] * factor
+        decline = np.where(rng.random((n, len(group))) < consistency, decline * 0.7, decline)
+        declined = np.maximum(1, attributes[:, group] - rng.random((n, len(group))) * decline)
+        attributes[:, group] = np.where(declines, declined, attributes[:, group])
+
+    # The focus attribute improves towards potential
+    improvement = rng.random(n) * max_improvement
+    improvement = np.where(PREFERRED[personality, focus], improvement * 1.2, improvement)
+    improvement = _consistent(improvement, consistency[:, 0], rng)
+    attributes[columns, focus] = np.minimum(potential, attributes[columns, focus] + improvement)
+
+    # Players under 30 also pick up small improvements in other attributes
+    young = age < 30
+    for group in (FIELD, GOALKEEPING):
+        eligible = young if group is FIELD else young & is_gk
+        improves = (eligible[:, None] & (group[None, :] != focus[:, None]) &
+                    (rng.random((n, len(group))) < 0.3))
+        improvement = rng.random((n, len(group))) * (max_improvement * 0.5)[:, None]
+        improvement = np.where(PREFERRED[personality][:, group], improvement * 1.2, improvement)
+        improvement = _consistent(improvement, consistency, rng)
+        current = attributes[:, group]
+        improves &= current < potential[:, None]
+        attributes[:, group] = np.where(improves, np.minimum(potential[:, None], current + improvement), current)
+
+    store.attributes[rows] = attributes
+    store.version[rows] += 1
+
+    player_rng = player_rng or random
+    for player, rating in zip(players, old_rating):
+        # First improvement of the season sets the season start rating
+        if player.season_start_rating is None:
+            player.season_start_rating = float(rating)
+        if player.youth:
+            player.matches_scouted += 1
+            player.potential_uncertainty = max(5, 15 - (player.matches_scouted // 5))
+            player._generate_scouting_report(player_rng)
+    return players
+
+
+def develop_matchweek(performances, rng=None, player_rng=None, store=None):
+    """
+    Develops a matchweek in which a player may have played more than once, e.g. a team
+    with two fixtures. Each player's k-th performance goes in the k-th develop_players
+    pass, so every match gets its own development roll, in match order.
+    """
+    passes = []
+    appearances = {}
+    for player, rating in performances:
+        k = appearances.get(player, 0)
+        appearances[player] = k + 1
+        if k == len(passes):
+            passes.append([])
+        passes[k].append((player, rating))
+    developed = []
+    for performances in passes:
+        developed.extend(develop_players(performances, rng=rng, player_rng=player_rng, store=store))
+    return developed
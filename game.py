@@ -1,17 +1,25 @@
-from player import Player, Position, Personality
+from player import Player, Position, Personality, world_store
 from team import Team
 from league import League
-from match import Match
+from match import Match, simulate_fixture
+from predictor import predict
+from seeding import make_rng
+from name_provider import NameProvider
 import os
+import random
 import time
 from colorama import init, Fore, Style
-import random
 
 # Initialize colorama
 init()
 
 class Game:
-    def __init__(self):
+    def __init__(self, seed=None, unique_names=False):
+        self.seed = seed  # World seed; None keeps the unseeded global random stream
+        self.rng = make_rng(seed, "game")
+        self.names = NameProvider(unique=unique_names, rng=make_rng(seed, "names"))  # Player names for this world
+        # Club squads are generated from this seed when first used, so unseeded worlds draw one
+        self.squad_seed = seed if seed is not None else random.getrandbits(64)
         self.leagues = self._initialize_leagues()
         self.current_team = None
         self.current_league = None
@@ -22,6 +30,8 @@ class Game:
         self.settings = {
             "match_action_frequency": 5,  # How often (in minutes) match actions occur
             "commentary_delay": 2,  # Delay between commentary lines
+            "background_fidelity": "full",  # "full" plays other fixtures event by event, "analytic" samples scorelines
+            "batch_development": False,  # Develop other fixtures' players once per matchweek instead of per match
         }
 
     def _initialize_leagues(self):
@@ -29,38 +39,38 @@ class Game:
         leagues = {}
         
         # English League
-        english = League("English League", 1)
+        english = League("English League", 1, seed=self.seed)
         english_teams = [
             ("London FC", 1), ("FC Liverpool", 1), ("Nottingham FC", 1),
             ("FC Newcastle", 1), ("Manchester FC", 1), ("FC Leicester", 1),
             ("Southhampton FC", 1), ("Coventry FC", 1), ("FC Sheffield", 1)
         ]
         for name, tier in english_teams:
-            team = Team(name, tier, game=self)
+            team = Team(name, tier, game=self, seed=self.squad_seed)
             english.add_team(team)
         leagues[english.name] = english
 
         # Spanish League
-        spanish = League("Spanish League", 2)
+        spanish = League("Spanish League", 2, seed=self.seed)
         spanish_teams = [
             ("Madrid FC", 2), ("FC Barcelona", 2), ("Granada FC", 2),
             ("Seville FC", 2), ("Valencia FC", 2), ("Bilbao FC", 2),
             ("FC Palma", 2), ("FC Girona", 2), ("FC Vigo", 2)
         ]
         for name, tier in spanish_teams:
-            team = Team(name, tier, game=self)
+            team = Team(name, tier, game=self, seed=self.squad_seed)
             spanish.add_team(team)
         leagues[spanish.name] = spanish
 
         # German League
-        german = League("German League", 3)
+        german = League("German League", 3, seed=self.seed)
         german_teams = [
             ("FC Munich", 3), ("FC Leipzig", 3), ("Dortmund FC", 3),
             ("Frankfurt FC", 3), ("Berlin FC", 3), ("FC Dresden", 3),
             ("FC Biefeld", 3), ("Hamburg FC", 3), ("Potsdam FC", 3)
         ]
         for name, tier in german_teams:
-            team = Team(name, tier, game=self)
+            team = Team(name, tier, game=self, seed=self.squad_seed)
             german.add_team(team)
         leagues[german.name] = german
 
@@ -108,7 +118,8 @@ class Game:
                     self.youth_team = Team(f"{self.current_team.name} Youth", 
                                          self.current_league.tier, 
                                          is_youth_team=True,
-                                         game=self)
+                                         game=self,
+                                         rng=self.rng)
                     break
             except ValueError:
                 print("Please enter a valid number")
@@ -201,7 +212,7 @@ class Game:
                     ratings_str = f"Overall: {player.overall_rating:.1f} (Start: {player.season_start_rating:.1f}, Change: {improvement_color}{improvement:+.1f}{Style.RESET_ALL})"
                     if player.match_ratings:  # Only show form if they've played matches
                         ratings_str += f" | Form: {form_color}{form:.1f}{Style.RESET_ALL}"
-                        if player.season_ratings:  # Only show season average if they've played
+                        if player.rating_history.season_count:  # Only show season average if they've played
                             ratings_str += f" | Season Avg: {season_avg:.1f}"
                     
                     print(f"  {player.name} ({player.age}) - {ratings_str}")
@@ -261,7 +272,7 @@ class Game:
                     ratings_str = f"Overall: {player.overall_rating:.1f} (Season: {player.get_improvement_display()})"
                     if player.match_ratings:  # Only show form if they've played matches
                         ratings_str += f" | Form: {form_color}{form:.1f}{Style.RESET_ALL}"
-                        if player.season_ratings:  # Only show season average if they've played
+                        if player.rating_history.season_count:  # Only show season average if they've played
                             ratings_str += f" | Season Avg: {season_avg:.1f}"
                     
                     print(f"  {player.name} - {ratings_str}")
@@ -298,19 +309,20 @@ class Game:
         print(f"{Fore.CYAN}Youth Match{Style.RESET_ALL}")
         
         # Create an opponent youth team from a random league team
-        opponent_team = random.choice([t for t in self.current_league.teams if t != self.current_team])
-        opponent_youth = Team(f"{opponent_team.name} Youth", self.current_league.tier, is_youth_team=True, game=self)
+        opponent_team = self.rng.choice([t for t in self.current_league.teams if t != self.current_team])
+        opponent_youth = Team(f"{opponent_team.name} Youth", self.current_league.tier, is_youth_team=True, game=self, rng=self.rng)
         
         print(f"\nMatch: {self.youth_team.name} vs {opponent_youth.name}")
         input("Press Enter to start the match...")
         
         # Get starting eleven before match simulation
-        youth_starters = self.youth_team.get_starting_eleven()
+        youth_starters = self.youth_team.get_starting_eleven(rng=self.rng)
         
         # Use the same settings as regular matches
         match = Match(self.youth_team, opponent_youth,
                      commentary_delay=self.settings["commentary_delay"],
-                     action_frequency=self.settings["match_action_frequency"])
+                     action_frequency=self.settings["match_action_frequency"],
+                     rng=self.rng)
         match.simulate()
         
         # Update scouting information for players who started
@@ -359,26 +371,35 @@ class Game:
                 unplayed_fixtures.sort(key=lambda x: x["week"])
                 
                 # Simulate each remaining fixture
-                for fixture in unplayed_fixtures:
+                week_results = []
+                for i, fixture in enumerate(unplayed_fixtures):
                     print(f"\nSimulating: {fixture['home'].name} vs {fixture['away'].name}")
-                    match = Match(fixture['home'], fixture['away'],
-                                commentary_delay=0,  # No delay for auto-simulation
-                                action_frequency=self.settings["match_action_frequency"])
-                    match.simulate()
+                    result = simulate_fixture(fixture['home'], fixture['away'],
+                                              action_frequency=self.settings["match_action_frequency"],
+                                              rng=self.current_league.fixture_rng(fixture),
+                                              fidelity=self.settings["background_fidelity"],
+                                              develop=not self.settings["batch_development"])
+                    week_results.append(result)
+                    # Develop the week's players together once its last fixture is played
+                    last_of_week = i + 1 == len(unplayed_fixtures) or unplayed_fixtures[i + 1]["week"] != fixture["week"]
+                    if last_of_week:
+                        if self.settings["batch_development"]:
+                            self.current_league.develop_week(fixture["week"], week_results)
+                        week_results = []
                     
                     # Record result
                     fixture['played'] = True
-                    fixture['score'] = (match.home_score, match.away_score)
+                    fixture['score'] = (result['home_score'], result['away_score'])
                     
                     # Update standings
                     self.current_league.update_standings(
                         fixture['home'],
                         fixture['away'],
-                        match.home_score,
-                        match.away_score
+                        result['home_score'],
+                        result['away_score']
                     )
                     
-                    print(f"Result: {fixture['home'].name} {match.home_score} - {match.away_score} {fixture['away'].name}")
+                    print(f"Result: {fixture['home'].name} {result['home_score']} - {result['away_score']} {fixture['away'].name}")
                 
                 print("\nAll remaining matches have been simulated!")
                 print("Starting new season...")
@@ -394,6 +415,11 @@ class Game:
                     return
             
         print(f"\nNext Match: {next_fixture['home'].name} vs {next_fixture['away'].name}")
+        prediction = predict(next_fixture['home'], next_fixture['away'],
+                             action_frequency=self.settings["match_action_frequency"])
+        print(f"Prediction: Home {prediction['home_win']:.0%} | Draw {prediction['draw']:.0%} | "
+              f"Away {prediction['away_win']:.0%} (expected goals {prediction['expected_goals'][0]:.1f} - "
+              f"{prediction['expected_goals'][1]:.1f})")
         input("Press Enter to start the match...")
         
         # First simulate all other matches for this week
@@ -402,7 +428,8 @@ class Game:
         # Then play our match
         match = Match(next_fixture['home'], next_fixture['away'], 
                      commentary_delay=self.settings["commentary_delay"],
-                     action_frequency=self.settings["match_action_frequency"])
+                     action_frequency=self.settings["match_action_frequency"],
+                     rng=self.current_league.fixture_rng(next_fixture))
         match.simulate()
         
         # Update fixture status and record result
@@ -421,18 +448,16 @@ class Game:
         self.youth_match_available = True
         
         # Silently simulate youth match in background
-        opponent_team = random.choice([t for t in self.current_league.teams if t != self.current_team])
-        opponent_youth = Team(f"{opponent_team.name} Youth", self.current_league.tier, is_youth_team=True, game=self)
+        opponent_team = self.rng.choice([t for t in self.current_league.teams if t != self.current_team])
+        opponent_youth = Team(f"{opponent_team.name} Youth", self.current_league.tier, is_youth_team=True, game=self, rng=self.rng)
         
         # Get starting eleven before match simulation
-        youth_starters = self.youth_team.get_starting_eleven()
+        youth_starters = self.youth_team.get_starting_eleven(rng=self.rng)
         
         # Simulate youth match without displaying any output
-        youth_match = Match(self.youth_team, opponent_youth,
-                          commentary_delay=0,  # No delay for background simulation
-                          action_frequency=self.settings["match_action_frequency"],
-                          silent=True)
-        youth_match.simulate()
+        simulate_fixture(self.youth_team, opponent_youth,
+                         action_frequency=self.settings["match_action_frequency"],
+                         rng=self.rng)
         
         input("\nPress Enter to continue...")
 
@@ -443,26 +468,32 @@ class Game:
         
         if other_fixtures:
             print(f"\nSimulating other Week {week} matches...")
+            week_results = []
             for fixture in other_fixtures:
-                match = Match(fixture['home'], fixture['away'], 
-                            commentary_delay=0,  # No delay for other matches
-                            action_frequency=self.settings["match_action_frequency"])
-                match.simulate()
+                result = simulate_fixture(fixture['home'], fixture['away'],
+                                          action_frequency=self.settings["match_action_frequency"],
+                                          rng=self.current_league.fixture_rng(fixture),
+                                          fidelity=self.settings["background_fidelity"],
+                                          develop=not self.settings["batch_development"])
+                week_results.append(result)
                 
                 fixture['played'] = True
-                fixture['score'] = (match.home_score, match.away_score)
+                fixture['score'] = (result['home_score'], result['away_score'])
                 self.current_league.update_standings(
                     fixture['home'],
                     fixture['away'],
-                    match.home_score,
-                    match.away_score
+                    result['home_score'],
+                    result['away_score']
                 )
-                print(f"{fixture['home'].name} {match.home_score} - {match.away_score} {fixture['away'].name}")
+                print(f"{fixture['home'].name} {result['home_score']} - {result['away_score']} {fixture['away'].name}")
+            if self.settings["batch_development"]:
+                self.current_league.develop_week(week, week_results)
 
     def _simulate_week(self):
         """Simulates all matches for the current week"""
         current_week = self.current_league.current_week + 1
-        results = self.current_league.simulate_week(current_week)
+        results = self.current_league.simulate_week(current_week,
+                                                    batch_development=self.settings["batch_development"])
         
         if results:
             print(f"\nWeek {current_week} Results:")
@@ -489,7 +520,7 @@ class Game:
         # First check for players who might leave
         at_risk_players = []
         for player in self.youth_team.players:
-            will_leave, reason = player.might_leave_youth_team()
+            will_leave, reason = player.might_leave_youth_team(rng=self.rng)
             if will_leave:
                 at_risk_players.append((player, reason))
         
@@ -517,7 +548,7 @@ class Game:
                         print(f"\n{Fore.GREEN}{player.name} has been promoted to the first team!{Style.RESET_ALL}")
                         
                         # Determine number of new youth players (chance for multiple)
-                        rand_val = random.random()
+                        rand_val = self.rng.random()
                         num_new_players = 1
                         if rand_val < 0.15:  # 15% chance for 3 players
                             num_new_players = 3
@@ -526,7 +557,7 @@ class Game:
                         
                         # Generate new youth players
                         for _ in range(num_new_players):
-                            new_player = Player(player.position, youth=True, league_tier=self.current_league.tier)
+                            new_player = Player(player.position, youth=True, league_tier=self.current_league.tier, rng=self.rng, name=self.names.full_name())
                             self.youth_team.add_player(new_player)
                             if num_new_players == 1:
                                 print(f"{Fore.CYAN}A new youth player, {new_player.name}, has joined the academy as a {new_player.position.value}!{Style.RESET_ALL}")
@@ -605,6 +636,8 @@ class Game:
             print("Current Settings:")
             print(f"1. Match Action Frequency: Every {self.settings['match_action_frequency']} minute(s)")
             print(f"2. Commentary Delay: {self.settings['commentary_delay']} second(s)")
+            print(f"3. Other Matches: {'Quick results' if self.settings['background_fidelity'] == 'analytic' else 'Full simulation'}")
+            print(f"4. Other Matches' Development: {'Once per week' if self.settings['batch_development'] else 'After every match'}")
             print("\n0. Back to Main Menu")
             
             choice = input("\nEnter your choice (or 0 to return): ")
@@ -615,6 +648,10 @@ class Game:
                 self._set_match_frequency()
             elif choice == "2":
                 self._set_commentary_delay()
+            elif choice == "3":
+                self._toggle_background_fidelity()
+            elif choice == "4":
+                self._toggle_batch_development()
 
     def _set_match_frequency(self):
         """Sets how often match actions occur"""
@@ -646,6 +683,25 @@ class Game:
             except ValueError:
                 print("Please enter a valid number")
 
+    def _toggle_background_fidelity(self):
+        """Switches other fixtures between full simulation and quick analytic results"""
+        if self.settings["background_fidelity"] == "analytic":
+            self.settings["background_fidelity"] = "full"
+            print("\nOther matches will be fully simulated (players develop from them)")
+        else:
+            self.settings["background_fidelity"] = "analytic"
+            print("\nOther matches will use quick results (no player statistics or development)")
+        input("Press Enter to continue...")
+
+    def _toggle_batch_development(self):
+        """Switches other fixtures between developing players after every match and once per week"""
+        self.settings["batch_development"] = not self.settings["batch_development"]
+        if self.settings["batch_development"]:
+            print("\nPlayers in other matches will develop once per week, all at once (faster)")
+        else:
+            print("\nPlayers in other matches will develop after every match")
+        input("Press Enter to continue...")
+
     def _watch_random_youth_game(self):
         """Allows player to watch a random youth game and potentially sign players"""
         self._clear_screen()
@@ -663,20 +719,20 @@ class Game:
             input("Press Enter to continue...")
             return
             
-        team1, team2 = random.sample(available_teams, 2)
-        youth_team1 = Team(f"{team1.name} Youth", self.current_league.tier, is_youth_team=True, game=self)
-        youth_team2 = Team(f"{team2.name} Youth", self.current_league.tier, is_youth_team=True, game=self)
+        team1, team2 = self.rng.sample(available_teams, 2)
+        youth_team1 = Team(f"{team1.name} Youth", self.current_league.tier, is_youth_team=True, game=self, rng=self.rng)
+        youth_team2 = Team(f"{team2.name} Youth", self.current_league.tier, is_youth_team=True, game=self, rng=self.rng)
         
         # Determine which teams (if any) are willing to let players go (65% chance each)
-        team1_willing = random.random() < 0.65
-        team2_willing = random.random() < 0.65
+        team1_willing = self.rng.random() < 0.65
+        team2_willing = self.rng.random() < 0.65
         
         print(f"\nMatch: {youth_team1.name} vs {youth_team2.name}")
         input("Press Enter to start the match...")
         
         # Get starting elevens before match simulation
-        team1_starters = youth_team1.get_starting_eleven()
-        team2_starters = youth_team2.get_starting_eleven()
+        team1_starters = youth_team1.get_starting_eleven(rng=self.rng)
+        team2_starters = youth_team2.get_starting_eleven(rng=self.rng)
         all_starters = team1_starters + team2_starters
         
         # Initialize scouting attributes for players if they don't exist
@@ -691,7 +747,8 @@ class Game:
         # Simulate the match
         match = Match(youth_team1, youth_team2,
                      commentary_delay=self.settings["commentary_delay"],
-                     action_frequency=self.settings["match_action_frequency"])
+                     action_frequency=self.settings["match_action_frequency"],
+                     rng=self.rng)
         match.simulate()
         
         # After match, update scouting information for all players who played
@@ -941,8 +998,9 @@ class Game:
         
         # Check for retirements
         retired_players = []
-        for player in self.current_team.players:
-            should_retire, reason = player.check_retirement()
+        # Nobody under 32 retires, so only older players need the full check
+        for player in world_store.older_than(self.current_team.players, 32):
+            should_retire, reason = player.check_retirement(rng=self.rng)
             if should_retire:
                 retired_players.append((player, reason))
         
@@ -972,7 +1030,7 @@ class Game:
                 "yellow_cards": 0,
                 "red_cards": 0
             }
-            player.season_ratings = []
+            player.rating_history.new_season()
             player.season_start_rating = player.overall_rating  # Set season start rating to current overall rating
             
         # Generate replacement players for retired positions
@@ -987,19 +1045,18 @@ class Game:
             for position, count in positions_needed.items():
                 for _ in range(count):
                     # Generate a replacement player aged 20-24
-                    new_player = Player(position, age=random.randint(20, 24), league_tier=self.current_team.tier)
+                    new_player = Player(position, age=self.rng.randint(20, 24), league_tier=self.current_team.tier, rng=self.rng, name=self.names.full_name())
                     new_player.season_start_rating = new_player.overall_rating  # Set season start rating for new players
                     self.current_team.players.append(new_player)
                     print(f"Signed {new_player.name} ({new_player.age}) - {position.value}")
         
         # Age all players by 1 year
-        for player in self.current_team.players:
-            player.age += 1
+        world_store.age_players(self.current_team.players)
         
         # Check youth players who might leave
         departed_youth = []
         for player in self.youth_team.players:
-            should_leave, reason = player.might_leave_youth_team()
+            should_leave, reason = player.might_leave_youth_team(rng=self.rng)
             if should_leave:
                 departed_youth.append((player, reason))
         
@@ -1014,8 +1071,8 @@ class Game:
         min_youth_players = 15
         while len(self.youth_team.players) < min_youth_players:
             # Randomly choose a position that needs filling
-            position = random.choice(list(Position))
-            new_player = Player(position, youth=True, league_tier=self.current_team.tier)
+            position = self.rng.choice(list(Position))
+            new_player = Player(position, youth=True, league_tier=self.current_team.tier, rng=self.rng, name=self.names.full_name())
             new_player.season_start_rating = new_player.overall_rating  # Set season start rating for new youth players
             self.youth_team.players.append(new_player)
             print(f"New youth player joined the academy: {new_player.name} ({new_player.age}) - {position.value}")
@@ -1,16 +1,18 @@
 from team import Team
-import random
+from seeding import make_rng, make_generator
 from itertools import combinations
 from datetime import datetime, timedelta
 
 class League:
-    def __init__(self, name, tier):
+    def __init__(self, name, tier, seed=None):
         self.name = name
         self.tier = tier
         self.teams = []
         self.fixtures = []
         self.current_week = 0
         self.standings = {}
+        self.seed = seed  # World seed for reproducible fixtures and results
+        self.season = 0
         
     def add_team(self, team):
         """Adds a team to the league"""
@@ -32,6 +34,8 @@ class League:
             
         # Clear existing fixtures
         self.fixtures = []
+        self.season += 1
+        rng = make_rng(self.seed, self.name, self.season, "fixtures")
             
         # Generate all possible combinations of teams
         matches = list(combinations(self.teams, 2))
@@ -59,7 +63,7 @@ class League:
             })
             
         # Shuffle fixtures
-        random.shuffle(all_fixtures)
+        rng.shuffle(all_fixtures)
         
         # Calculate total weeks needed (each team plays every other team twice)
         total_weeks = (len(self.teams) - 1) * 2  # Each team plays every other team twice
@@ -101,6 +105,10 @@ class League:
         # Sort fixtures by week
         self.fixtures.sort(key=lambda x: x["week"])
         
+        # Give every fixture a stable id for its random stream
+        for fixture_id, fixture in enumerate(self.fixtures):
+            fixture["id"] = fixture_id
+        
         # Verify fixture distribution
         for team in self.teams:
             team_fixtures = self.get_team_fixtures(team)
@@ -109,6 +117,10 @@ class League:
                 print(f"Warning: {team.name} has {len(team_fixtures)} fixtures, expected {expected_fixtures}")
                 print(f"Weeks played: {[f['week'] for f in team_fixtures]}")
         
+    def fixture_rng(self, fixture):
+        """Returns the random stream for a fixture, derived from the world seed and fixture id"""
+        return make_rng(self.seed, self.name, self.season, fixture["id"])
+        
     def get_week_fixtures(self, week):
         """Returns fixtures for a specific week"""
         return [f for f in self.fixtures if f["week"] == week]
@@ -173,38 +185,61 @@ class League:
                   f"{team['goals_for']:2}   {team['goals_against']:2}   "
                   f"{team['goal_difference']:3}   {team['points']:2}")
             
-    def simulate_week(self, week):
-        """Simulates all matches for a given week"""
-        fixtures = self.get_week_fixtures(week)
+    def simulate_week(self, week, fidelity="full", parallel=False, batch_development=False):
+        """
+        Simulates all matches for a given week, at the given fidelity (see simulate_fixture).
+        With parallel the fixtures are played in worker processes, giving the same results
+        as playing them one by one. batch_development develops the players of serially
+        played fixtures all at once after the week (see develop_week) instead of after
+        each match.
+        """
+        fixtures = [f for f in self.get_week_fixtures(week) if not f["played"]]
         results = []
         
-        for fixture in fixtures:
-            if not fixture["played"]:
-                # Simulate match
-                from match import Match
-                match = Match(fixture["home"], fixture["away"])
-                match.simulate()
-                
-                # Record result
-                fixture["played"] = True
-                fixture["score"] = (match.home_score, match.away_score)
-                
-                # Update standings
-                self.update_standings(
-                    fixture["home"],
-                    fixture["away"],
-                    match.home_score,
-                    match.away_score
-                )
-                
-                results.append({
-                    "home": fixture["home"].name,
-                    "away": fixture["away"].name,
-                    "score": fixture["score"]
-                })
+        if parallel and fidelity == "full":
+            from parallel import simulate_fixtures_parallel
+            match_results = simulate_fixtures_parallel([(f["home"], f["away"], self.fixture_rng(f))
+                                                        for f in fixtures])
+        else:
+            from match import simulate_fixture
+            match_results = [simulate_fixture(f["home"], f["away"], rng=self.fixture_rng(f), fidelity=fidelity,
+                                              develop=not batch_development)
+                             for f in fixtures]
+            if batch_development:
+                self.develop_week(week, match_results)
+        
+        for fixture, result in zip(fixtures, match_results):
+            # Record result
+            fixture["played"] = True
+            fixture["score"] = (result["home_score"], result["away_score"])
+            
+            # Update standings
+            self.update_standings(
+                fixture["home"],
+                fixture["away"],
+                result["home_score"],
+                result["away_score"]
+            )
+            
+            results.append({
+                "home": fixture["home"].name,
+                "away": fixture["away"].name,
+                "score": fixture["score"]
+            })
                 
         return results
         
+    def develop_week(self, week, match_results):
+        """
+        Develops every player rated in a week's match results with vectorized steps
+        (development.develop_matchweek), from the week's own random streams. The results
+        must come from matches played with develop off.
+        """
+        from development import develop_matchweek
+        performances = [pair for result in match_results for pair in result["player_ratings"].items()]
+        develop_matchweek(performances, rng=make_generator(self.seed, self.name, self.season, "development", week),
+                        player_rng=make_rng(self.seed, self.name, self.season, "development", week))
+
     def get_next_fixture(self, team):
         """Returns the next unplayed fixture for a team"""
         team_fixtures = self.get_team_fixtures(team)
@@ -1,15 +1,124 @@
 import random
-import time
+from bisect import bisect
+from enum import IntEnum
+from itertools import accumulate
+from operator import itemgetter
 from colorama import Fore, Style
-from player import Player, Position, Personality
+from player import Player, Position, Personality, Attr
+from commentary import LiveMatchRunner
+
+# Lineup sides, in slot order
+HOME, AWAY = 0, 1
+
+# Field attributes read by the match rules, in snapshot tuple order
+ATTRIBUTES = [
+    "finishing", "attacking_iq", "passing", "playmaking", "dribbling",
+    "dribbling_skills", "long_balls", "accuracy", "speed", "tackling",
+    "defensive_iq", "strength", "jumping", "midfield_iq", "stamina",
+    "off_ball_movement"
+]
+ATTR = {attr: i for i, attr in enumerate(ATTRIBUTES)}
+(FINISHING, ATTACKING_IQ, PASSING, PLAYMAKING, DRIBBLING, DRIBBLING_SKILLS, LONG_BALLS, ACCURACY,
+ SPEED, TACKLING, DEFENSIVE_IQ, STRENGTH, JUMPING, MIDFIELD_IQ, STAMINA, OFF_BALL_MOVEMENT) = range(len(ATTRIBUTES))
+
+# Reads the ATTRIBUTES values out of a player's attribute row
+read_match_attributes = itemgetter(*(Attr[attr.upper()] for attr in ATTRIBUTES))
+
+# Match statistics counted per starter
+STATS = ["passes_attempted", "passes_completed", "shots", "shots_on_target",
+         "goals", "assists", "tackles_won"]
+(PASSES_ATTEMPTED, PASSES_COMPLETED, SHOTS, SHOTS_ON_TARGET, GOALS, ASSISTS, TACKLES_WON) = range(len(STATS))
+
+
+def _rating_change(action_type, success):
+    """Returns the signed rating impact of an action, as Player.update_match_rating applies it"""
+    impact = Player.rating_impacts.get(action_type, 0)
+    return impact if success else -abs(impact)
+
+
+class EventCode(IntEnum):
+    GOAL = 0
+    GOAL_ASSISTED = 1
+    SHOT_SAVED = 2
+    SHOT_WIDE = 3
+    LONG_PASS = 4
+    THROUGH_BALL = 5
+    PASS = 6
+    PASS_INTERCEPTED = 7
+    DRIBBLE_PAST = 8
+    TACKLE_WON = 9
+    LONG_BALL = 10
+    LONG_BALL_INTERCEPTED = 11
 
 class MatchEvent:
-    def __init__(self, minute, description, player=None, team=None, event_type=None):
+    """A match event kept as a code plus references; the description is only built when read"""
+    __slots__ = ("minute", "code", "player", "other_player", "team", "display")
+
+    # Commentary templates filled in with the displayed player names
+    templates = {
+        EventCode.GOAL: Fore.GREEN + "GOAL! {player} scores!" + Style.RESET_ALL,
+        EventCode.GOAL_ASSISTED: Fore.GREEN + "GOAL! {player} scores! Assisted by {other}" + Style.RESET_ALL,
+        EventCode.SHOT_SAVED: "Shot on target by {player}, but saved!",
+        EventCode.SHOT_WIDE: "Shot by {player} goes wide!",
+        EventCode.LONG_PASS: "Long pass from {player} finds {other}",
+        EventCode.THROUGH_BALL: "Great through ball from {player} to {other}",
+        EventCode.PASS: "Nice pass from {player} to {other}",
+        EventCode.PASS_INTERCEPTED: "{player}'s pass is intercepted",
+        EventCode.DRIBBLE_PAST: "{player} skillfully dribbles past {other}",
+        EventCode.TACKLE_WON: "{player} wins the ball from {other}",
+        EventCode.LONG_BALL: "Excellent long ball from {player} finds {other}",
+        EventCode.LONG_BALL_INTERCEPTED: "{player}'s long ball is intercepted"
+    }
+
+    # Completed short passes, the only events that can set up an assist
+    pass_codes = frozenset([EventCode.LONG_PASS, EventCode.THROUGH_BALL, EventCode.PASS])
+
+    def __init__(self, minute, code, player=None, other_player=None, team=None, display=None):
         self.minute = minute
-        self.description = description
+        self.code = code
         self.player = player
+        self.other_player = other_player
         self.team = team
-        self.event_type = event_type
+        self.display = display  # Callable turning a player into display text
+
+    @property
+    def event_type(self):
+        return "pass" if self.code in self.pass_codes else None
+
+    @property
+    def description(self):
+        display = self.display or (lambda player: player.name)
+        other = display(self.other_player) if self.other_player is not None else ""
+        return self.templates[self.code].format(player=display(self.player), other=other)
+
+class AliasTable:
+    """Walker alias table for O(1) sampling from a discrete distribution"""
+    def __init__(self, weights):
+        size = len(weights)
+        total = sum(weights)
+        scaled = [weight * size / total for weight in weights]
+        self.size = size
+        self.prob = [1.0] * size
+        self.alias = list(range(size))
+        
+        # Pair each under-full column with an over-full one
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            short, full = small.pop(), large.pop()
+            self.prob[short] = scaled[short]
+            self.alias[short] = full
+            scaled[full] += scaled[short] - 1.0
+            if scaled[full] < 1.0:
+                small.append(full)
+            else:
+                large.append(full)
+
+    def sample(self, u):
+        """Returns an index using a single uniform random number in [0, 1)"""
+        scaled = u * self.size
+        index = int(scaled)
+        return index if scaled - index < self.prob[index] else self.alias[index]
 
 class Match:
     # Position distances from goal (0 = very close, 1 = very far)
@@ -25,9 +134,103 @@ class Match:
         Position.GK: 1.0
     }
 
-    def __init__(self, home_team, away_team, commentary_delay=2, action_frequency=1, silent=False):
+    # Base action probabilities based on position
+    action_probabilities = {
+        Position.ST: {"shoot": 0.4, "pass": 0.3, "dribble": 0.2, "long_ball": 0.1},
+        Position.LW: {"shoot": 0.3, "pass": 0.3, "dribble": 0.3, "long_ball": 0.1},
+        Position.RW: {"shoot": 0.3, "pass": 0.3, "dribble": 0.3, "long_ball": 0.1},
+        Position.CAM: {"shoot": 0.2, "pass": 0.4, "dribble": 0.3, "long_ball": 0.1},
+        Position.CM: {"shoot": 0.1, "pass": 0.5, "dribble": 0.2, "long_ball": 0.2},
+        Position.CDM: {"shoot": 0.05, "pass": 0.5, "dribble": 0.15, "long_ball": 0.3},
+        Position.WB: {"shoot": 0.05, "pass": 0.5, "dribble": 0.25, "long_ball": 0.2},
+        Position.CB: {"shoot": 0.02, "pass": 0.48, "dribble": 0.2, "long_ball": 0.3},
+        Position.GK: {"shoot": 0.0, "pass": 0.6, "dribble": 0.1, "long_ball": 0.3}
+    }
+
+    # Actions a player can take on the ball, in decision table order
+    actions = ("shoot", "pass", "dribble", "long_ball")
+
+    # Action probability multipliers based on personality
+    personality_action_modifiers = {
+        Personality.MAVERICK: {"shoot": 1.5, "dribble": 1.5, "pass": 0.7, "long_ball": 0.7},
+        Personality.HEARTBEAT: {"pass": 1.5, "long_ball": 1.5, "shoot": 0.7, "dribble": 0.7},
+        Personality.VITROSO: {"pass": 1.3, "dribble": 1.2, "long_ball": 0.7}
+    }
+
+    # Signed rating impact of every (action, success) pair the match rates
+    rating_changes = {
+        (action, success): _rating_change(action, success)
+        for action in list(Player.rating_impacts) + ["successful_dribble", "failed_dribble"]
+        for success in (True, False)
+    }
+
+    # Attributes boosted for high potential youth players (goalkeeping attributes
+    # are not read by the match rules, so goalkeepers need no entry)
+    youth_boost_attributes = {
+        Position.CB: ["tackling", "defensive_iq", "strength", "jumping"],
+        Position.WB: ["tackling", "defensive_iq", "strength", "jumping"],
+        Position.CDM: ["playmaking", "passing", "midfield_iq", "stamina"],
+        Position.CM: ["playmaking", "passing", "midfield_iq", "stamina"],
+        Position.CAM: ["dribbling", "passing", "attacking_iq", "speed", "off_ball_movement"],
+        Position.LW: ["dribbling", "passing", "attacking_iq", "speed", "off_ball_movement"],
+        Position.RW: ["dribbling", "passing", "attacking_iq", "speed", "off_ball_movement"],
+        Position.ST: ["finishing", "attacking_iq", "dribbling_skills", "off_ball_movement"]
+    }
+
+    # Position-based passing preferences (passer position -> receiver position -> weight)
+    pass_preferences = {
+        Position.GK: {
+            Position.CB: 2.0, Position.WB: 1.5, Position.CDM: 1.2,
+            Position.CM: 0.8, Position.CAM: 0.4, Position.LW: 0.3,
+            Position.RW: 0.3, Position.ST: 0.2, Position.GK: 0.1
+        },
+        Position.CB: {
+            Position.WB: 1.8, Position.CDM: 1.5, Position.CM: 1.2,
+            Position.CAM: 0.8, Position.LW: 0.6, Position.RW: 0.6,
+            Position.ST: 0.4, Position.GK: 0.3, Position.CB: 0.5
+        },
+        Position.WB: {
+            Position.CM: 1.5, Position.CAM: 1.3, Position.LW: 1.3,
+            Position.RW: 1.3, Position.CDM: 1.2, Position.ST: 1.0,
+            Position.CB: 0.8, Position.GK: 0.3, Position.WB: 0.5
+        },
+        Position.CDM: {
+            Position.CM: 1.8, Position.WB: 1.5, Position.CAM: 1.3,
+            Position.LW: 1.0, Position.RW: 1.0, Position.ST: 0.8,
+            Position.CB: 0.7, Position.GK: 0.2, Position.CDM: 0.6
+        },
+        Position.CM: {
+            Position.CAM: 1.8, Position.LW: 1.5, Position.RW: 1.5,
+            Position.ST: 1.3, Position.WB: 1.2, Position.CDM: 1.0,
+            Position.CB: 0.6, Position.GK: 0.2, Position.CM: 0.8
+        },
+        Position.CAM: {
+            Position.ST: 2.0, Position.LW: 1.8, Position.RW: 1.8,
+            Position.CM: 1.2, Position.WB: 1.0, Position.CDM: 0.8,
+            Position.CB: 0.4, Position.GK: 0.1, Position.CAM: 0.7
+        },
+        Position.LW: {
+            Position.ST: 2.0, Position.CAM: 1.5, Position.CM: 1.2,
+            Position.RW: 1.0, Position.WB: 0.8, Position.CDM: 0.6,
+            Position.CB: 0.4, Position.GK: 0.1, Position.LW: 0.5
+        },
+        Position.RW: {
+            Position.ST: 2.0, Position.CAM: 1.5, Position.CM: 1.2,
+            Position.LW: 1.0, Position.WB: 0.8, Position.CDM: 0.6,
+            Position.CB: 0.4, Position.GK: 0.1, Position.RW: 0.5
+        },
+        Position.ST: {
+            Position.CAM: 1.5, Position.LW: 1.3, Position.RW: 1.3,
+            Position.CM: 1.0, Position.WB: 0.7, Position.CDM: 0.5,
+            Position.CB: 0.3, Position.GK: 0.1, Position.ST: 0.4
+        }
+    }
+
+    def __init__(self, home_team, away_team, commentary_delay=2, action_frequency=1, silent=False, rng=None,
+                 profiler=None, develop=True):
         self.home_team = home_team
         self.away_team = away_team
+        self.teams = (home_team, away_team)
         self.home_score = 0
         self.away_score = 0
         self.minute = 0
@@ -35,611 +238,587 @@ class Match:
         self.action_frequency = action_frequency
         self.events = []
         self.silent = silent  # New flag for silent simulation
+        self.event_display = self._get_player_display  # Shared by events to render names lazily
+        self.rng = rng or random  # Injectable random stream for reproducible matches
+        self.committed = False
+        self.develop = develop  # False leaves development to the caller, e.g. batched per matchweek
         
         # Team colors
         self.home_color = Fore.BLUE
         self.away_color = Fore.RED
         
-        # Match state
-        self.possession_team = None
-        self.player_with_ball = None
-        self.last_action = None
+        # Match state: side in possession and lineup slot of the ball carrier
+        self.possession = HOME
+        self.ball = None
         
         # Initialize player positions and states
-        self.home_players = home_team.get_starting_eleven()
-        self.away_players = away_team.get_starting_eleven()
-        
-        # Store original attributes for restoration after match
-        self.original_attributes = {}
+        self.home_players = home_team.get_starting_eleven(rng=self.rng)
+        self.away_players = away_team.get_starting_eleven(rng=self.rng)
         
-        # Initialize player ratings dictionary
+        # Final ratings by player, filled in at the final whistle
         self.player_ratings = {}
         
-        # Apply temporary boosts for high potential youth players
-        self._apply_youth_potential_boosts()
+        # Snapshot the lineups so the match never writes to a Player until commit()
+        self._snapshot_lineups()
         
-        # Reset match stats
-        for player in self.home_players + self.away_players:
-            for stat in player.stats:
-                player.stats[stat] = 0
+        # Precompile action decisions and passes now that lineup attributes are fixed
+        self._build_decision_tables()
+        self._build_pass_tables()
+        self._build_receiver_samplers()
+        self._build_player_pools()
+        self._build_outcome_tables()
+        
+        # Opt-in hot-path timing (see profiling.MatchProfiler)
+        if profiler is not None:
+            profiler.attach(self)
 
-    def _apply_youth_potential_boosts(self):
-        """Applies temporary attribute boosts to high potential youth players"""
-        for player in self.home_players + self.away_players:
-            if player.youth and player.true_potential > 86:
-                # Store original attributes
-                self.original_attributes[player] = {
-                    attr: value for attr, value in player.attributes.items()
-                }
-                if player.position == Position.GK:
-                    self.original_attributes[player].update({
-                        attr: value for attr, value in player.gk_attributes.items()
-                    })
-                
-                # Calculate boost based on potential
-                boost_amount = (player.true_potential - 86) * 2  # 2 point boost per potential point above 86
-                
-                # Apply position-specific boosts
-                if player.position == Position.GK:
-                    self._boost_goalkeeper_attributes(player, boost_amount)
-                elif player.position in [Position.CB, Position.WB]:
-                    self._boost_defender_attributes(player, boost_amount)
-                elif player.position in [Position.CDM, Position.CM]:
-                    self._boost_midfielder_attributes(player, boost_amount)
-                elif player.position in [Position.CAM, Position.LW, Position.RW]:
-                    self._boost_attacking_midfielder_attributes(player, boost_amount)
-                elif player.position == Position.ST:
-                    self._boost_striker_attributes(player, boost_amount)
-
-    def _boost_goalkeeper_attributes(self, player, boost_amount):
-        """Boosts goalkeeper-specific attributes"""
-        boost_attrs = ["diving", "handling", "positioning"]
-        for attr in boost_attrs:
-            player.gk_attributes[attr] = min(99, player.gk_attributes[attr] + boost_amount)
-
-    def _boost_defender_attributes(self, player, boost_amount):
-        """Boosts defender-specific attributes"""
-        boost_attrs = ["tackling", "defensive_iq", "strength", "jumping"]
-        for attr in boost_attrs:
-            player.attributes[attr] = min(99, player.attributes[attr] + boost_amount)
-
-    def _boost_midfielder_attributes(self, player, boost_amount):
-        """Boosts midfielder-specific attributes"""
-        boost_attrs = ["playmaking", "passing", "midfield_iq", "stamina"]
-        for attr in boost_attrs:
-            player.attributes[attr] = min(99, player.attributes[attr] + boost_amount)
-
-    def _boost_attacking_midfielder_attributes(self, player, boost_amount):
-        """Boosts attacking midfielder-specific attributes"""
-        boost_attrs = ["dribbling", "passing", "attacking_iq", "speed", "off_ball_movement"]
-        for attr in boost_attrs:
-            player.attributes[attr] = min(99, player.attributes[attr] + boost_amount)
-
-    def _boost_striker_attributes(self, player, boost_amount):
-        """Boosts striker-specific attributes"""
-        boost_attrs = ["finishing", "attacking_iq", "dribbling_skills", "off_ball_movement"]
-        for attr in boost_attrs:
-            player.attributes[attr] = min(99, player.attributes[attr] + boost_amount)
+    def _snapshot_lineups(self):
+        """
+        Copies everything the match reads from its players into per-slot tuples and
+        creates match-local statistics, ratings and state. Home players take the first
+        slots and away players the rest.
+        """
+        self.lineup = self.home_players + self.away_players
+        self.sides = [HOME] * len(self.home_players) + [AWAY] * len(self.away_players)
+        self.positions = [player.position for player in self.lineup]
+        self.distances = [self.position_distances[position] for position in self.positions]
+        self.attributes = [self._match_attributes(player) for player in self.lineup]  # Effective, read-only
+        
+        self.stats = [[0] * len(STATS) for _ in self.lineup]
+        self.ratings = [6.0] * len(self.lineup)
+        self.open = [0.0] * len(self.lineup)  # How open each player is
+        self.on_run = [0.0] * len(self.lineup)  # Run rating, 0 when not making a run
+        self.makes_runs = [position in [Position.ST, Position.LW, Position.RW, Position.CAM]
+                           for position in self.positions]
+        
+        # Most recent completed passer per side and the one before it, for assists
+        self.last_passer = [None, None]
+        self.previous_passer = [None, None]
+
+    def _match_attributes(self, player):
+        """Returns the player's base attributes with their youth boost overlay applied, as a tuple"""
+        base = read_match_attributes(player.attribute_values.tolist())
+        deltas = self.youth_boost_deltas(player)
+        if deltas is None:
+            return base
+        return tuple(value + delta for value, delta in zip(base, deltas))
+
+    @classmethod
+    def youth_boost_deltas(cls, player):
+        """
+        Returns the per-match boost of a high potential youth player as a delta vector
+        in ATTRIBUTES order, or None when the player isn't boosted. The player's own
+        attributes are never touched, so a boost can't outlive the match.
+        """
+        if not (player.youth and player.true_potential > 86):
+            return None
+        
+        # 2 point boost per potential point above 86, capped at 99
+        boost_amount = (player.true_potential - 86) * 2
+        deltas = [0] * len(ATTRIBUTES)
+        for attr in cls.youth_boost_attributes.get(player.position, []):
+            deltas[ATTR[attr]] = min(boost_amount, 99 - player.attributes[attr])
+        return tuple(deltas)
 
     def _get_player_display(self, player):
         """Returns player name with team name and position in team color"""
+        if self.silent:
+            # Nobody reads silent commentary, so skip the colorama formatting
+            return player.name
         is_home = player in self.home_players
         team_name = self.home_team.name if is_home else self.away_team.name
         team_color = self.home_color if is_home else self.away_color
         return f"{team_color}{player.name} ({player.position.abbreviation}, {team_name}){Style.RESET_ALL}"
 
+    @property
+    def possession_team(self):
+        return self.teams[self.possession]
+
+    @property
+    def player_with_ball(self):
+        return None if self.ball is None else self.lineup[self.ball]
+
     def simulate(self):
-        """Simulates the match and returns the result"""
+        """Simulates the match, commits the results to the players and returns the result"""
         # Store starting elevens for later reference
         self.team1_starters = self.home_players.copy()
         self.team2_starters = self.away_players.copy()
         
-        # Simulate the match
-        self._simulate_match()
-        
-        # Process improvements for all players who played
-        for player in self.team1_starters + self.team2_starters:
-            if player in self.player_ratings:
-                player.improve_from_match(self.player_ratings[player])
+        # Simulate the match, with paced commentary unless silent
+        if self.silent:
+            for _ in self.iter_events():
+                pass
+        else:
+            LiveMatchRunner(self, delay=self.commentary_delay).run()
         
+        self.commit()
         return self._get_match_result()
 
-    def _simulate_match(self):
-        """Simulates the entire match"""
-        try:
-            if not self.silent:
-                print(f"\n{Fore.CYAN}Match Starting: {self.home_color}{self.home_team.name}{Style.RESET_ALL} vs {self.away_color}{self.away_team.name}{Style.RESET_ALL}")
-                print("Press Enter at any time to skip to the end of the match...")
+    def iter_events(self):
+        """Simulates the match at full speed, yielding each event as it happens"""
+        # Determine initial possession
+        self.possession = self.rng.choice([HOME, AWAY])
+        self.ball = self._get_random_midfielder(self.possession)
+        
+        # Jump from one action minute to the next instead of ticking through all 90
+        minute = self._next_action_minute(0)
+        while minute <= 90:
+            self.minute = minute
+            first_event = len(self.events)
             
-            # Determine initial possession
-            self.possession_team = random.choice([self.home_team, self.away_team])
-            self.player_with_ball = self._get_random_midfielder(self.possession_team)
+            # Player states are only generated for minutes that use them; the
+            # opening minute plays from the kickoff state
+            if minute > 1:
+                self._update_player_states()
+            self._simulate_action()
             
-            import select
-            import sys
+            for i in range(first_event, len(self.events)):
+                yield self.events[i]
             
-            # Simulate 90 minutes
-            while self.minute < 90:
-                self.minute += 1
-                
-                # Check for Enter key press (skip to end) only if not silent
-                if not self.silent and sys.stdin in select.select([sys.stdin], [], [], 0)[0]:
-                    line = sys.stdin.readline()
-                    if line == '\n':
-                        if not self.silent:
-                            print(f"\n{Fore.YELLOW}Skipping to end of match...{Style.RESET_ALL}")
-                        # Simulate remaining minutes without commentary
-                        while self.minute < 90:
-                            self.minute += 1
-                            if self.minute % self.action_frequency == 0:
-                                self._simulate_action(skip_commentary=True)
-                            self._update_player_states()
-                        break
-                
-                if self.minute % self.action_frequency == 0:  # Action frequency based on settings
-                    self._simulate_action()
-                    
-                # Update player states
-                self._update_player_states()
-                
-            # Print final score only if not silent
-            if not self.silent:
-                self._print_final_score()
+            minute = self._next_action_minute(minute)
+        self.minute = 90
             
-        finally:
-            # Restore original attributes after match
-            self._restore_original_attributes()
+        # Work out the final ratings
+        self._finalize_ratings()
         
-    def _simulate_action(self, skip_commentary=False):
+    def _next_action_minute(self, minute):
+        """Returns the minute of the first action after the given minute"""
+        return (minute // self.action_frequency + 1) * self.action_frequency
+
+    def _simulate_action(self):
         """Simulates a single action in the match"""
-        if not self.player_with_ball:
+        if self.ball is None:
             return
             
         # Determine the defending player
         defender = self._get_closest_defender()
         
-        # Calculate pressure on the player
-        pressure = self._calculate_pressure(defender)
+        # Pressure on the player from the defender
+        pressure = self.pressure[defender]
         
         # Player decides action based on personality and pressure
         action = self._decide_action(pressure)
         
         # Execute the action
         if action == "shoot":
-            self._attempt_shot(skip_commentary)
+            self._attempt_shot()
         elif action == "pass":
-            self._attempt_pass(skip_commentary)
+            self._attempt_pass()
         elif action == "dribble":
-            self._attempt_dribble(defender, skip_commentary)
+            self._attempt_dribble(defender)
         elif action == "long_ball":
-            self._attempt_long_ball(skip_commentary)
+            self._attempt_long_ball()
 
-    def _decide_action(self, pressure):
-        """Decides what action to take based on position, attributes, personality and situation"""
-        player = self.player_with_ball
-        
-        # Base probabilities based on position
-        position_probs = {
-            Position.ST: {"shoot": 0.4, "pass": 0.3, "dribble": 0.2, "long_ball": 0.1},
-            Position.LW: {"shoot": 0.3, "pass": 0.3, "dribble": 0.3, "long_ball": 0.1},
-            Position.RW: {"shoot": 0.3, "pass": 0.3, "dribble": 0.3, "long_ball": 0.1},
-            Position.CAM: {"shoot": 0.2, "pass": 0.4, "dribble": 0.3, "long_ball": 0.1},
-            Position.CM: {"shoot": 0.1, "pass": 0.5, "dribble": 0.2, "long_ball": 0.2},
-            Position.CDM: {"shoot": 0.05, "pass": 0.5, "dribble": 0.15, "long_ball": 0.3},
-            Position.WB: {"shoot": 0.05, "pass": 0.5, "dribble": 0.25, "long_ball": 0.2},
-            Position.CB: {"shoot": 0.02, "pass": 0.48, "dribble": 0.2, "long_ball": 0.3},
-            Position.GK: {"shoot": 0.0, "pass": 0.6, "dribble": 0.1, "long_ball": 0.3}
-        }
+    def _build_decision_tables(self):
+        """
+        Precompiles cumulative action weights for every starter, keyed by pressure level.
+        Distance to goal depends only on the ball carrier's position, so it is folded in.
+        """
+        self.decision_tables = [
+            (self._action_weights(slot, high_pressure=False), self._action_weights(slot, high_pressure=True))
+            for slot in range(len(self.lineup))
+        ]
+
+    def _action_weights(self, slot, high_pressure):
+        """Returns cumulative action weights based on position, attributes, personality and situation"""
+        attrs = self.attributes[slot]
         
         # Get base probabilities for player's position
-        probs = position_probs[player.position].copy()
+        probs = self.action_probabilities[self.positions[slot]].copy()
         
         # Modify based on relevant attributes
         # Shooting probability affected by finishing and attacking_iq
-        shoot_skill = (player.attributes["finishing"] * 0.6 + 
-                      player.attributes["attacking_iq"] * 0.4) / 100.0
+        shoot_skill = (attrs[FINISHING] * 0.6 + 
+                      attrs[ATTACKING_IQ] * 0.4) / 100.0
         probs["shoot"] *= (0.5 + shoot_skill)
         
         # Passing probability affected by passing and playmaking
-        pass_skill = (player.attributes["passing"] * 0.5 + 
-                     player.attributes["playmaking"] * 0.5) / 100.0
+        pass_skill = (attrs[PASSING] * 0.5 + 
+                     attrs[PLAYMAKING] * 0.5) / 100.0
         probs["pass"] *= (0.5 + pass_skill)
         
         # Dribbling probability affected by dribbling and dribbling_skills
-        dribble_skill = (player.attributes["dribbling"] * 0.5 + 
-                        player.attributes["dribbling_skills"] * 0.5) / 100.0
+        dribble_skill = (attrs[DRIBBLING] * 0.5 + 
+                        attrs[DRIBBLING_SKILLS] * 0.5) / 100.0
         probs["dribble"] *= (0.5 + dribble_skill)
         
         # Long ball probability affected by long_balls and accuracy
-        long_ball_skill = (player.attributes["long_balls"] * 0.6 + 
-                          player.attributes["accuracy"] * 0.4) / 100.0
+        long_ball_skill = (attrs[LONG_BALLS] * 0.6 + 
+                          attrs[ACCURACY] * 0.4) / 100.0
         probs["long_ball"] *= (0.5 + long_ball_skill)
         
         # Modify based on personality
-        if player.personality == Personality.MAVERICK:
-            probs["shoot"] *= 1.5
-            probs["dribble"] *= 1.5
-            probs["pass"] *= 0.7
-            probs["long_ball"] *= 0.7
-        elif player.personality == Personality.HEARTBEAT:
-            probs["pass"] *= 1.5
-            probs["long_ball"] *= 1.5
-            probs["shoot"] *= 0.7
-            probs["dribble"] *= 0.7
-        elif player.personality == Personality.VITROSO:
-            probs["pass"] *= 1.3
-            probs["dribble"] *= 1.2
-            probs["long_ball"] *= 0.7
+        for action, modifier in self.personality_action_modifiers[self.lineup[slot].personality].items():
+            probs[action] *= modifier
             
         # Modify based on pressure and position
-        if pressure > 0.7:  # High pressure
+        if high_pressure:
             probs["pass"] *= 1.5
             probs["long_ball"] *= 1.3
             probs["dribble"] *= 0.6
             probs["shoot"] *= 0.7
             
         # Modify based on distance to goal
-        distance_to_goal = self._calculate_distance_to_goal()
+        distance_to_goal = self.distances[slot]
         if distance_to_goal < 0.2:  # Close to goal
             probs["shoot"] *= 2.0
         elif distance_to_goal > 0.7:  # Far from goal
             probs["shoot"] *= 0.3
             
-        # Normalize probabilities
-        total = sum(probs.values())
-        probs = {k: v/total for k, v in probs.items()}
-        
-        # Choose action
-        return random.choices(list(probs.keys()), list(probs.values()))[0]
+        # Cumulative weights in decision table order
+        return list(accumulate(probs[action] for action in self.actions))
+
+    def _decide_action(self, pressure):
+        """Decides what action to take from the player's precompiled decision table"""
+        cum_weights = self.decision_tables[self.ball][pressure > 0.7]
+        index = bisect(cum_weights, self.rng.random() * cum_weights[-1], 0, len(cum_weights) - 1)
+        return self.actions[index]
 
-    def _attempt_shot(self, skip_commentary=False):
+    def _build_outcome_tables(self):
+        """Precomputes each starter's pressure, shot, dribble and tackle chances"""
+        self.pressure, self.score_chance, self.dribble_chance, self.tackle_chance = [], [], [], []
+        for attrs, position, distance in zip(self.attributes, self.positions, self.distances):
+            base_pressure = (attrs[TACKLING] * 0.3 +
+                            attrs[DEFENSIVE_IQ] * 0.4 +
+                            attrs[SPEED] * 0.3) / 100.0
+            # Modify based on defender's position
+            if position in [Position.CB, Position.WB]:
+                base_pressure *= 1.2
+            self.pressure.append(min(1.0, base_pressure))
+            
+            # Base chance of scoring, modified by distance
+            score_chance = (attrs[FINISHING] * 0.5 + 
+                           attrs[ACCURACY] * 0.3 +
+                           attrs[ATTACKING_IQ] * 0.2) / 100.0
+            score_chance *= (1 - distance)
+            self.score_chance.append(score_chance)
+            
+            self.dribble_chance.append((attrs[DRIBBLING] * 0.4 + 
+                                        attrs[DRIBBLING_SKILLS] * 0.4 +
+                                        attrs[SPEED] * 0.2) / 100.0)
+            self.tackle_chance.append((attrs[TACKLING] * 0.4 +
+                                       attrs[DEFENSIVE_IQ] * 0.3 +
+                                       attrs[STRENGTH] * 0.3) / 100.0)
+
+    def _rate(self, slot, action_type, success):
+        """Applies an action's rating impact to a starter's match-local rating"""
+        self.ratings[slot] = max(1.0, min(10.0, self.ratings[slot] + self.rating_changes[action_type, success]))
+
+    def _attempt_shot(self):
         """Attempts a shot on goal"""
-        player = self.player_with_ball
-        distance = self._calculate_distance_to_goal()
-        
-        # Base chance of scoring
-        score_chance = (player.attributes["finishing"] * 0.5 + 
-                       player.attributes["accuracy"] * 0.3 +
-                       player.attributes["attacking_iq"] * 0.2) / 100.0
-                       
-        # Modify based on distance
-        score_chance *= (1 - distance)
+        shooter = self.ball
+        stats = self.stats[shooter]
         
         # Attempt the shot
-        player.stats["shots"] += 1
+        stats[SHOTS] += 1
         
-        if random.random() < score_chance:
+        if self.rng.random() < self.score_chance[shooter]:
             # Goal!
-            if self.possession_team == self.home_team:
+            if self.possession == HOME:
                 self.home_score += 1
             else:
                 self.away_score += 1
                 
-            player.stats["goals"] += 1
-            player.stats["shots_on_target"] += 1
-            player.update_match_rating("goal", True)  # Big boost for scoring
+            stats[GOALS] += 1
+            stats[SHOTS_ON_TARGET] += 1
+            self._rate(shooter, "goal", True)  # Big boost for scoring
             
-            # Find the last passer for assist
-            last_event = next((event for event in reversed(self.events) 
-                             if event.event_type == "pass" and event.team == self.possession_team 
-                             and event.player != player), None)
+            # The team's last completed passer other than the scorer gets the assist
+            assister = self.last_passer[self.possession]
+            if assister == shooter:
+                assister = self.previous_passer[self.possession]
             
-            if last_event and last_event.player:
-                last_event.player.stats["assists"] += 1
-                last_event.player.update_match_rating("assist", True)  # Boost for assist
-                self._add_event(f"{Fore.GREEN}GOAL! {self._get_player_display(player)} scores! Assisted by {self._get_player_display(last_event.player)}{Style.RESET_ALL}", skip_commentary)
+            if assister is not None:
+                self.stats[assister][ASSISTS] += 1
+                self._rate(assister, "assist", True)  # Boost for assist
+                self._add_event(EventCode.GOAL_ASSISTED, shooter, assister)
             else:
-                self._add_event(f"{Fore.GREEN}GOAL! {self._get_player_display(player)} scores!{Style.RESET_ALL}", skip_commentary)
+                self._add_event(EventCode.GOAL, shooter)
         else:
             # Miss or save
-            if random.random() < 0.5:  # Shot on target but saved
-                player.stats["shots_on_target"] += 1
-                player.update_match_rating("shot_on_target", True)
-                self._add_event(f"Shot on target by {self._get_player_display(player)}, but saved!", skip_commentary)
+            if self.rng.random() < 0.5:  # Shot on target but saved
+                stats[SHOTS_ON_TARGET] += 1
+                self._rate(shooter, "shot_on_target", True)
+                self._add_event(EventCode.SHOT_SAVED, shooter)
             else:  # Shot off target
-                player.update_match_rating("shot_off_target", False)
-                self._add_event(f"Shot by {self._get_player_display(player)} goes wide!", skip_commentary)
+                self._rate(shooter, "shot_off_target", False)
+                self._add_event(EventCode.SHOT_WIDE, shooter)
                 
         # Reset possession
         self._switch_possession()
 
-    def _attempt_pass(self, skip_commentary=False):
+    def _build_pass_tables(self):
+        """
+        Precomputes the static part of every pass for both lineups: the receivers,
+        their position preference, long-ball and forward-progression weights, and
+        the base success chance. Only the open/on_run terms are applied at pass time.
+        """
+        self.pass_tables = [None] * len(self.lineup)
+        for side in (HOME, AWAY):
+            lineup = [(slot, self.positions[slot], self.distances[slot], self.attributes[slot])
+                      for slot in range(len(self.lineup)) if self.sides[slot] == side]
+            for passer, passer_position, passer_pos, attrs in lineup:
+                preferences = self.pass_preferences.get(passer_position, {})
+                long_pass_ability = (attrs[LONG_BALLS] + attrs[ACCURACY]) / 200.0
+                short_pass_chance = (attrs[PASSING] * 0.4 + 
+                                     attrs[ACCURACY] * 0.3 +
+                                     attrs[PLAYMAKING] * 0.3) / 100.0
+                # Reward passes that move the ball forward (except for forwards who might need to pass back)
+                rewards_progression = passer_position not in [Position.ST, Position.LW, Position.RW]
+                
+                receivers, weights, base_success, run_factors = [], [], [], []
+                for receiver, receiver_position, receiver_pos, receiver_attrs in lineup:
+                    if receiver == passer:
+                        continue
+                    
+                    # Position preference, with a fallback weight for unknown combinations
+                    weight = preferences.get(receiver_position, 0.5)
+                    pass_chance = short_pass_chance
+                    
+                    if abs(passer_pos - receiver_pos) > 0.4:  # Long pass
+                        # Reduce weight if player has poor long passing
+                        weight *= long_pass_ability
+                        # Use long_balls attribute for long passes
+                        pass_chance = (attrs[LONG_BALLS] * 0.5 + 
+                                       attrs[ACCURACY] * 0.3 +
+                                       receiver_attrs[JUMPING] * 0.2) / 100.0
+                    
+                    if rewards_progression and receiver_pos < passer_pos:  # Ball moving forward
+                        weight *= 1.3
+                    
+                    receivers.append(receiver)
+                    weights.append(weight)
+                    base_success.append(pass_chance)
+                    # Receiver's pace matters when the pass finds them on a run
+                    run_factors.append(0.8 + (receiver_attrs[SPEED] / 100.0) * 0.4)
+                
+                # Forwards and attacking midfielders prefer passing to running players
+                prefers_runs = passer_position in [Position.CAM, Position.CM, Position.LW, Position.RW]
+                self.pass_tables[passer] = (receivers, weights, base_success, run_factors, prefers_runs)
+
+    def _build_player_pools(self):
+        """Prebuilds the pressing defender, restart player and long ball target pools for each side"""
+        def slots(side, positions=None):
+            return [slot for slot in range(len(self.lineup))
+                    if self.sides[slot] == side and (positions is None or self.positions[slot] in positions)]
+        
+        # Prioritize defenders and defensive midfielders when pressing, keyed by the side in possession
+        self.pressing_defenders = [
+            slots(AWAY, [Position.CB, Position.WB, Position.CDM]) or slots(AWAY),
+            slots(HOME, [Position.CB, Position.WB, Position.CDM]) or slots(HOME)
+        ]
+        # Play restarts from a midfielder
+        self.restart_players = [
+            slots(side, [Position.CM, Position.CDM, Position.CAM]) or slots(side) for side in (HOME, AWAY)
+        ]
+        # Long balls are aimed at the forwards
+        self.long_ball_targets = [slots(side, [Position.ST, Position.LW, Position.RW]) for side in (HOME, AWAY)]
+
+    def _build_receiver_samplers(self):
+        """
+        Builds an alias table per passer over an upper bound of each receiver's pass weight.
+        Being open multiplies a weight by at most 2 and a run by at most 2.5, so the bound
+        only depends on the static weights and never needs refreshing when player states change.
+        """
+        self.receiver_samplers = []
+        for receivers, static_weights, _, _, prefers_runs in self.pass_tables:
+            max_factor = 2.0 * (2.5 if prefers_runs else 1.0)
+            bounds = [max(0.1, weight * max_factor) for weight in static_weights]
+            self.receiver_samplers.append((AliasTable(bounds), bounds) if receivers else (None, bounds))
+
+    def _choose_receiver(self, passer):
+        """Chooses a receiver index by sampling the upper bound and accepting with the true weight"""
+        receivers, static_weights, _, _, prefers_runs = self.pass_tables[passer]
+        sampler, bounds = self.receiver_samplers[passer]
+        while True:
+            index = sampler.sample(self.rng.random())
+            weight = self._calculate_pass_weight(receivers[index], static_weights[index], prefers_runs)
+            if self.rng.random() * bounds[index] < weight:
+                return index
+
+    def _attempt_pass(self):
         """Attempts a pass to another player"""
-        passer = self.player_with_ball
+        passer = self.ball
         
-        # Find all potential receivers
-        teammates = (self.home_players if self.possession_team == self.home_team 
-                    else self.away_players)
-        potential_receivers = [p for p in teammates if p != passer]
+        # Find all potential receivers and the static part of each pass
+        receivers, _, base_success, run_factors, _ = self.pass_tables[passer]
         
-        if not potential_receivers:
+        if not receivers:
             return
             
-        # Calculate weights for each potential receiver
-        receiver_weights = []
-        for receiver in potential_receivers:
-            weight = self._calculate_pass_weight(passer, receiver)
-            receiver_weights.append(weight)
-            
-        # Normalize weights
-        total_weight = sum(receiver_weights)
-        if total_weight == 0:
-            self._add_event(f"{self._get_player_display(passer)} can't find an open teammate", skip_commentary)
-            return
-            
-        receiver_weights = [w/total_weight for w in receiver_weights]
-        
         # Choose receiver based on weights
-        receiver = random.choices(potential_receivers, weights=receiver_weights, k=1)[0]
+        index = self._choose_receiver(passer)
+        receiver = receivers[index]
         
         # Calculate pass success chance
-        pass_chance = self._calculate_pass_success(passer, receiver)
+        pass_chance = self._calculate_pass_success(receiver, base_success[index], run_factors[index])
                       
         # Attempt pass
-        passer.stats["passes_attempted"] += 1
+        stats = self.stats[passer]
+        stats[PASSES_ATTEMPTED] += 1
         
-        if random.random() < pass_chance:
+        if self.rng.random() < pass_chance:
             # Successful pass
-            passer.stats["passes_completed"] += 1
-            passer.update_match_rating("successful_pass", True)
-            self.player_with_ball = receiver
+            stats[PASSES_COMPLETED] += 1
+            self._rate(passer, "successful_pass", True)
+            self.ball = receiver
             
-            # Different commentary based on pass type
-            passer_pos = self._calculate_distance_to_goal()
-            receiver_pos = self.position_distances[receiver.position]
+            # Remember the passer for assists
+            if passer != self.last_passer[self.possession]:
+                self.previous_passer[self.possession] = self.last_passer[self.possession]
+                self.last_passer[self.possession] = passer
             
-            if abs(passer_pos - receiver_pos) > 0.4:  # Long pass
-                self._add_event(f"Long pass from {self._get_player_display(passer)} finds {self._get_player_display(receiver)}", skip_commentary, 
-                              player=passer, team=self.possession_team, event_type="pass")
-            elif receiver.on_run > 0:  # Through ball to running player
-                self._add_event(f"Great through ball from {self._get_player_display(passer)} to {self._get_player_display(receiver)}", skip_commentary,
-                              player=passer, team=self.possession_team, event_type="pass")
+            # Different commentary based on pass type
+            if abs(self.distances[passer] - self.distances[receiver]) > 0.4:  # Long pass
+                self._add_event(EventCode.LONG_PASS, passer, receiver)
+            elif self.on_run[receiver] > 0:  # Through ball to running player
+                self._add_event(EventCode.THROUGH_BALL, passer, receiver)
             else:  # Normal pass
-                self._add_event(f"Nice pass from {self._get_player_display(passer)} to {self._get_player_display(receiver)}", skip_commentary,
-                              player=passer, team=self.possession_team, event_type="pass")
+                self._add_event(EventCode.PASS, passer, receiver)
         else:
             # Failed pass
-            passer.update_match_rating("failed_pass", False)
-            self._add_event(f"{self._get_player_display(passer)}'s pass is intercepted", skip_commentary)
+            self._rate(passer, "failed_pass", False)
+            self._add_event(EventCode.PASS_INTERCEPTED, passer)
             self._switch_possession()
 
-    def _calculate_pass_weight(self, passer, receiver):
-        """Calculates how likely a player is to pass to a specific teammate"""
-        weight = 1.0
-        
-        # Position-based preferences
-        position_preferences = {
-            Position.GK: {
-                Position.CB: 2.0, Position.WB: 1.5, Position.CDM: 1.2,
-                Position.CM: 0.8, Position.CAM: 0.4, Position.LW: 0.3,
-                Position.RW: 0.3, Position.ST: 0.2, Position.GK: 0.1
-            },
-            Position.CB: {
-                Position.WB: 1.8, Position.CDM: 1.5, Position.CM: 1.2,
-                Position.CAM: 0.8, Position.LW: 0.6, Position.RW: 0.6,
-                Position.ST: 0.4, Position.GK: 0.3, Position.CB: 0.5
-            },
-            Position.WB: {
-                Position.CM: 1.5, Position.CAM: 1.3, Position.LW: 1.3,
-                Position.RW: 1.3, Position.CDM: 1.2, Position.ST: 1.0,
-                Position.CB: 0.8, Position.GK: 0.3, Position.WB: 0.5
-            },
-            Position.CDM: {
-                Position.CM: 1.8, Position.WB: 1.5, Position.CAM: 1.3,
-                Position.LW: 1.0, Position.RW: 1.0, Position.ST: 0.8,
-                Position.CB: 0.7, Position.GK: 0.2, Position.CDM: 0.6
-            },
-            Position.CM: {
-                Position.CAM: 1.8, Position.LW: 1.5, Position.RW: 1.5,
-                Position.ST: 1.3, Position.WB: 1.2, Position.CDM: 1.0,
-                Position.CB: 0.6, Position.GK: 0.2, Position.CM: 0.8
-            },
-            Position.CAM: {
-                Position.ST: 2.0, Position.LW: 1.8, Position.RW: 1.8,
-                Position.CM: 1.2, Position.WB: 1.0, Position.CDM: 0.8,
-                Position.CB: 0.4, Position.GK: 0.1, Position.CAM: 0.7
-            },
-            Position.LW: {
-                Position.ST: 2.0, Position.CAM: 1.5, Position.CM: 1.2,
-                Position.RW: 1.0, Position.WB: 0.8, Position.CDM: 0.6,
-                Position.CB: 0.4, Position.GK: 0.1, Position.LW: 0.5
-            },
-            Position.RW: {
-                Position.ST: 2.0, Position.CAM: 1.5, Position.CM: 1.2,
-                Position.LW: 1.0, Position.WB: 0.8, Position.CDM: 0.6,
-                Position.CB: 0.4, Position.GK: 0.1, Position.RW: 0.5
-            },
-            Position.ST: {
-                Position.CAM: 1.5, Position.LW: 1.3, Position.RW: 1.3,
-                Position.CM: 1.0, Position.WB: 0.7, Position.CDM: 0.5,
-                Position.CB: 0.3, Position.GK: 0.1, Position.ST: 0.4
-            }
-        }
-        
-        # Apply position preference multiplier
-        try:
-            weight *= position_preferences[passer.position][receiver.position]
-        except KeyError:
-            # Fallback weight if position combination is not found
-            weight *= 0.5
-        
-        # Consider how open the receiver is
-        weight *= (1.0 + receiver.open)
+    def _calculate_pass_weight(self, receiver, static_weight, prefers_runs):
+        """Applies how open the receiver is and whether they are making a run to the static weight"""
+        weight = static_weight * (1.0 + self.open[receiver])
         
         # Consider if receiver is making a run
-        if receiver.on_run > 0:
-            # Forwards and attacking midfielders prefer passing to running players
-            if passer.position in [Position.CAM, Position.CM, Position.LW, Position.RW]:
-                weight *= (1.5 + receiver.on_run)
-        
-        # Consider passing range based on long_balls attribute
-        passer_pos = self._calculate_distance_to_goal()
-        receiver_pos = self.position_distances[receiver.position]
-        pass_distance = abs(passer_pos - receiver_pos)
-        
-        if pass_distance > 0.4:  # Long pass
-            # Reduce weight if player has poor long passing
-            long_pass_ability = (passer.attributes["long_balls"] + passer.attributes["accuracy"]) / 200.0
-            weight *= long_pass_ability
-        
-        # Consider forward progression
-        # Reward passes that move the ball forward (except for forwards who might need to pass back)
-        if passer.position not in [Position.ST, Position.LW, Position.RW]:
-            if receiver_pos < passer_pos:  # Ball moving forward
-                weight *= 1.3
+        on_run = self.on_run[receiver]
+        if prefers_runs and on_run > 0:
+            weight *= (1.5 + on_run)
         
         return max(0.1, weight)  # Ensure weight is never zero
 
-    def _calculate_pass_success(self, passer, receiver):
+    def _calculate_pass_success(self, receiver, base_chance, run_factor):
         """Calculates the chance of a successful pass"""
-        # Base pass chance from passer's attributes
-        pass_chance = (passer.attributes["passing"] * 0.4 + 
-                      passer.attributes["accuracy"] * 0.3 +
-                      passer.attributes["playmaking"] * 0.3) / 100.0
-        
-        # Modify based on pass distance
-        passer_pos = self._calculate_distance_to_goal()
-        receiver_pos = self.position_distances[receiver.position]
-        pass_distance = abs(passer_pos - receiver_pos)
-        
-        if pass_distance > 0.4:  # Long pass
-            # Use long_balls attribute for long passes
-            pass_chance = (passer.attributes["long_balls"] * 0.5 + 
-                         passer.attributes["accuracy"] * 0.3 +
-                         receiver.attributes["jumping"] * 0.2) / 100.0
+        pass_chance = base_chance
         
         # Modify based on receiver's movement
-        if receiver.on_run > 0:
-            pass_chance *= (0.8 + (receiver.attributes["speed"] / 100.0) * 0.4)
+        if self.on_run[receiver] > 0:
+            pass_chance *= run_factor
         
         # Modify based on how open the receiver is
-        pass_chance *= (0.7 + receiver.open * 0.3)
+        pass_chance *= (0.7 + self.open[receiver] * 0.3)
         
         return min(0.95, pass_chance)  # Cap at 95% success rate
 
-    def _attempt_dribble(self, defender, skip_commentary=False):
+    def _attempt_dribble(self, defender):
         """Attempts to dribble past a defender"""
-        attacker = self.player_with_ball
-        
-        # Calculate dribble success chance
-        dribble_chance = (attacker.attributes["dribbling"] * 0.4 + 
-                         attacker.attributes["dribbling_skills"] * 0.4 +
-                         attacker.attributes["speed"] * 0.2) / 100.0
-                         
-        # Defender's chance to tackle
-        tackle_chance = (defender.attributes["tackling"] * 0.4 +
-                        defender.attributes["defensive_iq"] * 0.3 +
-                        defender.attributes["strength"] * 0.3) / 100.0
-                        
-        # Compare chances
-        if dribble_chance > tackle_chance:
-            self._add_event(f"{self._get_player_display(attacker)} skillfully dribbles past {self._get_player_display(defender)}", skip_commentary)
-            attacker.open = min(1.0, attacker.open + 0.2)  # Increased space
-            attacker.update_match_rating("successful_dribble", True)
-            defender.update_match_rating("failed_tackle", False)
+        attacker = self.ball
+        
+        # Compare the attacker's dribble chance with the defender's chance to tackle
+        if self.dribble_chance[attacker] > self.tackle_chance[defender]:
+            self._add_event(EventCode.DRIBBLE_PAST, attacker, defender)
+            self.open[attacker] = min(1.0, self.open[attacker] + 0.2)  # Increased space
+            self._rate(attacker, "successful_dribble", True)
+            self._rate(defender, "failed_tackle", False)
         else:
-            defender.stats["tackles_won"] += 1
-            defender.update_match_rating("successful_tackle", True)
-            attacker.update_match_rating("failed_dribble", False)
-            self._add_event(f"{self._get_player_display(defender)} wins the ball from {self._get_player_display(attacker)}", skip_commentary)
-            self.player_with_ball = defender
+            self.stats[defender][TACKLES_WON] += 1
+            self._rate(defender, "successful_tackle", True)
+            self._rate(attacker, "failed_dribble", False)
+            self._add_event(EventCode.TACKLE_WON, defender, attacker)
+            self.ball = defender
             self._switch_possession()
 
-    def _attempt_long_ball(self, skip_commentary=False):
+    def _attempt_long_ball(self):
         """Attempts a long ball to a forward"""
-        passer = self.player_with_ball
+        passer = self.ball
         
         # Find potential receivers
-        teammates = (self.home_players if self.possession_team == self.home_team 
-                    else self.away_players)
-        forwards = [p for p in teammates if p.position in [Position.ST, Position.LW, Position.RW]]
+        forwards = self.long_ball_targets[self.possession]
         
         if not forwards:
             return
             
-        receiver = random.choice(forwards)
+        receiver = self.rng.choice(forwards)
         
         # Calculate success chance
-        success_chance = (passer.attributes["long_balls"] * 0.5 + 
-                        passer.attributes["accuracy"] * 0.3 +
-                        receiver.attributes["jumping"] * 0.2) / 100.0
+        success_chance = (self.attributes[passer][LONG_BALLS] * 0.5 + 
+                        self.attributes[passer][ACCURACY] * 0.3 +
+                        self.attributes[receiver][JUMPING] * 0.2) / 100.0
                         
-        passer.stats["passes_attempted"] += 1
+        stats = self.stats[passer]
+        stats[PASSES_ATTEMPTED] += 1
         
-        if random.random() < success_chance:
-            passer.stats["passes_completed"] += 1
-            self.player_with_ball = receiver
-            self._add_event(f"Excellent long ball from {self._get_player_display(passer)} finds {self._get_player_display(receiver)}", skip_commentary)
+        if self.rng.random() < success_chance:
+            stats[PASSES_COMPLETED] += 1
+            self.ball = receiver
+            self._add_event(EventCode.LONG_BALL, passer, receiver)
         else:
-            self._add_event(f"{self._get_player_display(passer)}'s long ball is intercepted", skip_commentary)
+            self._add_event(EventCode.LONG_BALL_INTERCEPTED, passer)
             self._switch_possession()
 
     def _get_closest_defender(self):
         """Returns the most appropriate defender to pressure the ball"""
-        defenders = (self.away_players if self.possession_team == self.home_team 
-                    else self.home_players)
-        
-        # Prioritize defenders and defensive midfielders
-        priority_defenders = [p for p in defenders if p.position in [Position.CB, Position.WB, Position.CDM]]
-        
-        if priority_defenders:
-            return random.choice(priority_defenders)
-        return random.choice(defenders)
+        return self.rng.choice(self.pressing_defenders[self.possession])
 
-    def _calculate_pressure(self, defender):
-        """Calculates the pressure on the player with the ball"""
-        if not defender:
-            return 0.0
-            
-        base_pressure = (defender.attributes["tackling"] * 0.3 +
-                        defender.attributes["defensive_iq"] * 0.4 +
-                        defender.attributes["speed"] * 0.3) / 100.0
-                        
-        # Modify based on defender's position
-        if defender.position in [Position.CB, Position.WB]:
-            base_pressure *= 1.2
-            
-        return min(1.0, base_pressure)
-
-    def _calculate_distance_to_goal(self):
-        """Returns a normalized distance to goal (0 = very close, 1 = very far)"""
-        if not self.player_with_ball:
-            return 1.0
-            
-        return self.position_distances[self.player_with_ball.position]
-
-    def _get_random_midfielder(self, team):
-        """Returns a random midfielder from the team"""
-        players = self.home_players if team == self.home_team else self.away_players
-        midfielders = [p for p in players if p.position in [Position.CM, Position.CDM, Position.CAM]]
-        return random.choice(midfielders) if midfielders else random.choice(players)
+    def _get_random_midfielder(self, side):
+        """Returns a random midfielder from the side"""
+        return self.rng.choice(self.restart_players[side])
 
     def _switch_possession(self):
         """Switches possession between teams"""
-        self.possession_team = (self.away_team if self.possession_team == self.home_team 
-                              else self.home_team)
-        self.player_with_ball = self._get_random_midfielder(self.possession_team)
+        self.possession = AWAY if self.possession == HOME else HOME
+        self.ball = self._get_random_midfielder(self.possession)
 
     def _update_player_states(self):
         """Updates player states (openness, runs, etc.)"""
-        for player in self.home_players + self.away_players:
+        rng = self.rng
+        for slot, makes_runs in enumerate(self.makes_runs):
             # Update openness
-            player.open = random.random()  # Simplified for now
+            self.open[slot] = rng.random()  # Simplified for now
             
             # Decide if player should make a run
-            if (player.position in [Position.ST, Position.LW, Position.RW, Position.CAM] and 
-                random.random() < 0.3):
-                player.on_run = random.random()
+            if makes_runs and rng.random() < 0.3:
+                self.on_run[slot] = rng.random()
             else:
-                player.on_run = 0
+                self.on_run[slot] = 0
+
+    def _add_event(self, code, slot, other_slot=None):
+        """Records a match event for iter_events to yield"""
+        other_player = None if other_slot is None else self.lineup[other_slot]
+        self.events.append(MatchEvent(self.minute, code, self.lineup[slot], other_player,
+                                      self.teams[self.possession], self.event_display))
 
-    def _add_event(self, description, skip_commentary=False, player=None, team=None, event_type=None):
-        """Adds a match event and prints it"""
-        event = MatchEvent(self.minute, description, player, team, event_type)
-        self.events.append(event)
-        if not skip_commentary and not self.silent:
-            print(f"{Fore.YELLOW}[{self.minute}'] {Style.RESET_ALL}{description}")
-            time.sleep(self.commentary_delay)
+    def _finalize_ratings(self):
+        """Adds the clean sheet bonus and works out every starter's final rating"""
+        for slot, player in enumerate(self.lineup):
+            # Add clean sheet bonus for goalkeepers and defenders
+            conceded = self.away_score if self.sides[slot] == HOME else self.home_score
+            if conceded == 0 and self.positions[slot] in [Position.GK, Position.CB, Position.WB]:
+                self._rate(slot, "clean_sheet_minute", True)
+            self.player_ratings[player] = round(self.ratings[slot], 1)
+
+    def commit(self):
+        """
+        Writes the finished match into the players: match, season and career statistics,
+        rating history and development (unless develop is off). This is the only place a
+        Match changes a Player.
+        """
+        if self.committed:
+            return
+        self.committed = True
+        
+        for slot, player in enumerate(self.lineup):
+            for stat in player.stats:
+                player.stats[stat] = 0
+            for stat, value in zip(STATS, self.stats[slot]):
+                player.stats[stat] = value
+            player.stats["matches_played"] = 1
+            player.stats["minutes_played"] = 90  # Full match
+            
+            player.current_match_rating = self.ratings[slot]
+            self.player_ratings[player] = player.finalize_match_rating()
+            player.update_season_stats()
+            player.update_career_stats()
+        
+        # Process improvements for all players who played
+        if self.develop:
+            for player in self.lineup:
+                player.improve_from_match(self.player_ratings[player], rng=self.rng)
 
     def _print_final_score(self):
         """Prints the final score and match statistics"""
@@ -649,65 +828,38 @@ class Match:
         print(f"\nFinal Score:")
         print(f"{self.home_team.name} {self.home_score} - {self.away_score} {self.away_team.name}")
         
-        # Finalize match ratings and find best performer
-        all_players = self.home_players + self.away_players
-        for player in all_players:
-            # Add clean sheet bonus for goalkeepers and defenders
-            if ((self.home_score == 0 and player in self.away_players) or 
-                (self.away_score == 0 and player in self.home_players)):
-                if player.position in [Position.GK, Position.CB, Position.WB]:
-                    player.update_match_rating("clean_sheet_minute", True)
-            
-            # Finalize the rating and store it
-            final_rating = player.finalize_match_rating()
-            self.player_ratings[player] = final_rating
-        
         # Find best performer
-        best_player = max(all_players, key=lambda p: self.player_ratings.get(p, 0))
+        best_player = max(self.lineup, key=lambda p: self.player_ratings.get(p, 0))
         
         print(f"\n{Fore.YELLOW}Man of the Match: {self._get_player_display(best_player)} - Rating: {self.player_ratings[best_player]:.1f}{Style.RESET_ALL}")
         
         print("\nMatch Statistics:")
         print(f"{self.home_team.name}:")
-        self._print_team_stats(self.home_players)
+        self._print_team_stats(HOME)
         
         print("\nvs\n")
         
         print(f"{self.away_team.name}:")
-        self._print_team_stats(self.away_players)
-        
-        # Update season and career statistics for players who started
-        for player in all_players:
-            # Update matches_played and minutes_played
-            player.stats["matches_played"] = 1
-            player.stats["minutes_played"] = 90  # Full match
-            player.update_season_stats()
-            player.update_career_stats()
+        self._print_team_stats(AWAY)
 
-    def _print_team_stats(self, players):
+    def _print_team_stats(self, side):
         """Prints statistics for a team"""
-        print("Goals:", sum(p.stats["goals"] for p in players))
-        print("Shots:", sum(p.stats["shots"] for p in players))
-        print("Shots on Target:", sum(p.stats["shots_on_target"] for p in players))
-        print("Passes Completed:", sum(p.stats["passes_completed"] for p in players))
-        print("Pass Accuracy:", f"{sum(p.stats['passes_completed'] for p in players) / max(1, sum(p.stats['passes_attempted'] for p in players)):.2%}")
-        print("Tackles Won:", sum(p.stats["tackles_won"] for p in players))
+        slots = [slot for slot in range(len(self.lineup)) if self.sides[slot] == side]
+        total = lambda stat: sum(self.stats[slot][stat] for slot in slots)
+        print("Goals:", total(GOALS))
+        print("Shots:", total(SHOTS))
+        print("Shots on Target:", total(SHOTS_ON_TARGET))
+        print("Passes Completed:", total(PASSES_COMPLETED))
+        print("Pass Accuracy:", f"{total(PASSES_COMPLETED) / max(1, total(PASSES_ATTEMPTED)):.2%}")
+        print("Tackles Won:", total(TACKLES_WON))
         
         # Print individual player ratings
         print("\nPlayer Ratings:")
+        players = [self.lineup[slot] for slot in slots]
         for player in sorted(players, key=lambda p: self.player_ratings.get(p, 0), reverse=True):
             rating = self.player_ratings.get(player, 6.0)
             print(f"{player.name}: {rating:.1f}")
 
-    def _restore_original_attributes(self):
-        """Restores original attributes after the match"""
-        for player, original_attrs in self.original_attributes.items():
-            for attr, value in original_attrs.items():
-                if attr in player.attributes:
-                    player.attributes[attr] = value
-                elif hasattr(player, 'gk_attributes') and attr in player.gk_attributes:
-                    player.gk_attributes[attr] = value 
-
     def _get_match_result(self):
         """Returns the match result in a standardized format"""
         return {
@@ -717,4 +869,22 @@ class Match:
             'away_score': self.away_score,
             'events': self.events,
             'player_ratings': self.player_ratings
-        } 
\ No newline at end of file
+        }
+
+
+def simulate_fixture(home_team, away_team, action_frequency=1, rng=None, fidelity="full", profiler=None,
+                     develop=True):
+    """
+    Simulates a fixture without any terminal I/O and returns the match result.
+    fidelity "full" plays every event; "analytic" only samples a scoreline from
+    result_model, leaving player statistics, ratings and development untouched.
+    A profiler (profiling.MatchProfiler) times the full match's hot path. With develop
+    off the players are not developed, so a whole week can be developed at once
+    (League.develop_week).
+    """
+    if fidelity == "analytic":
+        from result_model import default_model
+        return default_model.simulate(home_team, away_team, action_frequency=action_frequency, rng=rng)
+    match = Match(home_team, away_team, commentary_delay=0,
+                  action_frequency=action_frequency, silent=True, rng=rng, profiler=profiler, develop=develop)
+    return match.simulate()
@@ -0,0 +1,67 @@
+import random
+from bisect import bisect_right
+import names
+
+# Name tables parsed from the names package, keyed by file: (capitalized names, cumulative frequencies)
+_TABLES = {}
+
+
+def load_table(filename):
+    """Reads a names distribution file once and returns its names and cumulative frequencies"""
+    if filename not in _TABLES:
+        table_names, cumulative = [], []
+        with open(filename) as name_file:
+            for line in name_file:
+                name, _, frequency, _ = line.split()
+                table_names.append(name.capitalize())
+                cumulative.append(float(frequency))
+        _TABLES[filename] = (table_names, cumulative)
+    return _TABLES[filename]
+
+
+def _pick(table, u):
+    """Picks a name the way names.get_name does: the first whose cumulative frequency passes u * 90"""
+    table_names, cumulative = table
+    index = bisect_right(cumulative, u * 90)
+    return table_names[index] if index < len(table_names) else ""
+
+
+class NameProvider:
+    """
+    Generates male full names from the names package's frequency tables, loaded into
+    memory on first use instead of rescanning the files for every name. Draws come from
+    rng (the global random module by default, as names itself uses). With unique set,
+    a name is never handed out twice by the same provider until it is released.
+    """
+
+    def __init__(self, unique=False, rng=None):
+        self.unique = unique
+        self.rng = rng or random
+        self.used = set()
+
+    def full_name(self, rng=None):
+        """Returns one full name"""
+        return self.generate(1, rng)[0]
+
+    def generate(self, n, rng=None):
+        """Returns n full names, drawing from rng or the provider's own stream"""
+        rng = rng or self.rng
+        first = load_table(names.FILES['first:male'])
+        last = load_table(names.FILES['last'])
+        generated = []
+        while len(generated) < n:
+            name = f"{_pick(first, rng.random())} {_pick(last, rng.random())}"
+            if self.unique:
+                if name in self.used:
+                    continue
+                self.used.add(name)
+            generated.append(name)
+        return generated
+
+    def release(self, name):
+        """Makes a name available again, e.g. once its player has left the world"""
+        self.used.discard(name)
+
+
+# Provider for players created without one, e.g. outside a game
+default_names = NameProvider()
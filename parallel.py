@@ -0,0 +1,146 @@
+import random
+from concurrent.futures import ProcessPoolExecutor
+from match import Match
+
+# Worker processes are started once and reused for every week
+_pool = None
+
+
+def get_pool(max_workers=None):
+    """Returns the shared process pool, starting it on first use"""
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=max_workers)
+    return _pool
+
+
+def shutdown_pool():
+    """Stops the shared process pool"""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = None
+
+
+def _simulate_fixture_deltas(home_team, away_team, action_frequency, rng):
+    """
+    Runs in a worker: plays the fixture on the worker's copies of the teams and returns
+    only what changed. Each starter is identified by side and squad index and carries
+    their match statistics, unrounded match rating, the attribute values development
+    changed and, for youth players, their scouting progress and new scouting reports.
+    """
+    match = Match(home_team, away_team, commentary_delay=0, action_frequency=action_frequency,
+                  silent=True, rng=rng)
+    before = {player: (dict(player.attributes), dict(player.gk_attributes), player.season_start_rating,
+                       len(player.scouting_reports))
+              for player in match.lineup}
+
+    for _ in match.iter_events():
+        pass
+    match.commit()
+
+    player_deltas = []
+    for slot, player in enumerate(match.lineup):
+        side = match.sides[slot]
+        attributes, gk_attributes, season_start_rating, report_count = before[player]
+        scouting = None
+        if len(player.scouting_reports) != report_count:
+            scouting = (player.matches_scouted, player.potential_uncertainty, player.scouting_reports[report_count:])
+        player_deltas.append((
+            side,
+            match.teams[side].players.index(player),
+            {stat: value for stat, value in player.stats.items() if value},
+            match.ratings[slot],
+            {attr: value for attr, value in player.attributes.items() if value != attributes[attr]},
+            {attr: value for attr, value in player.gk_attributes.items() if value != gk_attributes[attr]},
+            player.season_start_rating if player.season_start_rating != season_start_rating else None,
+            scouting
+        ))
+    return match.home_score, match.away_score, player_deltas
+
+
+def _apply_fixture_deltas(home_team, away_team, deltas):
+    """Replays a worker's deltas onto the parent's players and returns the match result"""
+    home_score, away_score, player_deltas = deltas
+    teams = (home_team, away_team)
+    player_ratings = {}
+
+    for side, index, stats, rating, attributes, gk_attributes, season_start_rating, scouting in player_deltas:
+        player = teams[side].players[index]
+        for stat in player.stats:
+            player.stats[stat] = 0
+        player.stats.update(stats)
+        player.current_match_rating = rating
+        player_ratings[player] = player.finalize_match_rating()
+        player.update_season_stats()
+        player.update_career_stats()
+
+        # Development, as computed by the worker
+        player.attributes.update(attributes)
+        player.gk_attributes.update(gk_attributes)
+        if season_start_rating is not None:
+            player.season_start_rating = season_start_rating
+        if scouting is not None:
+            player.matches_scouted, player.potential_uncertainty, reports = scouting
+            player.scouting_reports.extend(reports)
+
+    return {
+        'home_team': home_team,
+        'away_team': away_team,
+        'home_score': home_score,
+        'away_score': away_score,
+        'events': [],
+        'player_ratings': player_ratings
+    }
+
+
+def _fixture_waves(fixtures):
+    """
+    Splits fixtures into waves whose fixtures share no team. A fixture goes in the wave
+    after the last one holding either of its teams, so a team's fixtures still run in
+    fixture order.
+    """
+    waves = []
+    next_wave = {}
+    for fixture in fixtures:
+        home_team, away_team = fixture[0], fixture[1]
+        wave = max(next_wave.get(id(home_team), 0), next_wave.get(id(away_team), 0))
+        if wave == len(waves):
+            waves.append([])
+        waves[wave].append(fixture)
+        next_wave[id(home_team)] = next_wave[id(away_team)] = wave + 1
+    return waves
+
+
+def _simulate_wave(fixtures, action_frequency, pool):
+    """Simulates fixtures that share no team in the workers, returning results in order"""
+    teams = [id(team) for home_team, away_team, _ in fixtures for team in (home_team, away_team)]
+    if len(set(teams)) != len(teams):
+        # Each worker plays on its own copy of a team, so a second fixture would overwrite the first
+        raise ValueError("fixtures simulated in one wave must not share teams")
+    jobs = [pool.submit(_simulate_fixture_deltas, home_team, away_team, action_frequency, rng)
+            for home_team, away_team, rng in fixtures]
+    return [_apply_fixture_deltas(home_team, away_team, job.result())
+            for (home_team, away_team, _), job in zip(fixtures, jobs)]
+
+
+def simulate_fixtures_parallel(fixtures, action_frequency=1, pool=None):
+    """
+    Simulates (home_team, away_team, rng) fixtures in worker processes and returns the
+    results in fixture order. Fixtures sharing a team are played in later waves, after
+    the earlier fixture's results are applied. With a seeded random stream per fixture,
+    results and player state match simulating them one by one.
+    """
+    pool = pool or get_pool()
+    seeded = []
+    for home_team, away_team, rng in fixtures:
+        if rng is None or rng is random:
+            # The global stream can't travel to a worker, so give the fixture its own
+            rng = random.Random(random.getrandbits(64))
+        seeded.append((home_team, away_team, rng))
+
+    results = {}
+    for wave in _fixture_waves(seeded):
+        for fixture, result in zip(wave, _simulate_wave(wave, action_frequency, pool)):
+            results[id(fixture)] = result
+    return [results[id(fixture)] for fixture in seeded]
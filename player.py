@@ -1,6 +1,9 @@
 import random
-import names
-from enum import Enum
+from collections.abc import MutableMapping
+from enum import Enum, IntEnum
+from player_store import PlayerStore
+from name_provider import default_names
+from rating_history import RatingHistory
 from colorama import Fore, Style
 
 class Position(Enum):
@@ -60,9 +63,216 @@ class Personality(Enum):
         }
         return traits[self.name]
 
+class Attr(IntEnum):
+    """Index of each attribute in a player's attribute array: field attributes, then goalkeeping"""
+    PLAYMAKING = 0
+    PASSING = 1
+    SPEED = 2
+    OVERALL_IQ = 3
+    TACKLING = 4
+    ATTACKING_IQ = 5
+    MIDFIELD_IQ = 6
+    DEFENSIVE_IQ = 7
+    DRIBBLING = 8
+    DRIBBLING_SKILLS = 9
+    FINISHING = 10
+    JUMPING = 11
+    LONG_BALLS = 12
+    STAMINA = 13
+    STRENGTH = 14
+    ACCURACY = 15
+    FK_PK_ABILITY = 16
+    OFF_BALL_MOVEMENT = 17
+    DIVING = 18
+    HANDLING = 19
+    POSITIONING = 20
+    KICKING = 21
+    FIELD_SKILLS = 22
+
+
+FIELD_ATTRIBUTES = tuple(attr.name.lower() for attr in Attr if attr < Attr.DIVING)
+GK_ATTRIBUTES = tuple(attr.name.lower() for attr in Attr if attr >= Attr.DIVING)
+
+
+def _position_weights(position):
+    """Returns attribute weights based on position"""
+    weights = {attr: 1 for attr in FIELD_ATTRIBUTES}
+    
+    # Position-specific weights for off_ball_movement
+    if position == Position.ST:
+        weights["off_ball_movement"] = 2.5  # Very important for strikers
+    elif position in [Position.LW, Position.RW]:
+        weights["off_ball_movement"] = 2.2  # Very important for wingers
+    elif position == Position.CAM:
+        weights["off_ball_movement"] = 2.0  # Important for attacking midfielders
+    elif position in [Position.CM, Position.CDM]:
+        weights["off_ball_movement"] = 1.5  # Moderately important for midfielders
+    elif position == Position.WB:
+        weights["off_ball_movement"] = 1.3  # Somewhat important for wing backs
+    else:
+        weights["off_ball_movement"] = 1.0  # Less important for other positions
+    
+    if position in [Position.CB, Position.WB]:
+        defensive_attrs = ["tackling", "defensive_iq", "strength", "jumping"]
+        for attr in defensive_attrs:
+            weights[attr] = 2
+    elif position in [Position.CDM, Position.CM]:
+        midfield_attrs = ["playmaking", "passing", "midfield_iq", "stamina"]
+        for attr in midfield_attrs:
+            weights[attr] = 2
+    elif position in [Position.CAM, Position.LW, Position.RW]:
+        attacking_attrs = ["dribbling", "passing", "attacking_iq", "speed"]
+        for attr in attacking_attrs:
+            weights[attr] = 2
+    elif position == Position.ST:
+        striker_attrs = ["finishing", "attacking_iq", "dribbling_skills"]
+        for attr in striker_attrs:
+            weights[attr] = 2
+            
+    return weights
+
+
+# Overall rating weights for every position, built once: (Attr index, weight) pairs and their total
+POSITION_WEIGHTS = {position: _position_weights(position) for position in Position}
+WEIGHT_VECTORS = {position: (tuple((int(Attr[attr.upper()]), weight) for attr, weight in weights.items()),
+                             sum(weights.values()))
+                  for position, weights in POSITION_WEIGHTS.items()}
+
+# Attributes a good match performance can develop, by position
+MATCH_TRAINING_FOCUS = {
+    Position.GK: ["diving", "handling", "positioning"],
+    Position.CB: ["tackling", "defensive_iq", "strength", "jumping"],
+    Position.WB: ["tackling", "defensive_iq", "strength", "jumping"],
+    Position.CDM: ["playmaking", "passing", "midfield_iq", "stamina"],
+    Position.CM: ["playmaking", "passing", "midfield_iq", "stamina"],
+    Position.CAM: ["dribbling", "passing", "attacking_iq", "speed"],
+    Position.LW: ["dribbling", "passing", "attacking_iq", "speed"],
+    Position.RW: ["dribbling", "passing", "attacking_iq", "speed"],
+    Position.ST: ["finishing", "attacking_iq", "dribbling_skills"]
+}
+
+# Attributes that decline faster (physical) or slower (mental) with age
+PHYSICAL_ATTRIBUTES = ["speed", "stamina", "strength", "jumping"]
+MENTAL_ATTRIBUTES = ["playmaking", "overall_iq", "attacking_iq", "midfield_iq", "defensive_iq"]
+
+# Position and personality codes used by the player store
+POSITIONS = list(Position)
+POSITION_CODES = {position: code for code, position in enumerate(POSITIONS)}
+PERSONALITIES = list(Personality)
+PERSONALITY_CODES = {personality: code for code, personality in enumerate(PERSONALITIES)}
+
+
+def _rating_weight_row(position):
+    """Overall rating weights of a position over the whole attribute array, summing to 1"""
+    row = [0.0] * len(Attr)
+    if position == Position.GK:
+        for attr in GK_ATTRIBUTES:
+            row[Attr[attr.upper()]] = 1 / len(GK_ATTRIBUTES)
+    else:
+        weights, total = WEIGHT_VECTORS[position]
+        for i, weight in weights:
+            row[i] = weight / total
+    return row
+
+
+# Every player's position, personality, age, potential and attributes live in this store
+world_store = PlayerStore(len(Attr), [_rating_weight_row(position) for position in POSITIONS])
+
+
+class AttributeView(MutableMapping):
+    """
+    Dict-style view, by attribute name, of part of a player's row in the player store.
+    Writes that change a value bump the row's version so cached ratings recompute. The
+    view keeps its player alive, so the row can't be released and reused under it.
+    """
+    __slots__ = ("owner", "store", "row")
+    names = ()
+    index = {}
+
+    def __init__(self, owner):
+        self.owner = owner
+        self.store = owner.store
+        self.row = owner.row
+
+    def __getitem__(self, attr):
+        return float(self.store.attributes[self.row, self.index[attr]])
+
+    def __setitem__(self, attr, value):
+        i = self.index[attr]
+        # Writing the value already held is not a change
+        if self.store.attributes[self.row, i] != value:
+            self.store.attributes[self.row, i] = value
+            self.store.version[self.row] += 1
+
+    def __delitem__(self, attr):
+        raise TypeError("player attributes can't be removed")
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, attr):
+        return attr in self.index
+
+    def keys(self):
+        return self.names
+
+    def values(self):
+        row = self.store.attributes[self.row].tolist()
+        return [row[i] for i in self.index.values()]
+
+    def items(self):
+        row = self.store.attributes[self.row].tolist()
+        return [(attr, row[i]) for attr, i in self.index.items()]
+
+    def copy(self):
+        return dict(self.items())
+
+    def __repr__(self):
+        return repr(self.copy())
+
+
+class FieldAttributes(AttributeView):
+    __slots__ = ()
+    names = FIELD_ATTRIBUTES
+    index = {attr: int(Attr[attr.upper()]) for attr in FIELD_ATTRIBUTES}
+
+
+class GoalkeeperAttributes(AttributeView):
+    __slots__ = ()
+    names = GK_ATTRIBUTES
+    index = {attr: int(Attr[attr.upper()]) for attr in GK_ATTRIBUTES}
+
+
 class Player:
-    def __init__(self, position, age=None, youth=False, league_tier=1):
-        self.name = names.get_full_name(gender='male')
+    __slots__ = ("store", "row", "name", "youth", "league_tier", "retired", "potential_uncertainty",
+                 "scouting_reports", "matches_scouted", "development_rate", "current_match_rating",
+                 "rating_history", "_rating", "_rating_key",
+                 "has_ball", "stats", "season_stats", "career_stats", "personality_probabilities",
+                 "season_start_rating")
+
+    # Base rating impact values for different match actions
+    rating_impacts = {
+        "goal": 1.0,
+        "assist": 0.8,
+        "shot_on_target": 0.3,
+        "shot_off_target": -0.1,
+        "successful_pass": 0.1,
+        "failed_pass": -0.1,
+        "successful_tackle": 0.3,
+        "failed_tackle": -0.2,
+        "save": 0.4,  # For goalkeepers
+        "conceded": -0.3,  # For goalkeepers
+        "clean_sheet_minute": 0.01  # Small bonus for each minute of clean sheet (GK and defenders)
+    }
+
+    def __init__(self, position, age=None, youth=False, league_tier=1, rng=None, store=None, name=None):
+        rng = rng or random
+        # Position, age, potential, personality and attributes are kept in the store's row
+        self._claim_row(store if store is not None else world_store)
+        self.name = name if name is not None else default_names.full_name()
         self.position = position
         
         # More realistic age distribution for youth players
@@ -74,9 +284,9 @@ class Player:
             # 17: 25% chance
             # 18: 5% chance
             age_weights = [0.10, 0.25, 0.35, 0.25, 0.05]
-            self.age = random.choices([14, 15, 16, 17, 18], weights=age_weights)[0]
+            self.age = rng.choices([14, 15, 16, 17, 18], weights=age_weights)[0]
         else:
-            self.age = age if age else random.randint(20, 35)
+            self.age = age if age else rng.randint(20, 35)
             
         self.youth = youth
         self.league_tier = league_tier
@@ -91,44 +301,13 @@ class Player:
         
         # Match rating tracking
         self.current_match_rating = 6.0  # Base rating for current match
-        self.match_ratings = []  # List of all match ratings
-        self.season_ratings = []  # List of ratings for current season
-        self.career_ratings = []  # List of all career ratings
+        self.rating_history = RatingHistory()  # All match ratings, with running season and career totals
+        
+        # Cached overall rating and the store row version it was computed from
+        self._rating = None
+        self._rating_key = None
         
-        # Initialize attributes
-        self.attributes = {
-            "playmaking": 0,
-            "passing": 0,
-            "speed": 0,
-            "overall_iq": 0,
-            "tackling": 0,
-            "attacking_iq": 0,
-            "midfield_iq": 0,
-            "defensive_iq": 0,
-            "dribbling": 0,
-            "dribbling_skills": 0,
-            "finishing": 0,
-            "jumping": 0,
-            "long_balls": 0,
-            "stamina": 0,
-            "strength": 0,
-            "accuracy": 0,
-            "fk_pk_ability": 0,
-            "off_ball_movement": 0  # New attribute for getting open
-        }
-
-        # GK specific attributes
-        self.gk_attributes = {
-            "diving": 0,
-            "handling": 0,
-            "positioning": 0,
-            "kicking": 0,
-            "field_skills": 0
-        }
-
         # Match state attributes
-        self.open = 0  # How open the player is
-        self.on_run = 0  # If player is making a run (0 for no, >0 for run rating)
         self.has_ball = False
 
         # Current match statistics
@@ -182,14 +361,14 @@ class Player:
         }
 
         # Set personality probabilities based on position
-        self.set_personality_probabilities()
+        self.set_personality_probabilities(rng)
         # Generate attributes based on position
-        self.generate_attributes()
+        self.generate_attributes(rng)
 
         # Store initial rating for season improvement tracking
         self.season_start_rating = self.overall_rating
 
-    def set_personality_probabilities(self):
+    def set_personality_probabilities(self, rng=None):
         """Sets personality probabilities based on position"""
         position_personalities = {
             Position.GK: [0.2, 0.5, 0.3],  # [Maverick, Heartbeat, Vitroso]
@@ -203,17 +382,19 @@ class Player:
             Position.ST: [0.5, 0.2, 0.3]
         }
         self.personality_probabilities = position_personalities[self.position]
-        self.personality = self.get_personality()
+        self.personality = self.get_personality(rng)
 
-    def get_personality(self):
+    def get_personality(self, rng=None):
         """Returns a personality based on probabilities"""
-        return random.choices(
+        rng = rng or random
+        return rng.choices(
             [Personality.MAVERICK, Personality.HEARTBEAT, Personality.VITROSO],
             weights=self.personality_probabilities
         )[0]
 
-    def generate_attributes(self):
+    def generate_attributes(self, rng=None):
         """Generates attributes based on position and personality"""
+        rng = rng or random
         # Calculate age factor for senior players
         if not self.youth:
             # Peak age range is 25-29
@@ -239,7 +420,7 @@ class Player:
         # Create different tiers of players based on potential and age
         if self.youth:
             # Youth player generation remains unchanged
-            player_tier = random.random()
+            player_tier = rng.random()
             if player_tier < 0.02:  # 2% chance for wonderkid
                 base_range = (45 + (age_factor * 20), 55 + (age_factor * 20))
                 potential_range = (88, 95)
@@ -257,7 +438,7 @@ class Player:
                 potential_range = (65, 71)
         else:
             # Senior player generation with age factor applied
-            player_tier = random.random()
+            player_tier = rng.random()
             if player_tier < 0.05:  # 5% chance for exceptional players
                 base_range = (int(85 * age_factor), int(95 * age_factor))
             elif player_tier < 0.25:  # 20% chance for very good players
@@ -281,80 +462,85 @@ class Player:
             if min_potential >= potential_range[1]:
                 self.true_potential = potential_range[1]
             else:
-                self.true_potential = random.randint(min_potential, potential_range[1])
+                self.true_potential = rng.randint(min_potential, potential_range[1])
         else:
             # Senior players have more accurate potential assessment
             # For older players (30+), potential is closer to current rating
             if self.age >= 30:
-                potential_boost = random.randint(0, 2)  # Minimal improvement potential
+                potential_boost = rng.randint(0, 2)  # Minimal improvement potential
             else:
-                potential_boost = random.randint(1, 4)  # More room for improvement
+                potential_boost = rng.randint(1, 4)  # More room for improvement
             self.true_potential = min(99, int(base_range[1] * (1 + potential_boost / 100)))
 
         # Position-specific attribute generation remains unchanged
         if self.position == Position.GK:
-            self._generate_goalkeeper_attributes(base_range)
+            self._generate_goalkeeper_attributes(base_range, rng)
         elif self.position in [Position.CB, Position.WB]:
-            self._generate_defender_attributes(base_range)
+            self._generate_defender_attributes(base_range, rng)
         elif self.position in [Position.CDM, Position.CM]:
-            self._generate_midfielder_attributes(base_range)
+            self._generate_midfielder_attributes(base_range, rng)
         elif self.position in [Position.CAM, Position.LW, Position.RW]:
-            self._generate_attacking_midfielder_attributes(base_range)
+            self._generate_attacking_midfielder_attributes(base_range, rng)
         elif self.position == Position.ST:
-            self._generate_striker_attributes(base_range)
+            self._generate_striker_attributes(base_range, rng)
 
         # Apply personality modifiers
         self._apply_personality_modifiers()
 
-    def _generate_goalkeeper_attributes(self, base_range):
+    def _generate_goalkeeper_attributes(self, base_range, rng=None):
         """Generates goalkeeper-specific attributes"""
+        rng = rng or random
         # Goalkeepers get slightly higher base attributes in their specialty
         gk_range = (base_range[0] + 5, base_range[1] + 5)
         for attr in self.gk_attributes:
-            self.gk_attributes[attr] = random.randint(gk_range[0], gk_range[1])
+            self.gk_attributes[attr] = rng.randint(gk_range[0], gk_range[1])
         # Basic field attributes for goalkeepers are lower
         for attr in self.attributes:
-            self.attributes[attr] = random.randint(35, 55)  # Even lower field skills
+            self.attributes[attr] = rng.randint(35, 55)  # Even lower field skills
 
-    def _generate_defender_attributes(self, base_range):
+    def _generate_defender_attributes(self, base_range, rng=None):
+        rng = rng or random
         defensive_attrs = ["tackling", "defensive_iq", "strength", "jumping"]
         for attr in self.attributes:
             if attr in defensive_attrs:
-                self.attributes[attr] = random.randint(base_range[0] + 8, base_range[1] + 8)
+                self.attributes[attr] = rng.randint(base_range[0] + 8, base_range[1] + 8)
             elif attr == "off_ball_movement":  # Special case for off_ball_movement
                 if self.position == Position.WB:  # Wing backs need decent movement
-                    self.attributes[attr] = random.randint(base_range[0] + 4, base_range[1] + 4)
+                    self.attributes[attr] = rng.randint(base_range[0] + 4, base_range[1] + 4)
                 else:  # Center backs need less
-                    self.attributes[attr] = random.randint(base_range[0] - 3, base_range[1] - 3)
+                    self.attributes[attr] = rng.randint(base_range[0] - 3, base_range[1] - 3)
             else:
-                self.attributes[attr] = random.randint(base_range[0] - 8, base_range[1] - 8)
+                self.attributes[attr] = rng.randint(base_range[0] - 8, base_range[1] - 8)
 
-    def _generate_midfielder_attributes(self, base_range):
+    def _generate_midfielder_attributes(self, base_range, rng=None):
+        rng = rng or random
         midfield_attrs = ["playmaking", "passing", "midfield_iq", "stamina"]
         movement_bonus = 3  # Smaller bonus for midfielders
         for attr in self.attributes:
             if attr in midfield_attrs:
-                self.attributes[attr] = random.randint(base_range[0] + 8, base_range[1] + 8)
+                self.attributes[attr] = rng.randint(base_range[0] + 8, base_range[1] + 8)
             elif attr == "off_ball_movement":  # Special case for off_ball_movement
-                self.attributes[attr] = random.randint(base_range[0] + movement_bonus, base_range[1] + movement_bonus)
+                self.attributes[attr] = rng.randint(base_range[0] + movement_bonus, base_range[1] + movement_bonus)
             else:
-                self.attributes[attr] = random.randint(base_range[0] - 5, base_range[1] - 5)
+                self.attributes[attr] = rng.randint(base_range[0] - 5, base_range[1] - 5)
 
-    def _generate_attacking_midfielder_attributes(self, base_range):
+    def _generate_attacking_midfielder_attributes(self, base_range, rng=None):
+        rng = rng or random
         attacking_attrs = ["dribbling", "passing", "attacking_iq", "speed", "off_ball_movement"]  # Added off_ball_movement
         for attr in self.attributes:
             if attr in attacking_attrs:
-                self.attributes[attr] = random.randint(base_range[0] + 8, base_range[1] + 8)
+                self.attributes[attr] = rng.randint(base_range[0] + 8, base_range[1] + 8)
             else:
-                self.attributes[attr] = random.randint(base_range[0] - 5, base_range[1] - 5)
+                self.attributes[attr] = rng.randint(base_range[0] - 5, base_range[1] - 5)
 
-    def _generate_striker_attributes(self, base_range):
+    def _generate_striker_attributes(self, base_range, rng=None):
+        rng = rng or random
         striker_attrs = ["finishing", "attacking_iq", "dribbling_skills", "off_ball_movement"]  # Added off_ball_movement
         for attr in self.attributes:
             if attr in striker_attrs:
-                self.attributes[attr] = random.randint(base_range[0] + 8, base_range[1] + 8)
+                self.attributes[attr] = rng.randint(base_range[0] + 8, base_range[1] + 8)
             else:
-                self.attributes[attr] = random.randint(base_range[0] - 5, base_range[1] - 5)
+                self.attributes[attr] = rng.randint(base_range[0] - 5, base_range[1] - 5)
 
     def _apply_personality_modifiers(self):
         """Applies attribute modifiers based on personality"""
@@ -395,57 +581,131 @@ class Player:
         for attr in decrease_attrs:
             self.attributes[attr] = max(1, self.attributes[attr] - 8)
 
+    # The rating lists are read-only tuples: the history's running totals only see ratings
+    # added through it, so appending to a copy would silently go nowhere
+    @property
+    def match_ratings(self):
+        """Every match rating, oldest first"""
+        return tuple(self.rating_history.ratings)
+
+    @property
+    def career_ratings(self):
+        return tuple(self.rating_history.ratings)
+
+    @property
+    def season_ratings(self):
+        return self.rating_history.season_ratings
+
+    @season_ratings.setter
+    def season_ratings(self, ratings):
+        # Assigning a list (the game assigns [] at season end) starts a new season of those ratings
+        self.rating_history.new_season()
+        for rating in ratings:
+            self.rating_history.add(rating)
+
+    def _claim_row(self, store):
+        """Takes a row in the store; __del__ hands it back for reuse"""
+        self.store = store
+        self.row = store.allocate()
+
+    def __del__(self):
+        # Hand the row back, so throwaway squads and unpickled copies do not grow the store forever
+        self.store.release(self.row)
+
+    def __getstate__(self):
+        # The store row travels as values, e.g. to a worker process, and gets a row of its own there
+        state = {slot: getattr(self, slot) for slot in self.__slots__ if slot not in ("store", "row")}
+        state["store_row"] = self.store.export_row(self.row)
+        state["_rating_key"] = None  # The cached rating is keyed on this store's row version, not the new one's
+        return state
+
+    def __setstate__(self, state):
+        # Unpickled players always land in world_store, the one store a process plays with
+        self._claim_row(world_store)
+        world_store.import_row(self.row, state.pop("store_row"))
+        for slot, value in state.items():
+            setattr(self, slot, value)
+
+    @property
+    def position(self):
+        return POSITIONS[self.store.position[self.row]]
+
+    @position.setter
+    def position(self, position):
+        self.store.position[self.row] = POSITION_CODES[position]
+        self.store.version[self.row] += 1
+
+    @property
+    def personality(self):
+        return PERSONALITIES[self.store.personality[self.row]]
+
+    @personality.setter
+    def personality(self, personality):
+        self.store.personality[self.row] = PERSONALITY_CODES[personality]
+
+    @property
+    def age(self):
+        return int(self.store.age[self.row])
+
+    @age.setter
+    def age(self, age):
+        self.store.age[self.row] = age
+
+    @property
+    def true_potential(self):
+        return int(self.store.true_potential[self.row])
+
+    @true_potential.setter
+    def true_potential(self, potential):
+        self.store.true_potential[self.row] = potential
+
+    @property
+    def attribute_values(self):
+        """The player's attribute values indexed by Attr, as a live NumPy row"""
+        return self.store.attributes[self.row]
+
+    @property
+    def attributes(self):
+        return FieldAttributes(self)
+
+    @attributes.setter
+    def attributes(self, values):
+        FieldAttributes(self).update(values)
+
+    @property
+    def gk_attributes(self):
+        return GoalkeeperAttributes(self)
+
+    @gk_attributes.setter
+    def gk_attributes(self, values):
+        GoalkeeperAttributes(self).update(values)
+
     @property
     def overall_rating(self):
+        """Overall rating from position-specific attributes, recomputed only after they change"""
+        key = int(self.store.version[self.row])
+        if key != self._rating_key:
+            self._rating = self._calculate_overall_rating()
+            self._rating_key = key
+        return self._rating
+
+    def _calculate_overall_rating(self):
         """Calculates overall rating based on position-specific attributes"""
         if self.position == Position.GK:
             return sum(self.gk_attributes.values()) / len(self.gk_attributes)
         
         # Weight attributes based on position
-        weights = self._get_position_weights()
-        weighted_sum = sum(self.attributes[attr] * weight 
-                         for attr, weight in weights.items())
-        return weighted_sum / sum(weights.values())
+        weights, total = WEIGHT_VECTORS[self.position]
+        values = self.attribute_values.tolist()
+        return sum(values[i] * weight for i, weight in weights) / total
 
     def _get_position_weights(self):
         """Returns attribute weights based on position"""
-        weights = {attr: 1 for attr in self.attributes}
-        
-        # Position-specific weights for off_ball_movement
-        if self.position == Position.ST:
-            weights["off_ball_movement"] = 2.5  # Very important for strikers
-        elif self.position in [Position.LW, Position.RW]:
-            weights["off_ball_movement"] = 2.2  # Very important for wingers
-        elif self.position == Position.CAM:
-            weights["off_ball_movement"] = 2.0  # Important for attacking midfielders
-        elif self.position in [Position.CM, Position.CDM]:
-            weights["off_ball_movement"] = 1.5  # Moderately important for midfielders
-        elif self.position == Position.WB:
-            weights["off_ball_movement"] = 1.3  # Somewhat important for wing backs
-        else:
-            weights["off_ball_movement"] = 1.0  # Less important for other positions
-        
-        if self.position in [Position.CB, Position.WB]:
-            defensive_attrs = ["tackling", "defensive_iq", "strength", "jumping"]
-            for attr in defensive_attrs:
-                weights[attr] = 2
-        elif self.position in [Position.CDM, Position.CM]:
-            midfield_attrs = ["playmaking", "passing", "midfield_iq", "stamina"]
-            for attr in midfield_attrs:
-                weights[attr] = 2
-        elif self.position in [Position.CAM, Position.LW, Position.RW]:
-            attacking_attrs = ["dribbling", "passing", "attacking_iq", "speed"]
-            for attr in attacking_attrs:
-                weights[attr] = 2
-        elif self.position == Position.ST:
-            striker_attrs = ["finishing", "attacking_iq", "dribbling_skills"]
-            for attr in striker_attrs:
-                weights[attr] = 2
-                
-        return weights
+        return dict(POSITION_WEIGHTS[self.position])
 
-    def _generate_scouting_report(self):
+    def _generate_scouting_report(self, rng=None):
         """Generates a detailed scouting report for youth players"""
+        rng = rng or random
         if not self.youth:
             return
 
@@ -470,8 +730,8 @@ class Player:
             "date_scouted": self.matches_scouted,
             "current_ability": f"{self.overall_rating:.1f}",
             "potential_range": potential_range,
-            "strengths": random.sample(strengths, min(3, len(strengths))) if strengths else ["None identified"],
-            "weaknesses": random.sample(weaknesses, min(2, len(weaknesses))) if weaknesses else ["None identified"],
+            "strengths": rng.sample(strengths, min(3, len(strengths))) if strengths else ["None identified"],
+            "weaknesses": rng.sample(weaknesses, min(2, len(weaknesses))) if weaknesses else ["None identified"],
             "personality_notes": personality_traits["description"],
             "development_prediction": self._get_development_prediction()
         }
@@ -500,16 +760,17 @@ class Player:
             
         return f"{speed_text} development, {consistency_text} progression"
 
-    def improve_attributes(self, training_focus=None, is_match_improvement=False, improvement_amount=0.0):
+    def improve_attributes(self, training_focus=None, is_match_improvement=False, improvement_amount=0.0, rng=None):
         """Improves or declines player attributes based on age, potential, personality, and training focus"""
+        rng = rng or random
         # Get personality-based development modifiers
         personality_traits = self.personality.development_traits
         development_speed = personality_traits["development_speed"]
         consistency = personality_traits["consistency"]
         preferred_attributes = personality_traits["preferred_attributes"]
 
-        # Define physical attributes that decline faster with age
-        physical_attributes = ["speed", "stamina", "strength", "jumping"]
+        # Physical attributes decline faster with age
+        physical_attributes = PHYSICAL_ATTRIBUTES
         
         # Calculate attribute changes based on age
         if self.age >= 30:
@@ -530,30 +791,30 @@ class Player:
             
             # Process potential decline for each attribute
             for attr in self.attributes:
-                if random.random() < decline_chance:
+                if rng.random() < decline_chance:
                     decline = base_decline
                     # Physical attributes decline faster
                     if attr in physical_attributes:
                         decline *= 1.5
                     # Mental attributes decline slower
-                    elif attr in ["playmaking", "overall_iq", "attacking_iq", "midfield_iq", "defensive_iq"]:
+                    elif attr in MENTAL_ATTRIBUTES:
                         decline *= 0.5
                     
                     # Apply consistency modifier to decline
-                    if random.random() < consistency:
+                    if rng.random() < consistency:
                         decline *= 0.7  # More consistent players decline slower
                     
                     # Apply the decline
-                    self.attributes[attr] = max(1, self.attributes[attr] - random.uniform(0, decline))
+                    self.attributes[attr] = max(1, self.attributes[attr] - rng.uniform(0, decline))
             
             # Also process goalkeeper attributes if applicable
             if self.position == Position.GK:
                 for attr in self.gk_attributes:
-                    if random.random() < decline_chance:
+                    if rng.random() < decline_chance:
                         decline = base_decline
-                        if random.random() < consistency:
+                        if rng.random() < consistency:
                             decline *= 0.7
-                        self.gk_attributes[attr] = max(1, self.gk_attributes[attr] - random.uniform(0, decline))
+                        self.gk_attributes[attr] = max(1, self.gk_attributes[attr] - rng.uniform(0, decline))
             
             # Very limited improvement chance for focused attribute
             max_improvement = 0.5
@@ -592,14 +853,14 @@ class Player:
         # Improve focused attributes more
         if training_focus:
             # Base improvement
-            improvement = random.uniform(0, max_improvement)
+            improvement = rng.uniform(0, max_improvement)
             
             # Bonus for preferred attributes
             if training_focus in preferred_attributes:
                 improvement *= 1.2
                 
             # Apply consistency modifier
-            if random.random() < consistency:
+            if rng.random() < consistency:
                 improvement = max(0, improvement)
             else:
                 improvement = max(0, improvement * 0.7)
@@ -616,16 +877,16 @@ class Player:
         if self.age < 30:  # Only apply random improvements to players under 30
             # Process regular attributes
             for attr in self.attributes:
-                if attr != training_focus and random.random() < 0.3:  # 30% chance
+                if attr != training_focus and rng.random() < 0.3:  # 30% chance
                     # Base improvement
-                    improvement = random.uniform(0, max_improvement * 0.5)  # Half the focused improvement
+                    improvement = rng.uniform(0, max_improvement * 0.5)  # Half the focused improvement
                     
                     # Bonus for preferred attributes
                     if attr in preferred_attributes:
                         improvement *= 1.2
                         
                     # Apply consistency modifier
-                    if random.random() < consistency:
+                    if rng.random() < consistency:
                         improvement = max(0, improvement)
                     else:
                         improvement = max(0, improvement * 0.7)
@@ -638,11 +899,11 @@ class Player:
             # Process goalkeeper attributes if applicable
             if self.position == Position.GK:
                 for attr in self.gk_attributes:
-                    if attr != training_focus and random.random() < 0.3:  # 30% chance
-                        improvement = random.uniform(0, max_improvement * 0.5)
+                    if attr != training_focus and rng.random() < 0.3:  # 30% chance
+                        improvement = rng.uniform(0, max_improvement * 0.5)
                         if attr in preferred_attributes:
                             improvement *= 1.2
-                        if random.random() < consistency:
+                        if rng.random() < consistency:
                             improvement = max(0, improvement)
                         else:
                             improvement = max(0, improvement * 0.7)
@@ -654,10 +915,11 @@ class Player:
         if self.youth:
             self.matches_scouted += 1
             self.potential_uncertainty = max(5, 15 - (self.matches_scouted // 5))
-            self._generate_scouting_report()
+            self._generate_scouting_report(rng)
 
-    def improve_from_match(self, match_rating):
+    def improve_from_match(self, match_rating, rng=None):
         """Improves attributes based on match performance"""
+        rng = rng or random
         # Calculate improvement chance based on match rating with a more generous curve
         # 6.0 = 10% chance, 7.0 = 30% chance, 8.0 = 60% chance, 9.0 = 90% chance
         improvement_chance = min(0.95, max(0.05, (match_rating - 6.0) / 3.0))
@@ -666,21 +928,9 @@ class Player:
         if match_rating >= 8.5:
             improvement_chance = min(0.95, improvement_chance + 0.2)
         
-        if random.random() < improvement_chance:
-            # Determine which attributes to improve based on position and performance
-            if self.position == Position.GK:
-                focus_attrs = ["diving", "handling", "positioning"]
-            elif self.position in [Position.CB, Position.WB]:
-                focus_attrs = ["tackling", "defensive_iq", "strength", "jumping"]
-            elif self.position in [Position.CDM, Position.CM]:
-                focus_attrs = ["playmaking", "passing", "midfield_iq", "stamina"]
-            elif self.position in [Position.CAM, Position.LW, Position.RW]:
-                focus_attrs = ["dribbling", "passing", "attacking_iq", "speed"]
-            elif self.position == Position.ST:
-                focus_attrs = ["finishing", "attacking_iq", "dribbling_skills"]
-            
-            # Randomly choose a focus attribute
-            training_focus = random.choice(focus_attrs)
+        if rng.random() < improvement_chance:
+            # Randomly choose a focus attribute for the player's position
+            training_focus = rng.choice(MATCH_TRAINING_FOCUS[self.position])
             
             # Calculate improvement amount based on match rating and age
             base_improvement = (match_rating - 6.0) / 2.0  # Base improvement from 0.5 to 2.0
@@ -700,14 +950,15 @@ class Player:
             old_rating = self.overall_rating
             
             # Call improve_attributes with match-based flag and calculated improvement
-            self.improve_attributes(training_focus, is_match_improvement=True, improvement_amount=base_improvement)
+            self.improve_attributes(training_focus, is_match_improvement=True, improvement_amount=base_improvement, rng=rng)
             
             # If this is the first improvement of the season, set the season start rating
             if self.season_start_rating is None:
                 self.season_start_rating = old_rating
 
-    def might_leave_youth_team(self):
+    def might_leave_youth_team(self, rng=None):
         """Checks if a youth player might leave for another team"""
+        rng = rng or random
         if not self.youth:
             return False, None
             
@@ -723,7 +974,7 @@ class Player:
             elif self.overall_rating >= 65:
                 total_chance += 0.1
                 
-            if random.random() < total_chance:
+            if rng.random() < total_chance:
                 reason = f"Age {self.age}, Rating {self.overall_rating:.1f}"
                 return True, reason
                 
@@ -837,23 +1088,8 @@ Scouting Certainty: {100 - (self.potential_uncertainty / 15 * 100):.0f}%
 
     def update_match_rating(self, action_type, success):
         """Updates the player's match rating based on their actions"""
-        # Base impact values for different actions
-        rating_impacts = {
-            "goal": 1.0,
-            "assist": 0.8,
-            "shot_on_target": 0.3,
-            "shot_off_target": -0.1,
-            "successful_pass": 0.1,
-            "failed_pass": -0.1,
-            "successful_tackle": 0.3,
-            "failed_tackle": -0.2,
-            "save": 0.4,  # For goalkeepers
-            "conceded": -0.3,  # For goalkeepers
-            "clean_sheet_minute": 0.01  # Small bonus for each minute of clean sheet (GK and defenders)
-        }
-        
         # Get the impact value
-        impact = rating_impacts.get(action_type, 0)
+        impact = self.rating_impacts.get(action_type, 0)
         if not success:
             impact = -abs(impact)  # Negative impact for failed actions
             
@@ -866,9 +1102,7 @@ Scouting Certainty: {100 - (self.potential_uncertainty / 15 * 100):.0f}%
         final_rating = round(self.current_match_rating, 1)
         
         # Add to match ratings history
-        self.match_ratings.append(final_rating)
-        self.season_ratings.append(final_rating)
-        self.career_ratings.append(final_rating)
+        self.rating_history.add(final_rating)
         
         # Reset current match rating for next match
         self.current_match_rating = 6.0
@@ -877,14 +1111,7 @@ Scouting Certainty: {100 - (self.potential_uncertainty / 15 * 100):.0f}%
 
     def get_average_rating(self, period="season"):
         """Returns the player's average rating for the specified period"""
-        if period == "season" and self.season_ratings:
-            return sum(self.season_ratings) / len(self.season_ratings)
-        elif period == "career" and self.career_ratings:
-            return sum(self.career_ratings) / len(self.career_ratings)
-        elif period == "last5" and self.match_ratings:
-            last_5 = self.match_ratings[-5:] if len(self.match_ratings) >= 5 else self.match_ratings
-            return sum(last_5) / len(last_5)
-        return 6.0  # Default rating if no matches played
+        return self.rating_history.average(period)
 
     def get_stats_display(self, stat_type="match"):
         """Returns a formatted string of player statistics"""
@@ -939,11 +1166,12 @@ Scouting Certainty: {100 - (self.potential_uncertainty / 15 * 100):.0f}%
             return f"{self.name} ({self.age}) - {self.position.value} - {self.personality.value} - Overall: {self.overall_rating:.1f} - Potential: {potential_range}"
         return f"{self.name} ({self.age}) - {self.position.value} - {self.personality.value} - Overall: {self.overall_rating:.1f}"
 
-    def check_retirement(self):
+    def check_retirement(self, rng=None):
         """
         Checks if a player should retire based on age, performance, and other factors.
         Returns (should_retire, reason) tuple.
         """
+        rng = rng or random
         if self.youth or self.retired:
             return False, None
 
@@ -958,7 +1186,7 @@ Scouting Certainty: {100 - (self.potential_uncertainty / 15 * 100):.0f}%
             base_chance = 0.50 + (self.age - 37) * 0.15  # 50% base + 15% per year over 37
 
         # Performance factors
-        if self.season_ratings:
+        if self.rating_history.season_count:
             avg_rating = self.get_average_rating("season")
             if avg_rating < 6.0:
                 base_chance += 0.2  # Poor performance increases retirement chance
@@ -983,19 +1211,19 @@ Scouting Certainty: {100 - (self.potential_uncertainty / 15 * 100):.0f}%
 
         # Rating decline factor
         if self.age >= 33:
-            last_5_ratings = self.match_ratings[-5:] if len(self.match_ratings) >= 5 else self.match_ratings
+            last_5_ratings = list(self.rating_history.recent)
             if len(last_5_ratings) >= 3:
                 if all(a < b for a, b in zip(last_5_ratings[1:], last_5_ratings[:-1])):
                     base_chance += 0.1  # Consistent decline increases retirement chance
 
         # Random factor to add unpredictability
-        base_chance += random.uniform(-0.05, 0.05)
+        base_chance += rng.uniform(-0.05, 0.05)
 
         # Cap the maximum chance
         retirement_chance = min(0.95, max(0, base_chance))
 
         # Check if player retires
-        if random.random() < retirement_chance:
+        if rng.random() < retirement_chance:
             reason = self._get_retirement_reason()
             self.retired = True
             return True, reason
@@ -1015,7 +1243,7 @@ Scouting Certainty: {100 - (self.potential_uncertainty / 15 * 100):.0f}%
             reasons.append("After careful consideration of their future")
 
         # Performance-based reasons
-        if self.season_ratings:
+        if self.rating_history.season_count:
             avg_rating = self.get_average_rating("season")
             if avg_rating < 6.5:
                 reasons.append("struggling to maintain peak performance")
@@ -1088,4 +1316,4 @@ Scouting Certainty: {100 - (self.potential_uncertainty / 15 * 100):.0f}%
             "yellow_cards": 0,
             "red_cards": 0
         }
-        self.season_ratings = [] 
\ No newline at end of file
+        self.rating_history.new_season() 
\ No newline at end of file
@@ -0,0 +1,79 @@
+import numpy as np
+
+
+class PlayerStore:
+    """
+    Structure-of-arrays storage for players: one row per player in contiguous NumPy
+    columns for attributes, age, potential, position and personality codes. Player
+    objects only hold their row, so operations over a whole world can work on the
+    columns at once. Rows of players that no longer exist are reused.
+    """
+
+    def __init__(self, attribute_count, rating_weights, capacity=256):
+        self.size = 0
+        self.capacity = capacity
+        self.free_rows = []  # Released rows, handed out again before the columns grow
+        # Per position code: attribute weights that sum to 1, giving overall rating as a dot product
+        self.rating_weights = np.asarray(rating_weights, dtype=float)
+        self.attributes = np.zeros((capacity, attribute_count))
+        self.age = np.zeros(capacity, dtype=np.int64)
+        self.true_potential = np.zeros(capacity, dtype=np.int64)
+        self.position = np.zeros(capacity, dtype=np.int8)
+        self.personality = np.zeros(capacity, dtype=np.int8)
+        # Bumped whenever a row's attributes or position change, so cached ratings can be checked
+        self.version = np.zeros(capacity, dtype=np.int64)
+
+    def allocate(self):
+        """Returns a fresh zeroed row, growing the columns when full"""
+        if self.free_rows:
+            return self.free_rows.pop()
+        if self.size == self.capacity:
+            self._grow(self.capacity * 2)
+        row = self.size
+        self.size += 1
+        return row
+
+    def _grow(self, capacity):
+        for name in ("attributes", "age", "true_potential", "position", "personality", "version"):
+            column = getattr(self, name)
+            grown = np.zeros((capacity,) + column.shape[1:], dtype=column.dtype)
+            grown[:self.size] = column[:self.size]
+            setattr(self, name, grown)
+        self.capacity = capacity
+
+    def release(self, row):
+        """Zeroes a row whose player is gone and keeps it for the next allocate"""
+        for name in ("attributes", "age", "true_potential", "position", "personality"):
+            getattr(self, name)[row] = 0
+        self.version[row] += 1  # Versions only grow, so nothing cached against the old player matches
+        self.free_rows.append(row)
+
+    def export_row(self, row):
+        """Returns a row's values, e.g. to carry a player into another process's store"""
+        return (self.attributes[row].copy(), int(self.age[row]), int(self.true_potential[row]),
+                int(self.position[row]), int(self.personality[row]))
+
+    def import_row(self, row, values):
+        attributes, self.age[row], self.true_potential[row], self.position[row], self.personality[row] = values
+        self.attributes[row] = attributes
+        self.version[row] += 1
+
+    @staticmethod
+    def rows(players):
+        """Returns the rows of the given players as an index array"""
+        return np.fromiter((player.row for player in players), dtype=np.int64, count=len(players))
+
+    def age_players(self, players, years=1):
+        """Ages every given player at once"""
+        self.age[self.rows(players)] += years
+
+    def overall_ratings(self, players):
+        """Returns the overall rating of every given player, in order"""
+        rows = self.rows(players)
+        weights = self.rating_weights[self.position[rows]]
+        return (self.attributes[rows] * weights).sum(axis=1)
+
+    def older_than(self, players, age):
+        """Returns the given players who are at least age years old"""
+        mask = self.age[self.rows(players)] >= age
+        return [player for player, old in zip(players, mask) if old]
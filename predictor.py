@@ -0,0 +1,142 @@
+import math
+from collections import OrderedDict
+import numpy as np
+from match import Match, read_match_attributes
+from batch_match import BatchMatch
+from seeding import make_rng, seed_sequence
+
+Z_95 = 1.96  # Normal quantile for 95% confidence intervals
+MATCH_MINUTES = 90
+
+
+def lineup_fingerprint(players):
+    """Returns a key that changes whenever anything the match engine reads about a lineup changes"""
+    fingerprint = []
+    for player in players:
+        attributes = list(read_match_attributes(player.attribute_values.tolist()))
+        deltas = Match.youth_boost_deltas(player)
+        if deltas is not None:
+            attributes = [value + delta for value, delta in zip(attributes, deltas)]
+        fingerprint.append((player.position, player.personality, tuple(attributes)))
+    return tuple(fingerprint)
+
+
+def _wilson_interval(successes, samples):
+    """95% Wilson score interval for a proportion"""
+    p = successes / samples
+    denominator = 1 + Z_95 ** 2 / samples
+    centre = (p + Z_95 ** 2 / (2 * samples)) / denominator
+    spread = Z_95 * math.sqrt(p * (1 - p) / samples + Z_95 ** 2 / (4 * samples ** 2)) / denominator
+    return (max(0.0, centre - spread), min(1.0, centre + spread))
+
+
+def _mean_interval(values):
+    """95% normal interval for a sample mean"""
+    mean = float(values.mean())
+    spread = Z_95 * float(values.std()) / math.sqrt(len(values))
+    return (mean - spread, mean + spread)
+
+
+class MatchPredictor:
+    """
+    Predicts fixtures by Monte Carlo with the batch engine, without changing any player.
+    Predictions are cached by the fingerprints of both starting elevens and the action frequency.
+    A prediction simulates at most action_budget match actions, so it stays well under 100 ms
+    at any action frequency: lower frequencies play more actions per match and get fewer samples.
+    """
+
+    def __init__(self, action_frequency=5, tolerance=0.025, chunk_size=500, cache_size=128, seed=0,
+                 action_budget=20000):
+        self.action_frequency = action_frequency
+        self.tolerance = tolerance    # Stop once every outcome's 95% CI half-width is this small
+        self.chunk_size = chunk_size  # Matches simulated between convergence checks
+        self.action_budget = action_budget
+        self.cache_size = cache_size
+        self.seed = seed
+        self.cache = OrderedDict()
+
+    def predict(self, home_team, away_team, n=10000, lineups=None, action_frequency=None):
+        """
+        Returns win/draw/loss probabilities with confidence intervals, expected goals and the
+        goal distribution of each side from at most n simulated matches, fewer where the action
+        budget runs out first (see sample_budget). Without lineups the likely starting elevens
+        are picked from a fixed random stream. action_frequency should match the game being
+        predicted and defaults to the predictor's own.
+        """
+        action_frequency = action_frequency or self.action_frequency
+        if lineups is None:
+            lineups = (home_team.get_starting_eleven(rng=make_rng(self.seed, "predict", home_team.name)),
+                       away_team.get_starting_eleven(rng=make_rng(self.seed, "predict", away_team.name)))
+        key = (lineup_fingerprint(lineups[0]), lineup_fingerprint(lineups[1]), n, action_frequency)
+
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            return self.cache[key]
+
+        prediction = self._simulate(home_team, away_team, lineups, n, action_frequency)
+        self.cache[key] = prediction
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return prediction
+
+    def sample_budget(self, action_frequency, n=10000):
+        """The most matches a prediction simulates at action_frequency: n, capped by the action budget"""
+        actions_per_match = math.ceil(MATCH_MINUTES / action_frequency)
+        return max(1, min(n, self.action_budget // actions_per_match))
+
+    def _simulate(self, home_team, away_team, lineups, n, action_frequency):
+        """Simulates chunks of matches until the outcome probabilities are tight enough"""
+        n = self.sample_budget(action_frequency, n)
+        size = math.ceil(n / math.ceil(n / self.chunk_size))  # Even chunks, so the last isn't mostly discarded
+        batch = BatchMatch([(home_team, away_team)] * size, action_frequency=action_frequency,
+                           lineups=[lineups] * size)
+        scores = []
+        samples = 0
+        chunk = 0
+        while samples < n:
+            # Common random numbers: chunk k draws the same stream for every fixture, so
+            # predictions before and after a squad change differ by the change, not by noise
+            batch.reset(seed_sequence(self.seed, "predict", chunk))
+            scores.append(batch.simulate().scores[:n - samples])
+            samples += len(scores[-1])
+            chunk += 1
+
+            outcomes = self._outcome_counts(np.concatenate(scores))
+            half_widths = [Z_95 * math.sqrt(c / samples * (1 - c / samples) / samples) for c in outcomes]
+            if max(half_widths) <= self.tolerance:
+                break
+
+        return self._summarise(np.concatenate(scores))
+
+    @staticmethod
+    def _outcome_counts(scores):
+        """Returns the number of home wins, draws and away wins"""
+        difference = scores[:, 0] - scores[:, 1]
+        return (int((difference > 0).sum()), int((difference == 0).sum()), int((difference < 0).sum()))
+
+    def _summarise(self, scores):
+        samples = len(scores)
+        home_wins, draws, away_wins = self._outcome_counts(scores)
+        home_goals, away_goals = scores[:, 0], scores[:, 1]
+        return {
+            'home_win': home_wins / samples,
+            'draw': draws / samples,
+            'away_win': away_wins / samples,
+            'intervals': {
+                'home_win': _wilson_interval(home_wins, samples),
+                'draw': _wilson_interval(draws, samples),
+                'away_win': _wilson_interval(away_wins, samples),
+                'expected_goals': (_mean_interval(home_goals), _mean_interval(away_goals))
+            },
+            'expected_goals': (float(home_goals.mean()), float(away_goals.mean())),
+            'goal_distribution': (np.bincount(home_goals) / samples, np.bincount(away_goals) / samples),
+            'samples': samples
+        }
+
+
+default_predictor = MatchPredictor()
+
+
+def predict(home_team, away_team, n=10000, action_frequency=None):
+    """Predicts a fixture with the default predictor (see MatchPredictor.predict)"""
+    return default_predictor.predict(home_team, away_team, n=n, action_frequency=action_frequency)
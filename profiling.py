@@ -0,0 +1,72 @@
+import json
+import time
+
+# Match methods timed by default: action choice, passing, state updates, events and ratings
+PHASES = ("_decide_action", "_attempt_pass", "_calculate_pass_weight", "_update_player_states",
+          "_add_event", "_rate", "event_display")
+
+
+class MatchProfiler:
+    """
+    Counts calls and cumulative perf_counter_ns time of Match hot-path methods across
+    any number of matches. Only matches created with profiler=... are instrumented: the
+    methods are wrapped on that instance alone, so unprofiled matches run unchanged.
+    Times are inclusive, e.g. _attempt_pass includes the _rate and _add_event it calls.
+    """
+
+    def __init__(self, phases=PHASES):
+        self.phases = tuple(phases)
+        self.calls = dict.fromkeys(self.phases, 0)
+        self.total_ns = dict.fromkeys(self.phases, 0)
+        self.matches = 0
+
+    def attach(self, match):
+        """Instruments one match by shadowing its methods with timed wrappers"""
+        self.matches += 1
+        for phase in self.phases:
+            setattr(match, phase, self._timed(phase, getattr(match, phase)))
+
+    def _timed(self, phase, method):
+        calls, total_ns, clock = self.calls, self.total_ns, time.perf_counter_ns
+
+        def timed(*args):
+            start = clock()
+            result = method(*args)
+            total_ns[phase] += clock() - start
+            calls[phase] += 1
+            return result
+        return timed
+
+    def reset(self):
+        for phase in self.phases:
+            self.calls[phase] = 0
+            self.total_ns[phase] = 0
+        self.matches = 0
+
+    def report(self):
+        """Returns the counters as a dict of phase -> calls, total and mean nanoseconds"""
+        return {
+            "matches": self.matches,
+            "phases": {
+                phase: {
+                    "calls": self.calls[phase],
+                    "total_ns": self.total_ns[phase],
+                    "mean_ns": self.total_ns[phase] / self.calls[phase] if self.calls[phase] else 0.0
+                }
+                for phase in self.phases
+            }
+        }
+
+    def to_json(self, indent=2):
+        return json.dumps(self.report(), indent=indent)
+
+    def format_table(self):
+        """Returns the counters as a text table, slowest phase first"""
+        report = self.report()
+        lines = [f"{report['matches']} matches",
+                 f"{'Phase':<24}{'Calls':>12}{'Total ms':>12}{'Mean ns':>10}{'Per match ms':>14}"]
+        matches = max(1, report["matches"])
+        for phase, row in sorted(report["phases"].items(), key=lambda item: -item[1]["total_ns"]):
+            lines.append(f"{phase:<24}{row['calls']:>12}{row['total_ns'] / 1e6:>12.2f}"
+                         f"{row['mean_ns']:>10.0f}{row['total_ns'] / 1e6 / matches:>14.3f}")
+        return "\n".join(lines)
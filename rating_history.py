@@ -0,0 +1,51 @@
+from array import array
+from collections import deque
+
+DEFAULT_RATING = 6.0  # Average reported before any matches are played
+
+
+class RatingHistory:
+    """
+    A player's match ratings: every rating once, in a compact array of doubles, with
+    running totals for the season and the career and a small ring buffer of the most
+    recent ratings. Averages cost the same however long the career gets. The totals
+    are accumulated in match order, so they equal summing the ratings afresh.
+    """
+    __slots__ = ("ratings", "recent", "season_start", "season_total", "career_total")
+
+    def __init__(self, recent_size=5):
+        self.ratings = array("d")
+        self.recent = deque(maxlen=recent_size)
+        self.season_start = 0  # Index in ratings of the season's first match
+        self.season_total = 0.0
+        self.career_total = 0.0
+
+    def add(self, rating):
+        self.ratings.append(rating)
+        self.recent.append(rating)
+        self.season_total += rating
+        self.career_total += rating
+
+    def new_season(self):
+        """Starts counting a new season; career history and recent form carry over"""
+        self.season_start = len(self.ratings)
+        self.season_total = 0.0
+
+    @property
+    def season_count(self):
+        return len(self.ratings) - self.season_start
+
+    @property
+    def season_ratings(self):
+        """The season's ratings as a tuple; add new ones with add"""
+        return tuple(self.ratings[self.season_start:])
+
+    def average(self, period="season"):
+        """Average rating over "season", "career" or "last5" (the recent buffer)"""
+        if period == "season" and self.season_count:
+            return self.season_total / self.season_count
+        elif period == "career" and self.ratings:
+            return self.career_total / len(self.ratings)
+        elif period == "last5" and self.recent:
+            return sum(self.recent) / len(self.recent)
+        return DEFAULT_RATING
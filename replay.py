@@ -0,0 +1,139 @@
+import mmap
+import struct
+import time
+from colorama import Fore, Style
+from player import Position
+from match import MatchEvent, EventCode
+from commentary import CommentaryRenderer
+
+# File layout: header, lineup, then fixed-width event records
+#   header: magic, version, home score, away score, lineup size, event count
+#   text:   length-prefixed UTF-8 (team names, player names)
+#   player: side, position code, then the name as text
+#   event:  minute, event code, player slot, other player slot, team in possession
+MAGIC = b"FMRP"
+VERSION = 1
+HEADER = struct.Struct("<4sBBBBI")
+PLAYER = struct.Struct("<BB")
+EVENT = struct.Struct("<BBBBB")
+TEXT_LENGTH = struct.Struct("<B")
+
+NO_PLAYER = 255  # Slot stored when an event has no other player
+POSITIONS = list(Position)
+POSITION_CODES = {position: code for code, position in enumerate(POSITIONS)}
+SIDE_COLORS = (Fore.BLUE, Fore.RED)
+
+
+def _pack_text(text):
+    """Encodes text with a one byte length prefix, truncating very long names"""
+    data = text.encode("utf-8")[:255]
+    return TEXT_LENGTH.pack(len(data)) + data
+
+
+def _unpack_text(buffer, offset):
+    """Decodes length-prefixed text and returns it with the offset after it"""
+    length, = TEXT_LENGTH.unpack_from(buffer, offset)
+    offset += TEXT_LENGTH.size
+    return bytes(buffer[offset:offset + length]).decode("utf-8", "replace"), offset + length
+
+
+def write_replay(match, path):
+    """Writes a finished match's lineups and event stream to a binary replay file"""
+    lineup = match.home_players + match.away_players
+    slots = {player: slot for slot, player in enumerate(lineup)}
+    home_count = len(match.home_players)
+
+    chunks = [HEADER.pack(MAGIC, VERSION, match.home_score, match.away_score,
+                          len(lineup), len(match.events)),
+              _pack_text(match.home_team.name),
+              _pack_text(match.away_team.name)]
+
+    for slot, player in enumerate(lineup):
+        chunks.append(PLAYER.pack(0 if slot < home_count else 1, POSITION_CODES[player.position]))
+        chunks.append(_pack_text(player.name))
+
+    for event in match.events:
+        other = NO_PLAYER if event.other_player is None else slots[event.other_player]
+        chunks.append(EVENT.pack(event.minute, event.code, slots[event.player], other,
+                                 0 if event.team == match.home_team else 1))
+
+    with open(path, "wb") as f:
+        f.write(b"".join(chunks))
+
+
+class ReplayPlayer:
+    """The parts of a player a replay needs to render commentary"""
+    __slots__ = ("name", "position", "side")
+
+    def __init__(self, name, position, side):
+        self.name = name
+        self.position = position
+        self.side = side
+
+
+class ReplayReader:
+    """Memory-maps a replay file and plays back its events without re-simulating"""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self.buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, self.home_score, self.away_score, lineup_size, self.event_count = \
+            HEADER.unpack_from(self.buffer, 0)
+        if magic != MAGIC or version != VERSION:
+            self.buffer.close()
+            raise ValueError(f"{path} is not a version {VERSION} match replay")
+
+        offset = HEADER.size
+        self.home_name, offset = _unpack_text(self.buffer, offset)
+        self.away_name, offset = _unpack_text(self.buffer, offset)
+        self.team_names = (self.home_name, self.away_name)
+
+        self.lineup = []
+        for _ in range(lineup_size):
+            side, position_code = PLAYER.unpack_from(self.buffer, offset)
+            name, offset = _unpack_text(self.buffer, offset + PLAYER.size)
+            self.lineup.append(ReplayPlayer(name, POSITIONS[position_code], side))
+
+        self.events_offset = offset
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.buffer.close()
+
+    def __len__(self):
+        return self.event_count
+
+    def __getitem__(self, index):
+        """Decodes a single event record straight from the mapped file"""
+        if not 0 <= index < self.event_count:
+            raise IndexError("replay event index out of range")
+        minute, code, slot, other_slot, side = EVENT.unpack_from(
+            self.buffer, self.events_offset + index * EVENT.size)
+        other = None if other_slot == NO_PLAYER else self.lineup[other_slot]
+        return MatchEvent(minute, EventCode(code), self.lineup[slot], other,
+                          self.team_names[side], self.display)
+
+    def __iter__(self):
+        for index in range(self.event_count):
+            yield self[index]
+
+    def display(self, player):
+        """Returns player name with team name and position in team color"""
+        return f"{SIDE_COLORS[player.side]}{player.name} ({player.position.abbreviation}, {self.team_names[player.side]}){Style.RESET_ALL}"
+
+    def render(self, delay=0, renderer=None):
+        """Re-renders the match commentary from the stored events"""
+        renderer = renderer or CommentaryRenderer()
+        print(f"\n{Fore.CYAN}Replay: {SIDE_COLORS[0]}{self.home_name}{Style.RESET_ALL} vs {SIDE_COLORS[1]}{self.away_name}{Style.RESET_ALL}")
+        for event in self:
+            renderer.print_event(event)
+            if delay:
+                time.sleep(delay)
+        print(f"\nFinal Score:")
+        print(f"{self.home_name} {self.home_score} - {self.away_score} {self.away_name}")
@@ -0,0 +1,172 @@
+import math
+import random
+import sys
+import numpy as np
+from player import Position
+from match import Match, ATTR, read_match_attributes
+
+# Fitted by calibrate(1000, action_frequency=5), the game's default setting: intercept,
+# own finishing, own passing, own dribbling against the opposition's tackling, opposition pressure
+DEFAULT_COEFFICIENTS = (-5.1591, 8.635, -3.5129, 2.9333, 2.6062)
+
+
+def _effective_attributes(player):
+    """Returns the attributes the match engine would read for this player, youth boost included"""
+    values = list(read_match_attributes(player.attribute_values.tolist()))
+    deltas = Match.youth_boost_deltas(player)
+    if deltas is not None:
+        values = [value + delta for value, delta in zip(values, deltas)]
+    return values
+
+
+def team_profile(players):
+    """
+    Averages the match engine's per-player chances over a starting eleven:
+    finishing (scoring chance at the player's distance), passing, dribbling,
+    tackling and pressure.
+    """
+    finishing = passing = dribbling = tackling = pressure = 0.0
+    for player in players:
+        a = _effective_attributes(player)
+        distance = Match.position_distances[player.position]
+        finishing += (a[ATTR["finishing"]] * 0.5 + a[ATTR["accuracy"]] * 0.3 +
+                      a[ATTR["attacking_iq"]] * 0.2) / 100.0 * (1 - distance)
+        passing += (a[ATTR["passing"]] * 0.4 + a[ATTR["accuracy"]] * 0.3 +
+                    a[ATTR["playmaking"]] * 0.3) / 100.0
+        dribbling += (a[ATTR["dribbling"]] * 0.4 + a[ATTR["dribbling_skills"]] * 0.4 +
+                      a[ATTR["speed"]] * 0.2) / 100.0
+        tackling += (a[ATTR["tackling"]] * 0.4 + a[ATTR["defensive_iq"]] * 0.3 +
+                     a[ATTR["strength"]] * 0.3) / 100.0
+        player_pressure = (a[ATTR["tackling"]] * 0.3 + a[ATTR["defensive_iq"]] * 0.4 +
+                           a[ATTR["speed"]] * 0.3) / 100.0
+        if player.position in [Position.CB, Position.WB]:
+            player_pressure *= 1.2
+        pressure += min(1.0, player_pressure)
+
+    count = max(1, len(players))
+    return (finishing / count, passing / count, dribbling / count, tackling / count, pressure / count)
+
+
+def _features(attack, defence):
+    """Builds the regression features for one side's goals"""
+    return (1.0, attack[0], attack[1], attack[2] - defence[3], defence[4])
+
+
+def _action_count(action_frequency):
+    """Number of minutes with an action in a 90 minute match"""
+    return 90 // action_frequency
+
+
+def _sample_poisson(expected, rng):
+    """Draws a Poisson count by multiplying uniforms, fast for the small means of a scoreline"""
+    limit = math.exp(-expected)
+    count = 0
+    product = rng.random()
+    while product > limit:
+        count += 1
+        product *= rng.random()
+    return count
+
+
+class ResultModel:
+    """Closed-form scoreline model: each side's goals are Poisson with a rate set by the starting elevens"""
+
+    def __init__(self, coefficients=DEFAULT_COEFFICIENTS):
+        self.coefficients = tuple(coefficients)
+
+    def expected_goals(self, home_players, away_players, action_frequency=1):
+        """Returns the expected goals of both sides for the given starting elevens"""
+        home, away = team_profile(home_players), team_profile(away_players)
+        actions = _action_count(action_frequency)
+        return (self._rate(_features(home, away), actions), self._rate(_features(away, home), actions))
+
+    def _rate(self, features, actions):
+        return actions * math.exp(sum(c * x for c, x in zip(self.coefficients, features)))
+
+    def simulate(self, home_team, away_team, action_frequency=1, rng=None):
+        """Samples a scoreline without simulating events and returns it in the match result format"""
+        rng = rng or random
+        home_players = home_team.get_starting_eleven(rng=rng)
+        away_players = away_team.get_starting_eleven(rng=rng)
+        home_xg, away_xg = self.expected_goals(home_players, away_players, action_frequency)
+        return {
+            'home_team': home_team,
+            'away_team': away_team,
+            'home_score': _sample_poisson(home_xg, rng),
+            'away_score': _sample_poisson(away_xg, rng),
+            'events': [],
+            'player_ratings': {},
+            'expected_goals': (home_xg, away_xg)
+        }
+
+
+default_model = ResultModel()
+
+
+def calibrate(fixtures=400, action_frequency=5, seed=0, iterations=25):
+    """
+    Fits the model to the full Match engine. Simulates fixtures between freshly generated
+    teams of every tier, then fits a Poisson regression of each side's goals on the
+    lineup features by Newton's method. Returns the fitted model and a report comparing
+    the goal distributions of the engine and the model.
+    """
+    from team import Team
+    rng = random.Random(seed)
+
+    rows, goals, offsets = [], [], []
+    for i in range(fixtures):
+        tier = rng.randint(1, 3)
+        youth = rng.random() < 0.2
+        home = Team(f"Calibration Home {i}", tier, is_youth_team=youth, rng=rng)
+        away = Team(f"Calibration Away {i}", rng.randint(1, 3), is_youth_team=youth, rng=rng)
+        match = Match(home, away, commentary_delay=0, action_frequency=action_frequency, silent=True, rng=rng)
+
+        home_profile, away_profile = team_profile(match.home_players), team_profile(match.away_players)
+        for _ in match.iter_events():
+            pass
+
+        rows += [_features(home_profile, away_profile), _features(away_profile, home_profile)]
+        goals += [match.home_score, match.away_score]
+        offsets += [math.log(_action_count(action_frequency))] * 2
+
+    X, y, offset = np.array(rows), np.array(goals, dtype=float), np.array(offsets)
+
+    # Poisson regression with a log link, starting from the overall scoring rate
+    beta = np.zeros(X.shape[1])
+    beta[0] = math.log(max(y.mean(), 1e-6)) - offset.mean()
+    for _ in range(iterations):
+        mu = np.exp(X @ beta + offset)
+        step = np.linalg.solve(X.T @ (X * mu[:, None]), X.T @ (y - mu))
+        beta += step
+        if np.abs(step).max() < 1e-9:
+            break
+
+    model = ResultModel(tuple(float(c) for c in beta))
+    mu = np.exp(X @ beta + offset)
+
+    # Compare goal count distributions: engine frequencies against the model's Poisson mixture
+    max_goals = int(y.max())
+    poisson = np.array([np.exp(-mu) * mu ** k / math.factorial(k) for k in range(max_goals + 1)])
+    report = {
+        "fixtures": fixtures,
+        "action_frequency": action_frequency,
+        "engine_mean": float(y.mean()),
+        "model_mean": float(mu.mean()),
+        "engine_variance": float(y.var()),
+        "model_variance": float(mu.mean() + mu.var()),
+        "engine_distribution": [float((y == k).mean()) for k in range(max_goals + 1)],
+        "model_distribution": [float(p) for p in poisson.mean(axis=1)]
+    }
+    return model, report
+
+
+if __name__ == "__main__":
+    fixtures = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    action_frequency = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    model, report = calibrate(fixtures, action_frequency)
+    print("Coefficients:", tuple(round(c, 4) for c in model.coefficients))
+    print(f"Mean goals:  engine {report['engine_mean']:.3f}  model {report['model_mean']:.3f}")
+    print(f"Variance:    engine {report['engine_variance']:.3f}  model {report['model_variance']:.3f}")
+    print("Goals  Engine  Model")
+    for k, (engine, fitted) in enumerate(zip(report["engine_distribution"], report["model_distribution"])):
+        print(f"{k:>5}  {engine:6.3f}  {fitted:6.3f}")
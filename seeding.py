@@ -0,0 +1,32 @@
+import random
+import zlib
+import numpy as np
+
+
+def stream_key(*parts):
+    """Converts names and numbers into an integer spawn key identifying a random stream"""
+    return tuple(zlib.crc32(part.encode()) if isinstance(part, str) else int(part) for part in parts)
+
+
+def seed_sequence(seed, *key):
+    """Returns the SeedSequence for the stream identified by key under a world seed"""
+    return np.random.SeedSequence(seed, spawn_key=stream_key(*key))
+
+
+def make_rng(seed, *key):
+    """
+    Returns a random.Random for the stream identified by key under a world seed.
+    Without a world seed the global random module is returned, so unseeded games
+    behave exactly as before.
+    """
+    if seed is None:
+        return random
+    state = seed_sequence(seed, *key).generate_state(4)
+    return random.Random(int.from_bytes(state.tobytes(), "little"))
+
+
+def make_generator(seed, *key):
+    """Returns a NumPy Generator for the stream identified by key under a world seed"""
+    if seed is None:
+        return np.random.default_rng()
+    return np.random.default_rng(seed_sequence(seed, *key))
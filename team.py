@@ -1,11 +1,17 @@
-from player import Player, Position
+from player import Player, Position, world_store
+from name_provider import default_names
+from seeding import make_rng
 import random
 
+SQUAD_SIZE = 27
+YOUTH_SQUAD_MAX = 17  # A goalkeeper and up to two players for each of the other eight positions
+
 class Team:
-    def __init__(self, name, tier, is_youth_team=False, game=None):
+    def __init__(self, name, tier, is_youth_team=False, game=None, rng=None, seed=None):
         self.name = name
         self.tier = tier
         self.players = []
+        self.squad_seed = seed  # When given, the squad is generated from this seed on first access
         self.is_youth_team = is_youth_team
         self.game = game  # Reference to the game instance
         self.formation = "4-3-3"  # Default formation
@@ -21,52 +27,104 @@ class Team:
             7: {"ceiling": 80, "average": 71, "floor": 53}
         }
         
-        # Initialize squad
-        if not is_youth_team:
-            self.generate_squad()
+        # Initialize squad, or defer it until the players are first needed
+        if seed is not None:
+            self._players = None
+            # Names are drawn now, in creation order, because unique names depend on what was drawn
+            # before; only the attributes wait until the squad is first used
+            self._squad_names = self.name_provider.generate(YOUTH_SQUAD_MAX if is_youth_team else SQUAD_SIZE,
+                                                            rng=make_rng(seed, "names", name))
+        elif not is_youth_team:
+            self.generate_squad(rng)
         else:
-            self.generate_youth_squad()
+            self.generate_youth_squad(rng)
+
+    @property
+    def players(self):
+        """The squad; a deferred squad is generated here, the same way whenever that happens"""
+        if self._players is None:
+            self._players = []
+            rng = make_rng(self.squad_seed, "squad", self.name)
+            if not self.is_youth_team:
+                self.generate_squad(rng, self._squad_names)
+            else:
+                self.generate_youth_squad(rng, self._squad_names)
+        return self._players
+
+    @players.setter
+    def players(self, players):
+        self._players = players
 
-    def generate_squad(self):
-        """Generates a full squad of players"""
+    @property
+    def squad_generated(self):
+        """Whether the squad exists yet"""
+        return self._players is not None
+
+    def __getstate__(self):
+        """Pickles the team without the game it belongs to, e.g. to send it to a worker process"""
+        self.players  # A deferred squad is generated here, not separately in each process
+        state = self.__dict__.copy()
+        state["game"] = None
+        return state
+
+    @property
+    def name_provider(self):
+        """The game's name provider, so names stay unique within a world"""
+        return self.game.names if self.game is not None else default_names
+
+    def generate_squad(self, rng=None, squad_names=None):
+        """Generates a full squad of players, named from squad_names when given"""
+        squad_names = iter(squad_names if squad_names is not None else self.name_provider.generate(SQUAD_SIZE))
         # Generate goalkeepers
         for _ in range(3):
-            self.players.append(Player(Position.GK, league_tier=self.tier))
+            self.players.append(Player(Position.GK, league_tier=self.tier, rng=rng, name=next(squad_names)))
         
         # Generate defenders
         for _ in range(4):
-            self.players.append(Player(Position.CB, league_tier=self.tier))
+            self.players.append(Player(Position.CB, league_tier=self.tier, rng=rng, name=next(squad_names)))
         for _ in range(4):
-            self.players.append(Player(Position.WB, league_tier=self.tier))
+            self.players.append(Player(Position.WB, league_tier=self.tier, rng=rng, name=next(squad_names)))
             
         # Generate midfielders
         for _ in range(3):
-            self.players.append(Player(Position.CDM, league_tier=self.tier))
+            self.players.append(Player(Position.CDM, league_tier=self.tier, rng=rng, name=next(squad_names)))
         for _ in range(3):
-            self.players.append(Player(Position.CM, league_tier=self.tier))
+            self.players.append(Player(Position.CM, league_tier=self.tier, rng=rng, name=next(squad_names)))
         for _ in range(3):
-            self.players.append(Player(Position.CAM, league_tier=self.tier))
+            self.players.append(Player(Position.CAM, league_tier=self.tier, rng=rng, name=next(squad_names)))
             
         # Generate forwards
         for _ in range(2):
-            self.players.append(Player(Position.LW, league_tier=self.tier))
+            self.players.append(Player(Position.LW, league_tier=self.tier, rng=rng, name=next(squad_names)))
         for _ in range(2):
-            self.players.append(Player(Position.RW, league_tier=self.tier))
+            self.players.append(Player(Position.RW, league_tier=self.tier, rng=rng, name=next(squad_names)))
         for _ in range(3):
-            self.players.append(Player(Position.ST, league_tier=self.tier))
+            self.players.append(Player(Position.ST, league_tier=self.tier, rng=rng, name=next(squad_names)))
+
+    def generate_youth_squad(self, rng=None, squad_names=None):
+        """Generates a smaller youth squad, named from squad_names when given"""
+        rng = rng or random
+        squad_names = iter(squad_names) if squad_names is not None else None
+
+        def next_name():
+            return next(squad_names) if squad_names is not None else self.name_provider.full_name()
 
-    def generate_youth_squad(self):
-        """Generates a smaller youth squad"""
         # Generate 1-2 players for each position
-        self.players.append(Player(Position.GK, youth=True, league_tier=self.tier))
+        self.players.append(Player(Position.GK, youth=True, league_tier=self.tier, rng=rng, name=next_name()))
         
         for position in [Position.CB, Position.WB, Position.CDM, Position.CM, 
                         Position.CAM, Position.LW, Position.RW, Position.ST]:
-            for _ in range(random.randint(1, 2)):
-                self.players.append(Player(position, youth=True, league_tier=self.tier))
+            for _ in range(rng.randint(1, 2)):
+                self.players.append(Player(position, youth=True, league_tier=self.tier, rng=rng, name=next_name()))
+
+        # Hand back reserved names the randomly sized squad did not need
+        if squad_names is not None:
+            for name in squad_names:
+                self.name_provider.release(name)
 
-    def get_starting_eleven(self):
+    def get_starting_eleven(self, rng=None):
         """Returns the best eleven players based on current formation and form"""
+        rng = rng or random
         formation_map = {
             "4-3-3": {
                 Position.GK: 1,
@@ -94,9 +152,14 @@ class Team:
         required_positions = formation_map[self.formation]
         starting_eleven = []
         
+        # Group the squad by position in one pass
+        players_by_position = {}
+        for player in self.players:
+            players_by_position.setdefault(player.position, []).append(player)
+        
         # Sort players by combined rating within their position
         for position, count in required_positions.items():
-            position_players = [p for p in self.players if p.position == position]
+            position_players = list(players_by_position.get(position, []))
             
             # Calculate combined rating (50% overall, 50% average match rating)
             def get_combined_rating(player):
@@ -106,7 +169,9 @@ class Team:
                 match_form_scaled = (match_form - 1) * (99 - 1) / (10 - 1) + 1
                 return (overall + match_form_scaled) / 2
             
-            position_players.sort(key=get_combined_rating, reverse=True)
+            # Each player's combined rating is computed once and reused below
+            combined_ratings = {player: get_combined_rating(player) for player in position_players}
+            position_players.sort(key=combined_ratings.get, reverse=True)
             
             # For each required position
             for _ in range(count):
@@ -115,11 +180,11 @@ class Team:
                     
                 # Get the top rated players for this position
                 top_players = []
-                top_rating = get_combined_rating(position_players[0])
+                top_rating = combined_ratings[position_players[0]]
                 
                 # Consider players within 10 points of the best player
                 for player in position_players:
-                    if top_rating - get_combined_rating(player) <= 10:
+                    if top_rating - combined_ratings[player] <= 10:
                         top_players.append(player)
                     else:
                         break
@@ -127,13 +192,13 @@ class Team:
                 # Give lower rated players a chance based on how close they are to the top
                 weights = []
                 for player in top_players:
-                    rating_diff = top_rating - get_combined_rating(player)
+                    rating_diff = top_rating - combined_ratings[player]
                     # Weight calculation: higher weight for smaller differences
                     weight = 1.0 - (rating_diff / 10)  # 1.0 to 0.5 weight range
                     weights.append(weight)
                 
                 # Select a player using weighted random choice
-                selected_player = random.choices(top_players, weights=weights, k=1)[0]
+                selected_player = rng.choices(top_players, weights=weights, k=1)[0]
                 starting_eleven.append(selected_player)
                 position_players.remove(selected_player)
             
@@ -165,23 +230,26 @@ class Team:
             
         prospects = []
         
-        for player in self.players:
-            # Get average rating of senior players in the same position
-            senior_players = senior_team.get_players_by_position(player.position)
-            
+        # Average rating of the senior players in each position, from the store's columns
+        senior_ratings = {}
+        for player, rating in zip(senior_team.players, world_store.overall_ratings(senior_team.players)):
+            senior_ratings.setdefault(player.position, []).append(rating)
+        
+        for player, overall in zip(self.players, world_store.overall_ratings(self.players)):
             # Calculate player's form rating (last 5 matches)
             form_rating = player.get_average_rating("last5")
             # Convert form rating (1-10 scale) to overall rating scale (1-99)
             form_rating_scaled = (form_rating - 1) * (99 - 1) / (10 - 1) + 1
             
             # Combined rating is 70% overall rating, 30% form rating
-            combined_rating = (player.overall_rating * 0.7) + (form_rating_scaled * 0.3)
+            combined_rating = (overall * 0.7) + (form_rating_scaled * 0.3)
             
-            if not senior_players:
+            if player.position not in senior_ratings:
                 # If no senior players in this position, use a default threshold of 65
                 position_threshold = 65
             else:
-                avg_rating = sum(p.overall_rating for p in senior_players) / len(senior_players)
+                position_ratings = senior_ratings[player.position]
+                avg_rating = sum(position_ratings) / len(position_ratings)
                 position_threshold = avg_rating - 5  # Player should be within 5 points of position average
             
             # Player is eligible if their combined rating meets the threshold